@@ -196,3 +196,33 @@ class TestBuildParser:
 
         with pytest.raises(SystemExit):
             parser.parse_args(["delete-scans", "PROJ", "SUBJ", "SESS"])  # Missing --scan
+
+
+class TestSelectiveRegistration:
+    """Tests for registering only the requested command group."""
+
+    @staticmethod
+    def _choices(parser: argparse.ArgumentParser) -> set[str]:
+        for action in parser._actions:
+            if isinstance(action, argparse._SubParsersAction):
+                return set(action.choices)
+        return set()
+
+    def test_command_map_covers_all_commands(self) -> None:
+        """Every registered subcommand should map to its command group."""
+        from xnatio.commands import _COMMAND_MODULES
+
+        assert self._choices(build_parser()) == set(_COMMAND_MODULES)
+
+    def test_known_command_registers_only_its_group(self) -> None:
+        """A known command should only build its own group's parsers."""
+        parser = build_parser("list-scans")
+        choices = self._choices(parser)
+        assert "list-scans" in choices
+        assert "upload-dicom" not in choices
+        args = parser.parse_args(["list-scans", "PROJ", "SUBJ", "SESS"])
+        assert args.command == "list-scans"
+
+    def test_unknown_command_registers_all(self) -> None:
+        """Unknown or missing commands should fall back to the full parser."""
+        assert self._choices(build_parser("--help")) == self._choices(build_parser())
@@ -199,3 +199,29 @@ class TestLoadConfig:
         assert "verify_tls" in cfg
         assert "http_connect_timeout" in cfg
         assert "http_read_timeout" in cfg
+
+    def test_server_url_components(self, clean_env: None) -> None:
+        """Test that the host is parsed from XNAT_SERVER."""
+        os.environ["XNAT_SERVER"] = "http://xnat.example.com:8080/"
+        os.environ["XNAT_USERNAME"] = "testuser"
+        os.environ["XNAT_PASSWORD"] = "testpass"
+
+        cfg = load_config()
+
+        assert cfg["server_host"] == "xnat.example.com"
+
+    def test_invalid_server_port_raises(self, clean_env: None) -> None:
+        """Test that an invalid port in XNAT_SERVER raises RuntimeError."""
+        os.environ["XNAT_USERNAME"] = "testuser"
+        os.environ["XNAT_PASSWORD"] = "testpass"
+
+        for server in ("https://host:99999", "https://host:abc"):
+            os.environ["XNAT_SERVER"] = server
+            with pytest.raises(RuntimeError, match="XNAT_SERVER"):
+                load_config()
+
+    def test_server_components_without_server(self, clean_env: None) -> None:
+        """Test that URL components are None when no server is configured."""
+        cfg = load_config(require_credentials=False)
+
+        assert cfg["server_host"] is None
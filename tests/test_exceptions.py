@@ -55,6 +55,12 @@ class TestXNATError:
         assert err.details == {"file": "test.zip", "size": 1024}
         assert err.operation == "upload"
 
+    def test_args_hold_plain_message(self):
+        """args[0] should be the raw message; formatting happens in __str__."""
+        err = XNATError("Upload failed", details={"file": "a.zip"}, operation="upload")
+        assert err.args == ("Upload failed",)
+        assert str(err) == "[upload] Upload failed (file=a.zip)"
+
 
 class TestConfigurationErrors:
     """Tests for configuration-related errors."""
@@ -4,7 +4,9 @@ from __future__ import annotations
 
 import json
 import logging
+import queue
 import tempfile
+import time
 from pathlib import Path
 from unittest import mock
 
@@ -17,14 +19,19 @@ from xnatio.core import (
     clear_correlation_id,
     LogContext,
     AuditLogger,
+    BufferedFileHandler,
+    RingBuffer,
     get_audit_logger,
     setup_logging,
+    shutdown_logging,
     get_logger,
     mask_sensitive,
     sanitize_for_log,
     StandardFormatter,
     JSONFormatter,
+    validate_project_id,
 )
+from xnatio.core.logging import ContextFilter, _correlation_id, _queue_listeners
 
 
 class TestCorrelationID:
@@ -65,6 +72,22 @@ class TestCorrelationID:
         cid = get_correlation_id()
         assert cid != "test1234"
 
+    def test_context_filter_does_not_set_correlation_id(self):
+        """ContextFilter should mark records "-" without creating an ID."""
+        clear_correlation_id()
+        record = logging.LogRecord("xnatio.test", logging.INFO, "test.py", 1, "msg", (), None)
+        assert ContextFilter().filter(record)
+        assert record.correlation_id == "-"
+        assert _correlation_id.get() is None
+
+    def test_context_filter_snapshots_operation_context(self):
+        """Records should not see context keys added after they were logged."""
+        record = logging.LogRecord("xnatio.test", logging.INFO, "test.py", 1, "msg", (), None)
+        with LogContext("test_op", mock.Mock(spec=logging.Logger)) as ctx:
+            ContextFilter().filter(record)
+            ctx.add_detail("later", 1)
+        assert record.operation_context == {"operation": "test_op"}
+
 
 class TestLogContext:
     """Tests for LogContext context manager."""
@@ -92,6 +115,41 @@ class TestLogContext:
             ctx.add_detail("files", 100)
             assert ctx.context["files"] == 100
 
+    def test_default_logs_completion_only(self):
+        """By default only a single completion record should be logged."""
+        logger = mock.Mock(spec=logging.Logger)
+        with LogContext("test_op", logger):
+            pass
+        logger.info.assert_called_once()
+        assert logger.info.call_args[0][0] == "Completed %s in %.1fms"
+        assert logger.info.call_args[1]["extra"]["success"] is True
+
+    def test_exit_leaves_context_unchanged(self):
+        """Completion extras should not be written into the context dict."""
+        logger = mock.Mock(spec=logging.Logger)
+        ctx = LogContext("test_op", logger)
+        with ctx:
+            pass
+        assert ctx.context == {"operation": "test_op"}
+        assert logger.info.call_args[1]["extra"]["success"] is True
+
+    def test_log_entry_exit_logs_start_and_completion(self):
+        """log_entry_exit=True should log both start and completion records."""
+        logger = mock.Mock(spec=logging.Logger)
+        with LogContext("test_op", logger, log_entry_exit=True):
+            pass
+        assert [c[0][0] for c in logger.info.call_args_list] == [
+            "Starting %s",
+            "Completed %s in %.1fms",
+        ]
+
+    def test_log_completion_false_is_quiet(self):
+        """log_completion=False should suppress the success record."""
+        logger = mock.Mock(spec=logging.Logger)
+        with LogContext("test_op", logger, log_completion=False):
+            pass
+        logger.info.assert_not_called()
+
     def test_context_with_kwargs(self):
         """Additional kwargs should be stored in context."""
         logger = logging.getLogger("test")
@@ -106,6 +164,7 @@ class TestAuditLogger:
     def test_log_operation_success(self):
         """log_operation should log successful operations."""
         audit = AuditLogger("test.audit")
+        audit.logger.setLevel(logging.INFO)
 
         with mock.patch.object(audit.logger, "log") as mock_log:
             audit.log_operation(
@@ -138,6 +197,45 @@ class TestAuditLogger:
             args, kwargs = mock_log.call_args
             assert args[0] == logging.WARNING  # Failure uses WARNING level
 
+    def test_log_operation_omits_empty_fields(self):
+        """Unset or empty optional fields should not appear in the record."""
+        audit = AuditLogger("test.audit")
+        audit.logger.setLevel(logging.INFO)
+
+        with mock.patch.object(audit.logger, "log") as mock_log:
+            audit.log_operation("create_project", project="PROJ001", user="", duration_ms=0.0)
+            logged_data = json.loads(mock_log.call_args[0][1])
+            assert "user" not in logged_data
+            assert "details" not in logged_data
+            assert "error" not in logged_data
+            assert logged_data["duration_ms"] == 0.0
+
+    def test_log_operation_with_validated_identifiers(self):
+        """Validated identifiers written without encoding should still be valid JSON."""
+        audit = AuditLogger("test.audit")
+        audit.logger.setLevel(logging.INFO)
+
+        with mock.patch.object(audit.logger, "log") as mock_log:
+            audit.log_operation(
+                "upload_dicom",
+                project=validate_project_id("PROJ001"),
+                subject='SUBJ "raw"',
+                success=True,
+            )
+            logged_data = json.loads(mock_log.call_args[0][1])
+            assert logged_data["project"] == "PROJ001"
+            assert logged_data["subject"] == 'SUBJ "raw"'
+
+    def test_log_operation_skipped_when_disabled(self):
+        """log_operation should not serialize records the logger would drop."""
+        audit = AuditLogger("test.audit.disabled")
+        audit.logger.setLevel(logging.ERROR)
+
+        with mock.patch.object(audit.logger, "log") as mock_log:
+            audit.log_operation("create_project", project="PROJ001", success=True)
+            audit.log_operation("delete_scans", project="PROJ001", success=False)
+            mock_log.assert_not_called()
+
     def test_get_audit_logger_singleton(self):
         """get_audit_logger should return same instance."""
         a1 = get_audit_logger()
@@ -187,6 +285,22 @@ class TestFormatters:
         assert data["level"] == "INFO"
         assert data["context"]["project"] == "PROJ1"
 
+    def test_json_formatter_timestamp_from_record(self):
+        """JSONFormatter should timestamp records from record.created in UTC."""
+        formatter = JSONFormatter()
+        record = logging.LogRecord(
+            name="xnatio.test",
+            level=logging.INFO,
+            pathname="test.py",
+            lineno=1,
+            msg="Test message",
+            args=(),
+            exc_info=None,
+        )
+        record.created = 1700000000.25
+        data = json.loads(formatter.format(record))
+        assert data["timestamp"] == "2023-11-14T22:13:20.250Z"
+
 
 class TestSetupLogging:
     """Tests for setup_logging function."""
@@ -206,6 +320,7 @@ class TestSetupLogging:
             setup_logging(level="INFO", json_output=True, log_file=log_file)
             logger = get_logger("test_json")
             logger.info("Test JSON logging")
+            shutdown_logging()
 
             # Verify file was written
             content = Path(log_file).read_text()
@@ -215,6 +330,111 @@ class TestSetupLogging:
             Path(log_file).unlink(missing_ok=True)
 
 
+    def test_shutdown_reports_dropped_records(self):
+        """shutdown_logging should log how many records the ring buffer dropped."""
+        with tempfile.NamedTemporaryFile(mode="w", suffix=".log", delete=False) as f:
+            log_file = f.name
+
+        try:
+            setup_logging(level="INFO", log_file=log_file)
+            for _, _, listener in _queue_listeners:
+                if isinstance(listener.queue, RingBuffer):
+                    listener.queue.dropped = 3
+            shutdown_logging()
+
+            assert "Dropped 3 log records" in Path(log_file).read_text()
+        finally:
+            Path(log_file).unlink(missing_ok=True)
+
+    def test_correlation_id_captured_from_caller(self):
+        """Records should carry the caller's correlation ID, not the listener's."""
+        with tempfile.NamedTemporaryFile(mode="w", suffix=".log", delete=False) as f:
+            log_file = f.name
+
+        try:
+            setup_logging(level="INFO", json_output=True, log_file=log_file)
+            set_correlation_id("caller01")
+            get_logger("test_queue").info("Queued message")
+            shutdown_logging()
+
+            lines = Path(log_file).read_text().splitlines()
+            data = json.loads(lines[-1])
+            assert data["message"] == "Queued message"
+            assert data["correlation_id"] == "caller01"
+        finally:
+            clear_correlation_id()
+            Path(log_file).unlink(missing_ok=True)
+
+
+class TestBufferedFileHandler:
+    """Tests for BufferedFileHandler."""
+
+    def test_writes_records_on_flush(self, tmp_path):
+        """Buffered records should reach the file once flushed."""
+        log_file = tmp_path / "app.log"
+        handler = BufferedFileHandler(str(log_file), flush_interval=60)
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        try:
+            record = logging.LogRecord("xnatio.test", logging.INFO, "test.py", 1, "hello", (), None)
+            handler.handle(record)
+            handler.flush()
+            assert log_file.read_text() == "hello\n"
+        finally:
+            handler.close()
+
+    def test_flushes_after_interval(self, tmp_path):
+        """Records should be flushed by the background thread after the window."""
+        log_file = tmp_path / "app.log"
+        handler = BufferedFileHandler(str(log_file), flush_interval=0.01)
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        try:
+            record = logging.LogRecord("xnatio.test", logging.INFO, "test.py", 1, "tick", (), None)
+            handler.handle(record)
+            deadline = time.monotonic() + 2
+            while log_file.read_text() != "tick\n" and time.monotonic() < deadline:
+                time.sleep(0.01)
+            assert log_file.read_text() == "tick\n"
+        finally:
+            handler.close()
+
+    def test_close_flushes_and_stops_thread(self, tmp_path):
+        """close() should flush pending records and stop the flush thread."""
+        log_file = tmp_path / "app.log"
+        handler = BufferedFileHandler(str(log_file), flush_interval=60)
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        record = logging.LogRecord("xnatio.test", logging.INFO, "test.py", 1, "bye", (), None)
+        handler.handle(record)
+        handler.close()
+        handler._flusher.join(timeout=1)
+        assert not handler._flusher.is_alive()
+        assert log_file.read_text() == "bye\n"
+
+
+class TestRingBuffer:
+    """Tests for RingBuffer."""
+
+    def test_fifo_order(self):
+        """Records should come out in the order they were put."""
+        ring = RingBuffer(4)
+        for i in range(3):
+            ring.put_nowait(i)
+        assert [ring.get(), ring.get(), ring.get()] == [0, 1, 2]
+
+    def test_drops_oldest_when_full(self):
+        """A full buffer should discard the oldest record and count it."""
+        ring = RingBuffer(2)
+        for i in range(5):
+            ring.put_nowait(i)
+        assert len(ring) == 2
+        assert ring.dropped == 3
+        assert [ring.get(), ring.get()] == [3, 4]
+
+    def test_get_nonblocking_empty_raises(self):
+        """Non-blocking get on an empty buffer should raise queue.Empty."""
+        with pytest.raises(queue.Empty):
+            RingBuffer(2).get(block=False)
+
+
 class TestGetLogger:
     """Tests for get_logger function."""
 
@@ -254,6 +474,20 @@ class TestMaskSensitive:
         result = mask_sensitive("")
         assert result == "****"
 
+    def test_zero_visible_chars_hides_everything(self):
+        """visible_chars=0 should not reveal any of the value."""
+        assert mask_sensitive("secret", visible_chars=0) == "******"
+
+    def test_non_ascii_value_masked(self):
+        """Non-ASCII characters outside the visible tail should be masked too."""
+        assert mask_sensitive("pässwörd-ключ") == "*********ключ"
+
+    def test_long_value(self):
+        """Values longer than the precomputed mask should still be masked fully."""
+        value = "x" * 2000 + "tail"
+        result = mask_sensitive(value)
+        assert result == "*" * 2000 + "tail"
+
 
 class TestSanitizeForLog:
     """Tests for sanitize_for_log function."""
@@ -297,3 +531,13 @@ class TestSanitizeForLog:
         data = {"custom_secret": "value123"}
         result = sanitize_for_log(data, sensitive_keys={"custom_secret"})
         assert "value" not in result["custom_secret"]
+
+    def test_empty_sensitive_keys_masks_nothing(self):
+        """An empty sensitive key set should leave every value untouched."""
+        data = {"password": "secret123", "project": "PROJ1"}
+        assert sanitize_for_log(data, sensitive_keys=set()) == data
+
+    def test_matching_is_case_insensitive(self):
+        """Sensitive key fragments should match regardless of case."""
+        result = sanitize_for_log({"X-Auth-Token": "abcdefgh"})
+        assert result["X-Auth-Token"] == "****efgh"
@@ -144,3 +144,42 @@ class TestZipDirToTemp:
                     assert all("empty_subdir" not in n for n in names)
             finally:
                 zip_path.unlink(missing_ok=True)
+
+    def test_stores_precompressed_dicom(self) -> None:
+        """Test that DICOM with compressed pixel data is stored, not deflated."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            test_dir = Path(tmpdir) / "data"
+            test_dir.mkdir()
+            meta = b"\x02\x00\x10\x00UI\x16\x001.2.840.10008.1.2.4.50\x00"
+            (test_dir / "jpeg.dcm").write_bytes(b"\x00" * 128 + b"DICM" + meta + b"x" * 4096)
+            (test_dir / "plain.dcm").write_bytes(b"\x00" * 128 + b"DICM" + b"y" * 4096)
+            (test_dir / "image.jpg").write_bytes(b"z" * 4096)
+
+            zip_path = zip_dir_to_temp(test_dir)
+
+            try:
+                with zipfile.ZipFile(zip_path) as zf:
+                    types = {info.filename: info.compress_type for info in zf.infolist()}
+                    assert types["jpeg.dcm"] == zipfile.ZIP_STORED
+                    assert types["image.jpg"] == zipfile.ZIP_STORED
+                    assert types["plain.dcm"] == zipfile.ZIP_DEFLATED
+                    assert zf.read("jpeg.dcm").endswith(b"x" * 4096)
+                    assert zf.testzip() is None
+            finally:
+                zip_path.unlink(missing_ok=True)
+
+    def test_compress_false_stores_everything(self) -> None:
+        """Test that compress=False stores every entry uncompressed."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            test_dir = Path(tmpdir) / "data"
+            test_dir.mkdir()
+            (test_dir / "plain.dcm").write_bytes(b"\x00" * 128 + b"DICM" + b"y" * 4096)
+
+            zip_path = zip_dir_to_temp(test_dir, compress=False)
+
+            try:
+                with zipfile.ZipFile(zip_path) as zf:
+                    assert zf.getinfo("plain.dcm").compress_type == zipfile.ZIP_STORED
+                    assert zf.read("plain.dcm").endswith(b"y" * 4096)
+            finally:
+                zip_path.unlink(missing_ok=True)
@@ -21,6 +21,7 @@ from xnatio.core import (
     validate_ae_title,
     validate_path_exists,
     validate_path_writable,
+    validate_dicom_directory,
     validate_timeout,
     validate_workers,
     validate_overwrite_mode,
@@ -34,6 +35,7 @@ from xnatio.core import (
     InvalidConfigurationError,
     PathValidationError,
 )
+from xnatio.core.validation import _SanitizedStr
 
 
 class TestValidateServerURL:
@@ -170,11 +172,35 @@ class TestValidateXNATIdentifier:
         with pytest.raises(InvalidIdentifierError):
             validate_xnat_identifier("project with spaces")
 
+    def test_non_ascii_alphanumeric_raises(self):
+        """Unicode letters and digits are alphanumeric but not valid identifiers."""
+        with pytest.raises(InvalidIdentifierError):
+            validate_xnat_identifier("PRÖJ001")
+        with pytest.raises(InvalidIdentifierError):
+            validate_xnat_identifier("SUBJ\u0663")
+
     def test_special_characters_raise(self):
         """Identifier with special characters should raise."""
         with pytest.raises(InvalidIdentifierError):
             validate_xnat_identifier("project@123")
 
+    def test_returns_sanitized_str(self):
+        """Validated identifiers should be marked as SanitizedStr."""
+        result = validate_xnat_identifier("PROJ_001")
+        assert isinstance(result, _SanitizedStr)
+        assert result == "PROJ_001"
+
+    def test_sanitized_str_passes_through(self):
+        """Revalidating a SanitizedStr should return it unchanged."""
+        validated = validate_project_id("PROJ_001")
+        assert validate_subject_id(validated) is validated
+
+    def test_sanitized_str_still_length_checked(self):
+        """A SanitizedStr longer than the caller's limit should still raise."""
+        validated = validate_xnat_identifier("S" * 40)
+        with pytest.raises(InvalidIdentifierError):
+            validate_scan_id(validated)
+
     def test_project_id(self):
         """validate_project_id should work."""
         assert validate_project_id("MY_PROJECT") == "MY_PROJECT"
@@ -266,6 +292,19 @@ class TestValidatePath:
             result = validate_path_writable(Path(d) / "new_file.txt")
             assert str(result).endswith("new_file.txt")
 
+    def test_dicom_directory(self):
+        """validate_dicom_directory should accept a readable directory."""
+        with tempfile.TemporaryDirectory() as d:
+            assert validate_dicom_directory(d) == Path(d).resolve()
+
+    def test_dicom_directory_rejects_file(self):
+        """validate_dicom_directory should reject files and missing paths."""
+        with tempfile.NamedTemporaryFile() as f:
+            with pytest.raises(PathValidationError, match="must be a directory"):
+                validate_dicom_directory(f.name)
+        with pytest.raises(PathValidationError, match="does not exist"):
+            validate_dicom_directory("/nonexistent/dicom/dir")
+
 
 class TestValidateTimeout:
     """Tests for validate_timeout."""
@@ -352,6 +391,20 @@ class TestValidateScanIDsInput:
         result = validate_scan_ids_input("42")
         assert result == ["42"]
 
+    def test_ids_are_sanitized(self):
+        """IDs accepted by the whole-list check should still be SanitizedStr."""
+        result = validate_scan_ids_input("1,2")
+        assert all(isinstance(scan_id, _SanitizedStr) for scan_id in result)
+
+    def test_invalid_id_in_list_raises(self):
+        """A bad ID anywhere in the list should be reported by name."""
+        with pytest.raises(InvalidIdentifierError, match="a b"):
+            validate_scan_ids_input("1,2,a b")
+
+    def test_empty_parts_skipped(self):
+        """Empty entries between commas should be ignored."""
+        assert validate_scan_ids_input("1,,2,") == ["1", "2"]
+
 
 class TestValidateProjectList:
     """Tests for validate_project_list."""
@@ -389,3 +442,12 @@ class TestValidateRegexPattern:
         with pytest.raises(InvalidConfigurationError) as exc_info:
             validate_regex_pattern("[invalid")
         assert "invalid regex" in str(exc_info.value).lower()
+
+    def test_compiled_pattern_passthrough(self):
+        """An already compiled pattern should be returned unchanged."""
+        compiled = re.compile(r"^ABC\d+$")
+        assert validate_regex_pattern(compiled) is compiled
+
+    def test_repeated_pattern_is_cached(self):
+        """Validating the same pattern twice should reuse the compiled object."""
+        assert validate_regex_pattern(r"^(XYZ\d{3})$") is validate_regex_pattern(r"^(XYZ\d{3})$")
@@ -2,13 +2,28 @@
 
 from __future__ import annotations
 
+import json
 import logging
+import threading
+import time
+from pathlib import Path
 from unittest import mock
 
 import pytest
+import requests
+import urllib3
 
 from xnatio.client import XNATClient
 from xnatio.config import XNATConfig
+from xnatio.services import (
+    AdminService,
+    DownloadService,
+    ProjectService,
+    ScanService,
+    UploadService,
+    XNATConnection,
+)
+from xnatio.services.base import _XNATSessionAuth
 
 
 class TestXNATClientFromConfig:
@@ -97,3 +112,587 @@ class TestXNATClientServices:
 
         assert client.connection is not None
         assert hasattr(client.connection, "interface")
+
+    def test_services_share_project_service(self) -> None:
+        """Scans and uploads should reuse the client's existence cache."""
+        with mock.patch("xnatio.services.base.Interface"):
+            client = XNATClient(
+                server="https://xnat.example.com",
+                username="testuser",
+                password="testpass",
+            )
+
+        assert client._scans._projects is client._projects
+        assert client._uploads._projects is client._projects
+
+
+class TestXNATConnectionSession:
+    """Tests for the pooled HTTP session behind XNATConnection."""
+
+    def test_http_methods_skip_interface(self) -> None:
+        """Raw HTTP calls should go through the session without pyxnat."""
+        with mock.patch("xnatio.services.base.Interface") as mock_interface:
+            conn = XNATConnection("https://xnat.example.com", "testuser", "testpass")
+            with mock.patch.object(conn.session, "get") as mock_get:
+                conn.get("/data/projects", params={"format": "json"})
+
+        mock_interface.assert_not_called()
+        mock_get.assert_called_once()
+        assert mock_get.call_args.args[0] == "https://xnat.example.com/data/projects"
+        assert mock_get.call_args.kwargs["timeout"] == conn.http_timeouts
+
+    def test_session_is_pooled_and_authenticated(self) -> None:
+        """The session should carry credentials and a sized connection pool."""
+        conn = XNATConnection(
+            "https://xnat.example.com", "testuser", "testpass", verify_tls=False, pool_maxsize=8
+        )
+        session = conn.session
+
+        assert session is conn.session
+        assert isinstance(session.auth, _XNATSessionAuth)
+        assert session.verify is False
+        assert session.get_adapter("https://xnat.example.com")._pool_maxsize == 8
+
+        conn.close()
+        assert not conn.is_connected
+
+
+class TestXNATSessionAuth:
+    """Tests for cookie-first session authentication."""
+
+    @staticmethod
+    def _prepare(cookie: str = "") -> requests.PreparedRequest:
+        headers = {"Cookie": cookie} if cookie else {}
+        request = requests.Request("GET", "https://xnat.example.com/data/projects", headers=headers)
+        return request.prepare()
+
+    def test_basic_until_session_cookie(self) -> None:
+        """Credentials should only be sent while there is no JSESSIONID."""
+        auth = _XNATSessionAuth("testuser", "testpass")
+
+        assert "Authorization" in auth(self._prepare()).headers
+        assert "Authorization" not in auth(self._prepare("JSESSIONID=abc")).headers
+
+    def test_expired_session_resent_with_basic(self) -> None:
+        """A 401 on a cookie-only request should be retried with credentials."""
+        auth = _XNATSessionAuth("testuser", "testpass")
+        prep = auth(self._prepare("JSESSIONID=expired"))
+        rejected = requests.Response()
+        rejected.status_code = 401
+        rejected._content = b""
+        rejected.request = prep
+        rejected.connection = mock.Mock()
+        retried = requests.Response()
+        rejected.connection.send.return_value = retried
+
+        result = auth._handle_401(rejected)
+
+        assert result is retried
+        assert result.history == [rejected]
+        sent = rejected.connection.send.call_args.args[0]
+        assert "Cookie" not in sent.headers
+        assert sent.headers["Authorization"].startswith("Basic ")
+
+
+class TestXNATConnectionRetry:
+    """Tests for network retry backoff."""
+
+    def test_backoff_is_jittered_and_capped(self) -> None:
+        """Waits should be drawn from [0, min(max_backoff, base**n)]."""
+        conn = XNATConnection("https://xnat.example.com", "testuser", "testpass")
+        fn = mock.Mock(side_effect=[ConnectionResetError(), ConnectionResetError(), "ok"])
+
+        with mock.patch("xnatio.services.base.time.sleep") as mock_sleep:
+            with mock.patch(
+                "xnatio.services.base.random.uniform", return_value=1.5
+            ) as mock_uniform:
+                result = conn.retry_on_network_error(fn, backoff_base=10.0, max_backoff=30.0)
+
+        assert result == "ok"
+        assert mock_uniform.call_args_list == [mock.call(0, 10.0), mock.call(0, 30.0)]
+        assert mock_sleep.call_args_list == [mock.call(1.5), mock.call(1.5)]
+
+
+class TestXNATConnectionExecutor:
+    """Tests for the shared worker pool."""
+
+    def test_map_concurrent_bounds_and_orders(self) -> None:
+        """Results should keep input order with at most max_workers in flight."""
+        conn = XNATConnection("https://xnat.example.com", "testuser", "testpass")
+        lock = threading.Lock()
+        active = [0]
+        peak = [0]
+
+        def _work(n: int) -> int:
+            with lock:
+                active[0] += 1
+                peak[0] = max(peak[0], active[0])
+            time.sleep(0.01)
+            with lock:
+                active[0] -= 1
+            return n * n
+
+        results = conn.map_concurrent(_work, range(10), max_workers=3)
+        executor = conn.executor
+        conn.close()
+
+        assert results == [n * n for n in range(10)]
+        assert peak[0] <= 3
+        assert conn._executor is None
+        assert executor._shutdown
+
+
+class TestProjectSubjectExists:
+    """Tests for subject existence checks."""
+
+    def test_subject_exists_uses_head(self) -> None:
+        """Existence should come from a HEAD status without pyxnat."""
+        with mock.patch("xnatio.services.base.Interface") as mock_interface:
+            conn = XNATConnection("https://xnat.example.com", "testuser", "testpass")
+            projects = ProjectService(conn)
+            with mock.patch.object(conn.session, "head") as mock_head:
+                mock_head.return_value.status_code = 200
+                assert projects.subject_exists("PROJ", "SUBJ_1")
+                mock_head.return_value.status_code = 404
+                assert not projects.subject_exists("PROJ", "SUBJ_2")
+
+        mock_interface.assert_not_called()
+        assert (
+            mock_head.call_args.args[0]
+            == "https://xnat.example.com/data/projects/PROJ/subjects/SUBJ_2"
+        )
+
+    def test_exists_results_are_cached(self) -> None:
+        """Repeated checks should reuse the result until our own delete."""
+        with mock.patch("xnatio.services.base.Interface"):
+            conn = XNATConnection("https://xnat.example.com", "testuser", "testpass")
+            projects = ProjectService(conn)
+            with mock.patch.object(conn.session, "head") as mock_head:
+                mock_head.return_value.status_code = 200
+                assert projects.subject_exists("PROJ", "SUBJ_1")
+                assert projects.ensure_subject("PROJ", "SUBJ_1", auto_create=False)
+                assert mock_head.call_count == 1
+
+                projects.delete_subject("PROJ", "SUBJ_1")
+                assert not projects.subject_exists("PROJ", "SUBJ_1")
+                assert mock_head.call_count == 1
+
+
+class TestAdminCatalogRefresh:
+    """Tests for batched catalog refresh requests."""
+
+    @staticmethod
+    def _admin(count: int) -> tuple[AdminService, mock.Mock]:
+        conn = XNATConnection("https://xnat.example.com", "testuser", "testpass")
+        listing = mock.Mock()
+        rows = [{"ID": f"E{i}", "subject_ID": f"S{i}", "label": f"L{i}"} for i in range(count)]
+        listing.content = json.dumps({"ResultSet": {"Result": rows}}).encode()
+        conn.get = mock.Mock(return_value=listing)  # type: ignore[method-assign]
+        post = mock.Mock()
+        conn.post = post  # type: ignore[method-assign]
+        return AdminService(conn), post
+
+    def test_refresh_batches_resources(self) -> None:
+        """Experiments should be refreshed batch_size at a time."""
+        admin, post = self._admin(5)
+
+        refreshed = admin.refresh_project_experiment_catalogs("PROJ", batch_size=2)
+
+        assert refreshed == ["E0", "E1", "E2", "E3", "E4"]
+        assert post.call_count == 3
+        resources = post.call_args_list[0].kwargs["params"]["resource"]
+        assert resources == [
+            "/archive/projects/PROJ/subjects/S0/experiments/E0",
+            "/archive/projects/PROJ/subjects/S1/experiments/E1",
+        ]
+
+    def test_listing_revalidated_with_etag(self) -> None:
+        """A 304 on the experiment listing should reuse the cached rows."""
+        admin, post = self._admin(2)
+        listing = admin.conn.get.return_value
+        listing.status_code = 200
+        listing.headers = {"ETag": '"v1"'}
+
+        assert admin.refresh_project_experiment_catalogs("PROJ") == ["E0", "E1"]
+
+        listing.status_code = 304
+        listing.content = b"not modified"
+
+        assert admin.refresh_project_experiment_catalogs("PROJ") == ["E0", "E1"]
+        assert admin.conn.get.call_args.kwargs["headers"] == {"If-None-Match": '"v1"'}
+
+    def test_refresh_falls_back_on_rejected_batch(self) -> None:
+        """A batch rejected with 400 should be retried per experiment."""
+        admin, post = self._admin(3)
+        rejected = mock.Mock(status_code=400)
+
+        def _post(path: str, params: dict[str, list[str]]) -> mock.Mock:
+            response = mock.Mock()
+            if len(params["resource"]) > 1:
+                response.raise_for_status.side_effect = requests.exceptions.HTTPError(
+                    response=rejected
+                )
+            return response
+
+        post.side_effect = _post
+
+        refreshed = admin.refresh_project_experiment_catalogs("PROJ")
+
+        assert refreshed == ["E0", "E1", "E2"]
+        assert post.call_count == 4
+
+
+class TestAdminSubjectPatternRename:
+    """Tests for pattern-based subject renames and merges."""
+
+    def test_template_expansion(self) -> None:
+        """Templates should expand {project} and groups, leaving unknown fields."""
+        conn = XNATConnection("https://xnat.example.com", "testuser", "testpass")
+        admin = AdminService(conn)
+        admin._projects = mock.Mock()
+        admin._projects.list_subjects.return_value = [{"label": "sub-7"}, {"label": "other"}]
+
+        result = admin.rename_subjects_pattern(
+            "PROJ", r"sub-(\d)(x)?", "{project}_{1}{2}{3}", dry_run=True
+        )
+
+        assert result["renamed"] == {"sub-7": "PROJ_7{3}"}
+
+    def test_merges_share_one_experiment_listing(self) -> None:
+        """Merges should use one project-wide listing, not one per subject."""
+        conn = XNATConnection("https://xnat.example.com", "testuser", "testpass")
+        admin = AdminService(conn)
+        projects = mock.Mock()
+        projects.list_subjects.return_value = [
+            {"label": "a1"},
+            {"label": "a2"},
+            {"label": "S1"},
+            {"label": "S2"},
+        ]
+        projects.list_project_experiments_detailed.return_value = [
+            {"ID": "E1", "subject_label": "a1"},
+            {"ID": "E2", "subject_label": "a2"},
+        ]
+        admin._projects = projects
+
+        result = admin.rename_subjects_pattern("PROJ", r"a(\d)", "S{1}")
+
+        assert result["merged"] == {"a1": "S1", "a2": "S2"}
+        projects.list_project_experiments_detailed.assert_called_once_with("PROJ")
+        projects.list_subject_experiments.assert_not_called()
+        projects.move_experiment_to_subject.assert_has_calls(
+            [mock.call("PROJ", "E1", "S1"), mock.call("PROJ", "E2", "S2")]
+        )
+
+    def test_rename_onto_merge_source_waits_for_merge(self) -> None:
+        """A rename into a label that is merged away should run after that merge."""
+        conn = XNATConnection("https://xnat.example.com", "testuser", "testpass")
+        admin = AdminService(conn)
+        admin._projects = mock.Mock()
+        admin._projects.list_subjects.return_value = [
+            {"label": "X_old"},
+            {"label": "X_old_old"},
+            {"label": "X"},
+        ]
+        admin._projects.list_project_experiments_detailed.return_value = []
+        calls = []
+        admin._merge_subject = mock.Mock(  # type: ignore[method-assign]
+            side_effect=lambda project, label, target, *args: calls.append(("merge", label))
+        )
+        admin._put_subject_label = mock.Mock(  # type: ignore[method-assign]
+            side_effect=lambda project, label, target: calls.append(("rename", label))
+        )
+
+        result = admin.rename_subjects_pattern("PROJ", r"(.*)_old", "{1}")
+
+        assert calls == [("merge", "X_old"), ("rename", "X_old_old")]
+        assert result["merged"] == {"X_old": "X"}
+        assert result["renamed"] == {"X_old_old": "X_old"}
+
+    def test_rename_updates_shared_exists_cache(self) -> None:
+        """A rename should update the existence cache of the shared project service."""
+        conn = XNATConnection("https://xnat.example.com", "testuser", "testpass")
+        projects = ProjectService(conn)
+        projects._remember_exists(("subject", "PROJ", "old"), True)
+        projects._remember_exists(("session", "PROJ", "old", "SESS_1"), True)
+        admin = AdminService(conn, projects)
+        conn.put = mock.Mock(return_value=mock.Mock(status_code=200))  # type: ignore[method-assign]
+        conn.head = mock.Mock()  # type: ignore[method-assign]
+
+        admin._put_subject_label("PROJ", "old", "new")
+
+        assert not projects.subject_exists("PROJ", "old")
+        assert projects.subject_exists("PROJ", "new")
+        conn.head.assert_not_called()
+        assert ("session", "PROJ", "old", "SESS_1") not in projects._exists_cache
+
+    def test_rename_retry_404_counts_as_done_when_target_exists(self) -> None:
+        """A retried PUT that finds the old label gone should succeed if the new one exists."""
+        conn = XNATConnection("https://xnat.example.com", "testuser", "testpass")
+        admin = AdminService(conn)
+        conn.put = mock.Mock(  # type: ignore[method-assign]
+            side_effect=[requests.exceptions.ConnectionError("reset"), mock.Mock(status_code=404)]
+        )
+        conn.head = mock.Mock(return_value=mock.Mock(status_code=200))  # type: ignore[method-assign]
+
+        with mock.patch("xnatio.services.base.time.sleep"):
+            admin._put_subject_label("PROJ", "old", "new")
+
+        conn.head.assert_called_once_with("/data/projects/PROJ/subjects/new")
+
+
+class TestDownloadStreamResume:
+    """Tests for resuming interrupted download streams."""
+
+    def test_resumes_with_range_request(self, tmp_path: Path) -> None:
+        """A broken stream should continue from the last byte written."""
+        conn = XNATConnection("https://xnat.example.com", "testuser", "testpass")
+        first = mock.Mock(status_code=200, headers={"ETag": '"v1"'})
+        first.raw.read.side_effect = [b"abc", urllib3.exceptions.ProtocolError("reset")]
+        second = mock.Mock(status_code=206, headers={"Content-Range": "bytes 3-5/6"})
+        second.raw.read.side_effect = [b"def", b""]
+        conn.get = mock.Mock(side_effect=[first, second])  # type: ignore[method-assign]
+        out = tmp_path / "scans.zip"
+
+        with mock.patch("xnatio.services.downloads.time.sleep"):
+            DownloadService(conn)._download_stream("/data/x", out)
+
+        assert out.read_bytes() == b"abcdef"
+        assert conn.get.call_args.kwargs["headers"] == {"Range": "bytes=3-", "If-Range": '"v1"'}
+        first.close.assert_called()
+        second.close.assert_called()
+
+    def test_changed_body_restarts_from_zero(self, tmp_path: Path) -> None:
+        """A full response to the If-Range request should replace what was written."""
+        conn = XNATConnection("https://xnat.example.com", "testuser", "testpass")
+        first = mock.Mock(status_code=200, headers={"ETag": '"v1"'})
+        first.raw.read.side_effect = [b"abc", urllib3.exceptions.ProtocolError("reset")]
+        second = mock.Mock(status_code=200, headers={"ETag": '"v2"'})
+        second.raw.read.side_effect = [b"xy", b""]
+        conn.get = mock.Mock(side_effect=[first, second])  # type: ignore[method-assign]
+        out = tmp_path / "scans.zip"
+
+        with mock.patch("xnatio.services.downloads.time.sleep"):
+            DownloadService(conn)._download_stream("/data/x", out)
+
+        assert out.read_bytes() == b"xy"
+
+    def test_unvalidated_body_is_not_resumed(self, tmp_path: Path) -> None:
+        """Without an ETag or Last-Modified, a retry should fetch the whole body."""
+        conn = XNATConnection("https://xnat.example.com", "testuser", "testpass")
+        first = mock.Mock(status_code=200, headers={})
+        first.raw.read.side_effect = [b"abc", urllib3.exceptions.ProtocolError("reset")]
+        second = mock.Mock(status_code=200, headers={})
+        second.raw.read.side_effect = [b"abcdef", b""]
+        conn.get = mock.Mock(side_effect=[first, second])  # type: ignore[method-assign]
+        out = tmp_path / "scans.zip"
+
+        with mock.patch("xnatio.services.downloads.time.sleep"):
+            DownloadService(conn)._download_stream("/data/x", out)
+
+        assert out.read_bytes() == b"abcdef"
+        assert conn.get.call_args.kwargs["headers"] is None
+
+    def test_failed_download_drops_preallocated_tail(self, tmp_path: Path) -> None:
+        """A failed download should keep only the bytes actually received."""
+        conn = XNATConnection("https://xnat.example.com", "testuser", "testpass")
+        first = mock.Mock(status_code=200, headers={"Content-Length": "1000"})
+        first.raw.read.side_effect = [b"abc", urllib3.exceptions.ProtocolError("reset")]
+        conn.get = mock.Mock(  # type: ignore[method-assign]
+            side_effect=[first] + [requests.exceptions.ConnectionError("down")] * 5
+        )
+        out = tmp_path / "scans.zip"
+
+        with mock.patch("xnatio.services.downloads.time.sleep"):
+            with pytest.raises(requests.exceptions.ConnectionError):
+                DownloadService(conn)._download_stream("/data/x", out)
+
+        assert out.read_bytes() == b"abc"
+
+
+class TestListScans:
+    """Tests for scan listing."""
+
+    def test_json_listing_skips_pyxnat(self) -> None:
+        """A JSON listing with numeric IDs should be returned directly."""
+        with mock.patch("xnatio.services.base.Interface") as mock_interface:
+            conn = XNATConnection("https://xnat.example.com", "testuser", "testpass")
+            listing = mock.Mock(status_code=200)
+            listing.content = b'{"ResultSet": {"Result": [{"ID": "1"}, {"ID": "4"}]}}'
+            conn.get = mock.Mock(return_value=listing)  # type: ignore[method-assign]
+
+            ids = ScanService(conn).list_scans("PROJ", "SUBJ_1", "SESS_1")
+
+        assert ids == ["1", "4"]
+        assert conn.get.call_args.kwargs["params"] == {"format": "json", "columns": "ID"}
+        mock_interface.assert_not_called()
+
+
+class TestScanIdCache:
+    """Tests for scan ID allocation in add_scan."""
+
+    def test_add_scan_lists_session_once(self) -> None:
+        """Consecutive add_scan calls should continue from the cached ID."""
+        with mock.patch("xnatio.services.base.Interface") as mock_interface:
+            sess = mock_interface.return_value.select.project.return_value.subject.return_value
+            sess.experiment.return_value.scan.return_value.exists.return_value = False
+            conn = XNATConnection("https://xnat.example.com", "testuser", "testpass")
+            scans = ScanService(conn)
+            scans._projects = mock.Mock()
+            with mock.patch.object(scans, "_list_scans", return_value=["1", "3"]) as listing:
+                ids = [scans.add_scan("PROJ", "SUBJ_1", "SESS_1") for _ in range(3)]
+                scans.invalidate_scan_cache("PROJ", "SUBJ_1", "SESS_1")
+                scans.add_scan("PROJ", "SUBJ_1", "SESS_1")
+
+        assert ids == ["4", "5", "6"]
+        assert listing.call_count == 2
+
+    def test_add_scan_relists_when_reserved_id_exists(self) -> None:
+        """A cached ID taken by another client should trigger a relist, not reuse."""
+        with mock.patch("xnatio.services.base.Interface") as mock_interface:
+            sess = mock_interface.return_value.select.project.return_value.subject.return_value
+            scan = sess.experiment.return_value.scan
+            scan.return_value.exists.side_effect = [False, True, False]
+            conn = XNATConnection("https://xnat.example.com", "testuser", "testpass")
+            scans = ScanService(conn)
+            scans._projects = mock.Mock()
+            with mock.patch.object(
+                scans, "_list_scans", side_effect=[["1"], ["1", "2", "3"]]
+            ) as listing:
+                ids = [scans.add_scan("PROJ", "SUBJ_1", "SESS_1") for _ in range(2)]
+
+        assert ids == ["2", "4"]
+        assert listing.call_count == 2
+        assert scan.return_value.insert.call_count == 2
+
+
+class TestUploadResourceDir:
+    """Tests for directory uploads to a session resource."""
+
+    def test_parallel_upload_counts_results(self, tmp_path: Path) -> None:
+        """Every file should be PUT once and failures counted."""
+        (tmp_path / "sub").mkdir()
+        for name in ("a.txt", "b.txt", "sub/c.txt"):
+            (tmp_path / name).write_text(name)
+        conn = XNATConnection("https://xnat.example.com", "testuser", "testpass")
+
+        def _put(url: str, **kwargs: object) -> mock.Mock:
+            return mock.Mock(status_code=500 if url.endswith("b.txt?inbody=true") else 200)
+
+        conn.put = mock.Mock(side_effect=_put)  # type: ignore[method-assign]
+        uploads = UploadService(conn)
+        uploads._projects = mock.Mock()
+
+        result = uploads.upload_session_resource_dir(
+            project="PROJ",
+            subject="SUBJ_1",
+            session="SESS_1",
+            resource_label="BIDS",
+            local_dir=tmp_path,
+            parallel=True,
+            max_workers=3,
+        )
+
+        assert result == {"uploaded": 2, "failed": 1}
+        assert {call.kwargs["data"] for call in conn.put.call_args_list} == {
+            b"a.txt",
+            b"b.txt",
+            b"sub/c.txt",
+        }
+        urls = sorted(call.args[0] for call in conn.put.call_args_list)
+        assert urls[-1] == (
+            "/data/projects/PROJ/subjects/SUBJ_1/experiments/SESS_1"
+            "/resources/BIDS/files/sub/c.txt?inbody=true"
+        )
+
+
+class TestUploadDicomZip:
+    """Tests for DICOM archive imports."""
+
+    def test_oneshot_posts_once_through_connection(self, tmp_path: Path) -> None:
+        """A one-shot import should skip the subject check and POST via the connection."""
+        archive = tmp_path / "session.zip"
+        archive.write_bytes(b"PK")
+        conn = XNATConnection("https://xnat.example.com", "testuser", "testpass")
+        conn.post = mock.Mock(return_value=mock.Mock(status_code=200))  # type: ignore[method-assign]
+        uploads = UploadService(conn)
+        uploads._projects = mock.Mock()
+
+        uploads.upload_dicom_zip_oneshot(
+            archive, project="PROJ", subject="SUBJ_1", session="SESS_1"
+        )
+
+        uploads._projects.ensure_subject.assert_not_called()
+        conn.post.assert_called_once()
+        assert conn.post.call_args.args == ("/data/services/import",)
+        params = conn.post.call_args.kwargs["params"]
+        assert params["subject"] == "SUBJ_1"
+        assert params["inbody"] == "true"
+
+
+class TestDeleteScans:
+    """Tests for scan deletion."""
+
+    def test_fail_fast_threshold_stops_deleting(self) -> None:
+        """Deletion should stop once failures pass the threshold."""
+        conn = XNATConnection("https://xnat.example.com", "testuser", "testpass")
+        conn.delete = mock.Mock(  # type: ignore[method-assign]
+            return_value=mock.Mock(**{"raise_for_status.side_effect": RuntimeError("locked")})
+        )
+        scans = ScanService(conn)
+        with mock.patch.object(scans, "_list_scans", return_value=["1", "2", "3", "4"]):
+            result = scans.delete_scans("PROJ", "SUBJ_1", "SESS_1", fail_fast_threshold=0.5)
+
+        assert conn.delete.call_count == 3
+        conn.delete.assert_called_with(
+            "/data/projects/PROJ/subjects/SUBJ_1/experiments/SESS_1/scans/3",
+            params={"removeFiles": "true"},
+        )
+        assert result["deleted"] == []
+        assert result["failed"]["4"].startswith("not attempted")
+
+    def test_fail_fast_parallel_counts_in_flight_deletes(self) -> None:
+        """Deletes already running when fail-fast trips should be counted."""
+        conn = XNATConnection("https://xnat.example.com", "testuser", "testpass")
+        in_flight = threading.Barrier(4, timeout=5)
+
+        def delete(path: str, **kwargs: object) -> mock.Mock:
+            in_flight.wait()
+            resp = mock.Mock()
+            if path.endswith("/1"):
+                resp.raise_for_status.side_effect = RuntimeError("locked")
+            else:
+                time.sleep(0.2)  # still running when scan 1's failure arrives
+            return resp
+
+        conn.delete = mock.Mock(side_effect=delete)  # type: ignore[method-assign]
+        scans = ScanService(conn)
+        with mock.patch.object(scans, "_list_scans", return_value=["1", "2", "3", "4"]):
+            with mock.patch.object(scans, "invalidate_scan_cache") as invalidate:
+                result = scans.delete_scans(
+                    "PROJ",
+                    "SUBJ_1",
+                    "SESS_1",
+                    parallel=True,
+                    max_workers=4,
+                    fail_fast_threshold=0.0,
+                )
+        conn.close()
+
+        assert sorted(result["deleted"]) == ["2", "3", "4"]
+        assert list(result["failed"]) == ["1"]
+        invalidate.assert_called_once_with("PROJ", "SUBJ_1", "SESS_1")
+
+    def test_dry_run_with_available_scans_skips_listing(self) -> None:
+        """A supplied scan listing should be used without a server call."""
+        conn = XNATConnection("https://xnat.example.com", "testuser", "testpass")
+        conn.get = mock.Mock()  # type: ignore[method-assign]
+        scans = ScanService(conn)
+
+        result = scans.delete_scans(
+            "PROJ", "SUBJ_1", "SESS_1", ["2", "9"], dry_run=True, available_scans=["1", "2"]
+        )
+
+        assert result["deleted"] == ["2"]
+        assert result["skipped"] == ["9"]
+        conn.get.assert_not_called()
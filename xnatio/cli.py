@@ -2,22 +2,30 @@ from __future__ import annotations
 
 import argparse
 import logging
+import sys
 from typing import Optional
 
 from .commands import register_all
 
 
-def build_parser() -> argparse.ArgumentParser:
-    """Build and return the argument parser for the xnatio CLI."""
+def build_parser(command: Optional[str] = None) -> argparse.ArgumentParser:
+    """Build and return the argument parser for the xnatio CLI.
+
+    Args:
+        command: Optional subcommand name. When it is a known command only
+            that command's group is registered; otherwise all commands are.
+    """
     parser = argparse.ArgumentParser(prog="xnatio", description="XNAT CLI utilities")
     subparsers = parser.add_subparsers(dest="command", required=True)
-    register_all(subparsers)
+    register_all(subparsers, command)
     return parser
 
 
 def run_cli(argv: Optional[list[str]] = None) -> int:
     """Run the xnatio command-line interface."""
-    parser = build_parser()
+    if argv is None:
+        argv = sys.argv[1:]
+    parser = build_parser(argv[0] if argv else None)
     args = parser.parse_args(argv)
 
     verbose = bool(getattr(args, "verbose", False))
@@ -23,8 +23,9 @@ Usage:
 from __future__ import annotations
 
 import logging
+import re
 from pathlib import Path
-from typing import Any, Dict, List, Mapping, Optional, Sequence
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Union
 
 from .config import XNATConfig
 from .core import get_logger
@@ -89,10 +90,11 @@ class XNATClient:
 
         # Initialize services
         self._projects = ProjectService(self._conn)
-        self._scans = ScanService(self._conn)
-        self._uploads = UploadService(self._conn)
+        # Scans, uploads and admin share the project service's existence cache
+        self._scans = ScanService(self._conn, self._projects)
+        self._uploads = UploadService(self._conn, self._projects)
         self._downloads = DownloadService(self._conn)
-        self._admin = AdminService(self._conn)
+        self._admin = AdminService(self._conn, self._projects)
 
     @classmethod
     def from_config(cls, cfg: XNATConfig) -> "XNATClient":
@@ -180,6 +182,10 @@ class XNATClient:
         """List experiments with timing metadata."""
         return self._projects.list_subject_experiments_detailed(project, subject)
 
+    def list_project_experiments_detailed(self, project: str) -> List[Dict[str, str]]:
+        """List all project experiments with timing metadata and subject label."""
+        return self._projects.list_project_experiments_detailed(project)
+
     def move_experiment_to_subject(
         self, project: str, experiment_id: str, new_subject: str
     ) -> None:
@@ -226,6 +232,7 @@ class XNATClient:
         *,
         parallel: bool = False,
         max_workers: int = 2,
+        fail_fast_threshold: Optional[float] = None,
     ) -> List[str]:
         """Delete scans from a session.
 
@@ -238,6 +245,7 @@ class XNATClient:
             scan_ids,
             parallel=parallel,
             max_workers=max_workers,
+            fail_fast_threshold=fail_fast_threshold,
         )
         return result["deleted"]
 
@@ -295,6 +303,8 @@ class XNATClient:
         session: str,
         resource_label: str,
         local_dir: Path,
+        parallel: bool = False,
+        max_workers: int = 8,
     ) -> None:
         """Upload directory to session resource."""
         self._uploads.upload_session_resource_dir(
@@ -303,6 +313,8 @@ class XNATClient:
             session=session,
             resource_label=resource_label,
             local_dir=local_dir,
+            parallel=parallel,
+            max_workers=max_workers,
         )
 
     def upload_session_resource_zip_dir(
@@ -314,6 +326,7 @@ class XNATClient:
         resource_label: str,
         local_dir: Path,
         zip_name: Optional[str] = None,
+        compress: bool = False,
     ) -> None:
         """Zip directory and upload with server-side extraction."""
         self._uploads.upload_session_resource_zip_dir(
@@ -323,6 +336,7 @@ class XNATClient:
             resource_label=resource_label,
             local_dir=local_dir,
             zip_name=zip_name,
+            compress=compress,
         )
 
     def upload_dicom_zip(
@@ -372,10 +386,19 @@ class XNATClient:
         return self._downloads.download_scans_zip(project, subject, session, out_dir)
 
     def download_session_resources_zip(
-        self, project: str, subject: str, session: str, out_dir: Path
+        self,
+        project: str,
+        subject: str,
+        session: str,
+        out_dir: Path,
+        *,
+        parallel: bool = True,
+        max_workers: int = 4,
     ) -> Path:
         """Download session resources as ZIPs."""
-        self._downloads.download_session_resources_zip(project, subject, session, out_dir)
+        self._downloads.download_session_resources_zip(
+            project, subject, session, out_dir, parallel=parallel, max_workers=max_workers
+        )
         return out_dir
 
     def download_assessor_or_recon_resources_zip(
@@ -403,6 +426,7 @@ class XNATClient:
         include_recons: bool = False,
         parallel: bool = True,
         max_workers: int = 4,
+        extract: bool = False,
     ) -> None:
         """Download all session data."""
         self._downloads.download_session(
@@ -414,11 +438,20 @@ class XNATClient:
             include_recons=include_recons,
             parallel=parallel,
             max_workers=max_workers,
+            extract=extract,
         )
 
-    def extract_session_downloads(self, session_dir: Path) -> None:
+    def extract_session_downloads(
+        self,
+        session_dir: Path,
+        *,
+        parallel: bool = True,
+        max_workers: int = 4,
+    ) -> None:
         """Extract downloaded ZIPs."""
-        self._downloads.extract_session_downloads(session_dir)
+        self._downloads.extract_session_downloads(
+            session_dir, parallel=parallel, max_workers=max_workers
+        )
 
     # =========================================================================
     # Admin operations (delegated to AdminService)
@@ -433,6 +466,7 @@ class XNATClient:
         experiment_ids: Optional[Sequence[str]] = None,
         parallel: bool = False,
         max_workers: int = 4,
+        batch_size: int = 20,
     ) -> List[str]:
         """Refresh catalog XMLs for project experiments."""
         return self._admin.refresh_project_experiment_catalogs(
@@ -442,6 +476,7 @@ class XNATClient:
             experiment_ids=experiment_ids,
             parallel=parallel,
             max_workers=max_workers,
+            batch_size=batch_size,
         )
 
     def rename_subjects(self, project: str, mapping: Mapping[str, str]) -> Dict[str, str]:
@@ -455,14 +490,15 @@ class XNATClient:
     def rename_subjects_pattern(
         self,
         project: str,
-        match_pattern: str,
+        match_pattern: Union[str, re.Pattern[str]],
         to_template: str,
         *,
         dry_run: bool = False,
+        subjects: Optional[List[Dict[str, str]]] = None,
     ) -> Dict[str, Any]:
         """Rename subjects matching pattern with merge support."""
         return self._admin.rename_subjects_pattern(
-            project, match_pattern, to_template, dry_run=dry_run
+            project, match_pattern, to_template, dry_run=dry_run, subjects=subjects
         )
 
     def add_user_to_groups(self, username: str, groups: List[str]) -> Dict[str, Any]:
@@ -1,19 +1,39 @@
 from __future__ import annotations
 
 import argparse
+from importlib import import_module
+from typing import Optional
 
-from .admin import register as register_admin
-from .download import register as register_download
-from .maintenance import register as register_maintenance
-from .upload import register as register_upload
+# Command group modules, in the order they appear in --help output.
+_COMMAND_GROUPS = ("upload", "download", "admin", "maintenance")
 
+# Subcommand name -> command group module that registers it.
+_COMMAND_MODULES = {
+    "upload-dicom": "upload",
+    "upload-resource": "upload",
+    "download-session": "download",
+    "extract-session": "download",
+    "create-project": "admin",
+    "delete-scans": "admin",
+    "list-scans": "admin",
+    "rename-subjects": "admin",
+    "rename-subjects-pattern": "admin",
+    "add-user-to-groups": "admin",
+    "refresh-catalogs": "maintenance",
+    "apply-label-fixes": "maintenance",
+}
 
-def register_all(subparsers: argparse._SubParsersAction) -> None:
-    """Register all CLI command groups."""
-    register_upload(subparsers)
-    register_download(subparsers)
-    register_admin(subparsers)
-    register_maintenance(subparsers)
+
+def register_all(subparsers: argparse._SubParsersAction, command: Optional[str] = None) -> None:
+    """Register CLI command groups.
+
+    When ``command`` names a known subcommand, only the group that owns it is
+    imported and registered so a single invocation does not build every
+    sibling parser. Otherwise all groups are registered (e.g. for --help).
+    """
+    group = _COMMAND_MODULES.get(command) if command else None
+    for name in (group,) if group else _COMMAND_GROUPS:
+        import_module(f".{name}", __name__).register(subparsers)
 
 
 __all__ = ["register_all"]
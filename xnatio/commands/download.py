@@ -56,15 +56,15 @@ def register(subparsers: argparse._SubParsersAction) -> None:
             output_dir=out_dir,
             include_assessors=args.include_assessors,
             include_recons=args.include_recons,
+            extract=args.unzip,
         )
         if args.unzip:
             session_dir = out_dir / args.session
-            downloads.extract_session_downloads(session_dir)
             for zip_path in session_dir.glob("*.zip"):
                 try:
                     zip_path.unlink()
                 except Exception:
-                    logging.getLogger(__name__).warning(f"Failed to remove {zip_path}")
+                    logging.getLogger(__name__).warning("Failed to remove %s", zip_path)
         return 0
 
     dl.set_defaults(func=handle_download_session)
@@ -98,10 +98,10 @@ def register(subparsers: argparse._SubParsersAction) -> None:
                 target_dir = session_dir / zip_path.stem
 
             target_dir.mkdir(parents=True, exist_ok=True)
-            logging.getLogger(__name__).info(f"Extracting {name} -> {target_dir}")
+            logging.getLogger(__name__).info("Extracting %s -> %s", name, target_dir)
             with zipfile.ZipFile(zip_path) as zf:
                 zf.extractall(target_dir)
-            logging.getLogger(__name__).info(f"Extracted {name}")
+            logging.getLogger(__name__).info("Extracted %s", name)
         return 0
 
     ex.set_defaults(func=handle_extract_session)
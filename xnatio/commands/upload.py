@@ -3,7 +3,6 @@ from __future__ import annotations
 import argparse
 import logging
 from pathlib import Path
-from urllib.parse import urlparse
 
 from ..config import load_config
 from ..core import is_allowed_archive
@@ -90,6 +89,11 @@ def register(subparsers: argparse._SubParsersAction) -> None:
         action="store_false",
         help="Disable Direct-Archive mode",
     )
+    rest_opts.add_argument(
+        "--stream-archives",
+        action="store_true",
+        help="Stream batch archives straight into the upload instead of staging them on disk",
+    )
     rest_opts.add_argument(
         "--ignore-unparsable",
         dest="ignore_unparsable",
@@ -129,6 +133,12 @@ def register(subparsers: argparse._SubParsersAction) -> None:
         default=DEFAULT_DICOM_STORE_BATCHES,
         help="Number of parallel C-STORE batches (default: %(default)s)",
     )
+    dicom_opts.add_argument(
+        "--dicom-max-associations",
+        type=int,
+        default=None,
+        help="Maximum concurrent C-STORE associations (default: one per CPU)",
+    )
     dicom_opts.add_argument(
         "--dicom-cleanup",
         action="store_true",
@@ -150,12 +160,12 @@ def register(subparsers: argparse._SubParsersAction) -> None:
                 parser.error("dicom-store transport requires a directory input")
 
             host = args.dicom_host or cfg.get("dicom_host")
-            if not host and cfg.get("server"):
-                host = urlparse(str(cfg["server"])).hostname
+            if not host:
+                host = cfg.get("server_host")
                 if host:
                     log.info("Using DICOM host derived from XNAT_SERVER: %s", host)
 
-            port = args.dicom_port or cfg.get("dicom_port")
+            port = args.dicom_port if args.dicom_port is not None else cfg.get("dicom_port")
             called_aet = args.dicom_called_aet or cfg.get("dicom_called_aet")
             calling_aet = (
                 args.dicom_calling_aet or cfg.get("dicom_calling_aet") or DEFAULT_DICOM_CALLING_AET
@@ -163,8 +173,10 @@ def register(subparsers: argparse._SubParsersAction) -> None:
 
             if not host:
                 parser.error("Missing DICOM host (use --dicom-host or XNAT_DICOM_HOST)")
-            if not port:
+            if port is None:
                 parser.error("Missing DICOM port (use --dicom-port or XNAT_DICOM_PORT)")
+            elif not 0 < port < 65536:
+                parser.error(f"Invalid DICOM port: {port}")
             if not called_aet:
                 parser.error(
                     "Missing DICOM called AET (use --dicom-called-aet or XNAT_DICOM_CALLED_AET)"
@@ -174,10 +186,11 @@ def register(subparsers: argparse._SubParsersAction) -> None:
                 summary = send_dicom_store(
                     dicom_root=inp,
                     host=str(host),
-                    port=int(port),
+                    port=port,
                     called_aet=str(called_aet),
                     calling_aet=str(calling_aet),
                     batches=args.dicom_batches,
+                    max_associations=args.dicom_max_associations,
                     cleanup=args.dicom_cleanup,
                     logger=log,
                 )
@@ -224,6 +237,7 @@ def register(subparsers: argparse._SubParsersAction) -> None:
                 ignore_unparsable=args.ignore_unparsable,
                 overwrite=args.overwrite,
                 direct_archive=args.direct_archive,
+                stream_archives=args.stream_archives,
                 progress_callback=progress_logger,
                 logger=log,
             )
@@ -248,9 +262,7 @@ def register(subparsers: argparse._SubParsersAction) -> None:
                     "Unsupported archive type. Accepted: .zip, .tar, .tar.gz, .tgz "
                     "(or pass a directory)"
                 )
-            conn = XNATConnection.from_config(cfg)
-            uploads = UploadService(conn)
-            uploads.upload_dicom_zip(
+            UploadService(XNATConnection.from_config(cfg)).upload_dicom_zip_oneshot(
                 inp,
                 project=args.project,
                 subject=args.subject,
@@ -283,6 +295,11 @@ def register(subparsers: argparse._SubParsersAction) -> None:
         default=None,
         help="Optional zip filename to use on server (defaults to <resource>.zip)",
     )
+    upload_resource.add_argument(
+        "--compress",
+        action="store_true",
+        help="Deflate files in the directory ZIP (smaller upload, slower to build)",
+    )
     upload_resource.add_argument(
         "--env",
         dest="env_file",
@@ -312,6 +329,7 @@ def register(subparsers: argparse._SubParsersAction) -> None:
                 resource_label=args.resource,
                 local_dir=p,
                 zip_name=args.zip_name,
+                compress=args.compress,
             )
         else:
             uploads.upload_session_resource_file(
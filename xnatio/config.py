@@ -3,6 +3,7 @@ from __future__ import annotations
 import os
 from pathlib import Path
 from typing import Optional, TypedDict
+from urllib.parse import urlparse
 
 from dotenv import load_dotenv
 
@@ -12,6 +13,7 @@ class XNATConfig(TypedDict):
 
     Attributes:
         server: Base URL of the XNAT server (e.g., https://xnat.example.org)
+        server_host: Hostname parsed from ``server`` (None if unset)
         user: XNAT username for authentication
         password: XNAT password for authentication
         verify_tls: Whether to verify TLS certificates (default True)
@@ -24,6 +26,7 @@ class XNATConfig(TypedDict):
     """
 
     server: str
+    server_host: Optional[str]
     user: str
     password: str
     verify_tls: bool
@@ -35,13 +38,17 @@ class XNATConfig(TypedDict):
     dicom_calling_aet: Optional[str]
 
 
+_TRUE_VALUES = frozenset({"1", "true", "yes", "y", "on"})
+_FALSE_VALUES = frozenset({"0", "false", "no", "n", "off"})
+
+
 def _str_to_bool(value: Optional[str], default: bool = True) -> bool:
     if value is None:
         return default
     value_norm = value.strip().lower()
-    if value_norm in {"1", "true", "yes", "y", "on"}:
+    if value_norm in _TRUE_VALUES:
         return True
-    if value_norm in {"0", "false", "no", "n", "off"}:
+    if value_norm in _FALSE_VALUES:
         return False
     return default
 
@@ -90,7 +97,7 @@ def load_config(env_path: Optional[Path] = None, *, require_credentials: bool =
 
     Raises:
         FileNotFoundError: If explicit env_path is provided but does not exist.
-        RuntimeError: If required environment variables are missing.
+        RuntimeError: If required environment variables are missing or invalid.
     """
     if env_path:
         p = Path(env_path).expanduser()
@@ -132,8 +139,17 @@ def load_config(env_path: Optional[Path] = None, *, require_credentials: bool =
         except ValueError as exc:
             raise RuntimeError("XNAT_DICOM_PORT must be an integer") from exc
 
+    parsed = urlparse(server or "")
+    try:
+        # Reading the port validates it, so a bad one fails here rather than
+        # as a ValueError on first use
+        parsed.port
+    except ValueError as exc:
+        raise RuntimeError(f"XNAT_SERVER has an invalid port: {server}") from exc
+
     return XNATConfig(
         server=server or "",
+        server_host=parsed.hostname,
         user=user or "",
         password=password or "",
         verify_tls=verify_tls,
@@ -45,8 +45,10 @@ from .exceptions import (
 )
 from .logging import (
     AuditLogger,
+    BufferedFileHandler,
     JSONFormatter,
     LogContext,
+    RingBuffer,
     StandardFormatter,
     clear_correlation_id,
     generate_correlation_id,
@@ -58,6 +60,7 @@ from .logging import (
     sanitize_for_log,
     set_correlation_id,
     setup_logging,
+    shutdown_logging,
 )
 from .utils import (
     is_allowed_archive,
@@ -124,6 +127,7 @@ __all__ = [
     "DicomStoreError",
     # Logging
     "setup_logging",
+    "shutdown_logging",
     "get_logger",
     "get_audit_logger",
     "LogContext",
@@ -137,6 +141,8 @@ __all__ = [
     "AuditLogger",
     "StandardFormatter",
     "JSONFormatter",
+    "BufferedFileHandler",
+    "RingBuffer",
     # Validation
     "validate_server_url",
     "validate_url_or_none",
@@ -31,7 +31,14 @@ class XNATError(Exception):
         self.message = message
         self.details = details or {}
         self.operation = operation
-        super().__init__(self._format_message())
+        self._formatted: Optional[str] = None
+        # Keep args cheap; the full message is only built when the error is rendered.
+        super().__init__(message)
+
+    def __str__(self) -> str:
+        if self._formatted is None:
+            self._formatted = self._format_message()
+        return self._formatted
 
     def _format_message(self) -> str:
         parts = [self.message]
@@ -23,14 +23,38 @@ Usage:
 
 from __future__ import annotations
 
+import atexit
+import collections
 import contextvars
 import json
 import logging
+import os
+import queue
+import re
 import sys
-import uuid
+import threading
+import time
 from contextlib import contextmanager
-from datetime import datetime, timezone
-from typing import Any, Generator, Optional, Union
+from datetime import datetime
+from functools import lru_cache
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, Generator, List, Optional, Tuple, Union
+
+from .validation import _SanitizedStr
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None  # type: ignore[assignment]
+
+# Default capacity of the ring buffer between loggers and the listener thread
+DEFAULT_LOG_RING_SIZE = 65536
+
+# Entropy source for correlation IDs
+_urandom = os.urandom
+
+# Clock for operation durations; unaffected by wall-clock adjustments
+_monotonic = time.monotonic
 
 # Context variable for correlation ID - thread-safe
 _correlation_id: contextvars.ContextVar[Optional[str]] = contextvars.ContextVar(
@@ -64,7 +88,7 @@ def set_correlation_id(cid: str) -> None:
 
 def generate_correlation_id() -> str:
     """Generate a new correlation ID."""
-    return str(uuid.uuid4())[:8]
+    return _urandom(4).hex()
 
 
 def clear_correlation_id() -> None:
@@ -72,17 +96,58 @@ def clear_correlation_id() -> None:
     _correlation_id.set(None)
 
 
+# =============================================================================
+# JSON Serialization
+# =============================================================================
+
+
+def _json_default(obj: Any) -> Any:
+    """Fallback serializer for values the JSON encoder does not handle."""
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    return str(obj)
+
+
+def _format_utc_timestamp(created: float) -> str:
+    """Format an epoch timestamp as ISO 8601 UTC with millisecond precision."""
+    millis = int((created - int(created)) * 1000)
+    return "%s.%03dZ" % (time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(created)), millis)
+
+
+def _json_dumps(data: dict[str, Any]) -> str:
+    """Serialize a log payload, using orjson when it is installed."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(
+                data,
+                default=str,
+                option=orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS,
+            ).decode()
+        except TypeError:
+            # e.g. integers wider than 64 bits; let the stdlib handle them
+            pass
+    return json.dumps(data, default=_json_default)
+
+
 # =============================================================================
 # Custom Log Record
 # =============================================================================
 
 
 class ContextFilter(logging.Filter):
-    """Filter that adds context information to log records."""
+    """Filter that adds context information to log records.
+
+    Records logged outside any correlation scope get ``"-"`` as their
+    correlation ID; the filter never creates or sets one itself.
+    """
 
     def filter(self, record: logging.LogRecord) -> bool:
-        record.correlation_id = get_correlation_id()  # type: ignore[attr-defined]
-        record.operation_context = _operation_context.get()  # type: ignore[attr-defined]
+        cid = _correlation_id.get()
+        record.correlation_id = "-" if cid is None else cid  # type: ignore[attr-defined]
+        # Snapshot: queued records are formatted later, after the live
+        # context may have gained keys
+        ctx = _operation_context.get()
+        record.operation_context = dict(ctx) if ctx else {}  # type: ignore[attr-defined]
         return True
 
 
@@ -105,12 +170,43 @@ class StandardFormatter(logging.Formatter):
         return super().format(record)
 
 
+# LogRecord attributes that JSONFormatter does not repeat under "extra"
+_STANDARD_LOGRECORD_ATTRS = frozenset(
+    {
+        "name",
+        "msg",
+        "args",
+        "created",
+        "filename",
+        "funcName",
+        "levelname",
+        "levelno",
+        "lineno",
+        "module",
+        "msecs",
+        "pathname",
+        "process",
+        "processName",
+        "relativeCreated",
+        "stack_info",
+        "exc_info",
+        "exc_text",
+        "thread",
+        "threadName",
+        "message",
+        "correlation_id",
+        "operation_context",
+        "taskName",
+    }
+)
+
+
 class JSONFormatter(logging.Formatter):
     """JSON formatter for structured logging."""
 
     def format(self, record: logging.LogRecord) -> str:
         log_data = {
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": _format_utc_timestamp(record.created),
             "level": record.levelname,
             "logger": record.name,
             "message": record.getMessage(),
@@ -127,37 +223,137 @@ class JSONFormatter(logging.Formatter):
             log_data["exception"] = self.formatException(record.exc_info)
 
         # Add extra fields (excluding standard LogRecord attributes)
-        standard_attrs = {
-            "name",
-            "msg",
-            "args",
-            "created",
-            "filename",
-            "funcName",
-            "levelname",
-            "levelno",
-            "lineno",
-            "module",
-            "msecs",
-            "pathname",
-            "process",
-            "processName",
-            "relativeCreated",
-            "stack_info",
-            "exc_info",
-            "exc_text",
-            "thread",
-            "threadName",
-            "message",
-            "correlation_id",
-            "operation_context",
-            "taskName",
-        }
-        extra = {k: v for k, v in record.__dict__.items() if k not in standard_attrs}
+        extra = {k: v for k, v in record.__dict__.items() if k not in _STANDARD_LOGRECORD_ATTRS}
         if extra:
             log_data["extra"] = extra
 
-        return json.dumps(log_data, default=str)
+        return _json_dumps(log_data)
+
+
+# =============================================================================
+# Handlers
+# =============================================================================
+
+
+class BufferedFileHandler(logging.FileHandler):
+    """File handler that batches writes instead of flushing every record.
+
+    Records are written into a ``buffer_size`` byte buffer. The first record
+    after a flush opens a ``flush_interval`` second window, at the end of
+    which a daemon thread flushes everything written so far; the thread sleeps
+    while no records arrive. The buffer is also flushed on close, which
+    :mod:`logging` does at interpreter exit.
+    """
+
+    def __init__(
+        self,
+        filename: str,
+        mode: str = "a",
+        encoding: Optional[str] = None,
+        *,
+        buffer_size: int = 65536,
+        flush_interval: float = 0.1,
+    ) -> None:
+        self.buffer_size = buffer_size
+        self.flush_interval = flush_interval
+        self._pending = threading.Event()
+        self._stop_flusher = threading.Event()
+        super().__init__(filename, mode, encoding)
+        self._flusher = threading.Thread(
+            target=self._flush_periodically,
+            name="xnatio-log-flush",
+            daemon=True,
+        )
+        self._flusher.start()
+
+    def _open(self) -> Any:
+        return open(
+            self.baseFilename,
+            self.mode,
+            buffering=self.buffer_size,
+            encoding=self.encoding,
+            errors=self.errors,
+        )
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            if self.stream is None:
+                self.stream = self._open()
+            self.stream.write(self.format(record) + self.terminator)
+            self._pending.set()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+    def _flush_periodically(self) -> None:
+        while True:
+            self._pending.wait()
+            if self._stop_flusher.wait(self.flush_interval):
+                return
+            self._pending.clear()
+            self.flush()
+
+    def close(self) -> None:
+        self._stop_flusher.set()
+        self._pending.set()
+        super().close()
+
+
+class RingBuffer:
+    """Bounded record queue that drops the oldest records when full.
+
+    Implements the ``put_nowait``/``get`` subset of :class:`queue.Queue` used
+    by :class:`~logging.handlers.QueueHandler` and
+    :class:`~logging.handlers.QueueListener`. Appends and pops are single
+    ``deque`` operations, so no lock is taken while records are flowing; the
+    event is only waited on when the buffer runs empty.
+    """
+
+    def __init__(self, maxlen: int = DEFAULT_LOG_RING_SIZE) -> None:
+        self.maxlen = maxlen
+        self.dropped = 0
+        self._records: collections.deque[Any] = collections.deque(maxlen=maxlen)
+        self._ready = threading.Event()
+        # Only taken on the overflow path, where producers race on dropped
+        self._dropped_lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def put_nowait(self, record: Any) -> None:
+        if len(self._records) == self.maxlen:
+            with self._dropped_lock:
+                self.dropped += 1
+        self._records.append(record)
+        self._ready.set()
+
+    def get(self, block: bool = True) -> Any:
+        while True:
+            try:
+                return self._records.popleft()
+            except IndexError:
+                if not block:
+                    raise queue.Empty from None
+            self._ready.clear()
+            # A record may have arrived between popleft() and clear()
+            if not self._records:
+                self._ready.wait()
+
+
+class _RecordQueueHandler(QueueHandler):
+    """QueueHandler for an in-process listener.
+
+    The stock ``prepare`` formats the record and strips ``exc_info`` so it can
+    be pickled; records here never leave the process, so only the message
+    arguments are merged (they may be mutated before the listener runs) and
+    formatting is left to the listener's handlers.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record.msg = record.getMessage()
+        record.args = None
+        return record
 
 
 # =============================================================================
@@ -165,6 +361,13 @@ class JSONFormatter(logging.Formatter):
 # =============================================================================
 
 
+# Preserialized opening of every audit record, keyed by the success flag
+_AUDIT_PREFIX = {
+    True: '{"audit":true,"success":true,',
+    False: '{"audit":true,"success":false,',
+}
+
+
 class AuditLogger:
     """Specialized logger for audit trail of operations.
 
@@ -202,32 +405,41 @@ class AuditLogger:
         error: Optional[str] = None,
         duration_ms: Optional[float] = None,
     ) -> None:
-        """Log an auditable operation."""
+        """Log an auditable operation.
+
+        The record is only built and serialized when the audit logger is
+        enabled for the resulting level (INFO on success, WARNING on failure).
+        """
+        level = logging.INFO if success else logging.WARNING
+        if not self.logger.isEnabledFor(level):
+            return
+
+        # The constant "audit"/"success" members come from a preserialized
+        # prefix, and validated identifiers contain nothing that needs JSON
+        # escaping, so both are written directly; only the remaining fields
+        # go through the JSON encoder.
+        head = _AUDIT_PREFIX[success]
+        identifiers: dict[str, Optional[str]] = {}
+        for key, value in (("project", project), ("subject", subject), ("session", session)):
+            if value and type(value) is _SanitizedStr:
+                head += f'"{key}":"{value}",'
+            else:
+                identifiers[key] = value or None
+
+        # Empty optional fields are mapped to None and dropped in one pass
         audit_record = {
-            "audit": True,
             "operation": operation,
-            "success": success,
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": _format_utc_timestamp(time.time()),
             "correlation_id": get_correlation_id(),
+            "user": user or None,
+            **identifiers,
+            "details": details or None,
+            "error": error or None,
+            "duration_ms": None if duration_ms is None else round(duration_ms, 2),
         }
+        audit_record = {k: v for k, v in audit_record.items() if v is not None}
 
-        if user:
-            audit_record["user"] = user
-        if project:
-            audit_record["project"] = project
-        if subject:
-            audit_record["subject"] = subject
-        if session:
-            audit_record["session"] = session
-        if details:
-            audit_record["details"] = details
-        if error:
-            audit_record["error"] = error
-        if duration_ms is not None:
-            audit_record["duration_ms"] = round(duration_ms, 2)
-
-        level = logging.INFO if success else logging.WARNING
-        self.logger.log(level, json.dumps(audit_record, default=str))
+        self.logger.log(level, head + _json_dumps(audit_record)[1:])
 
 
 # Global audit logger instance
@@ -253,9 +465,12 @@ class LogContext:
     Automatically:
     - Generates/preserves correlation ID
     - Tracks operation duration
-    - Logs start/end of operations
+    - Logs a single completion record with the duration
     - Handles exceptions with proper logging
 
+    Pass ``log_entry_exit=True`` to also log a "Starting" record on entry, or
+    ``log_completion=False`` to only log failures.
+
     Usage:
         with LogContext(operation="upload_dicom", session="SESS001") as ctx:
             # Your operation code
@@ -268,12 +483,14 @@ class LogContext:
         logger: Optional[logging.Logger] = None,
         *,
         correlation_id: Optional[str] = None,
-        log_entry_exit: bool = True,
+        log_entry_exit: bool = False,
+        log_completion: bool = True,
         **context: Any,
     ) -> None:
         self.operation = operation
         self.logger = logger or logging.getLogger("xnatio")
         self.log_entry_exit = log_entry_exit
+        self.log_completion = log_completion or log_entry_exit
         self.context = {"operation": operation, **context}
         self.start_time: Optional[float] = None
         self.correlation_id = correlation_id or get_correlation_id()
@@ -281,9 +498,7 @@ class LogContext:
         self._cid_token: Optional[contextvars.Token[Optional[str]]] = None
 
     def __enter__(self) -> "LogContext":
-        import time
-
-        self.start_time = time.time()
+        self.start_time = _monotonic()
         self._token = _operation_context.set(self.context)
         self._cid_token = _correlation_id.set(self.correlation_id)
 
@@ -298,25 +513,25 @@ class LogContext:
         exc_val: Optional[BaseException],
         exc_tb: Any,
     ) -> None:
-        import time
-
-        duration_ms = (time.time() - (self.start_time or 0)) * 1000
+        duration_ms = (_monotonic() - (self.start_time or 0)) * 1000.0
 
         if exc_val is not None:
+            extras = {**self.context, "duration_ms": duration_ms, "success": False}
             self.logger.error(
                 "%s failed after %.1fms: %s",
                 self.operation,
                 duration_ms,
                 exc_val,
                 exc_info=True,
-                extra={**self.context, "duration_ms": duration_ms, "success": False},
+                extra=extras,
             )
-        elif self.log_entry_exit:
+        elif self.log_completion:
+            extras = {**self.context, "duration_ms": duration_ms, "success": True}
             self.logger.info(
                 "Completed %s in %.1fms",
                 self.operation,
                 duration_ms,
-                extra={**self.context, "duration_ms": duration_ms, "success": True},
+                extra=extras,
             )
 
         # Restore previous context
@@ -353,6 +568,9 @@ def log_operation(
 # Setup Functions
 # =============================================================================
 
+# Queue handlers and listeners installed by setup_logging
+_queue_listeners: List[Tuple[logging.Logger, QueueHandler, QueueListener]] = []
+
 
 def setup_logging(
     level: Union[int, str] = logging.INFO,
@@ -360,14 +578,23 @@ def setup_logging(
     json_output: bool = False,
     log_file: Optional[str] = None,
     audit_file: Optional[str] = None,
+    ring_size: int = DEFAULT_LOG_RING_SIZE,
 ) -> None:
     """Configure logging for the xnatio application.
 
+    Records are handed to a background listener thread through a queue, so
+    formatting and I/O happen off the calling thread. The context filter runs
+    before queuing so correlation IDs and operation context are captured from
+    the caller. Regular log records go through a ring buffer of ``ring_size``
+    records that drops the oldest under bursts; audit records are never
+    dropped.
+
     Args:
         level: Logging level (DEBUG, INFO, WARNING, ERROR).
         json_output: If True, use JSON formatter for structured output.
         log_file: Optional path to write logs to file.
         audit_file: Optional separate file for audit logs.
+        ring_size: Maximum number of regular log records waiting to be written.
     """
     # Convert string level to int
     if isinstance(level, str):
@@ -377,8 +604,14 @@ def setup_logging(
     root_logger = logging.getLogger("xnatio")
     root_logger.setLevel(level)
 
-    # Remove existing handlers
+    # Stop previous listeners and remove existing handlers, closing them so
+    # buffered files are flushed and their flush threads stop
+    shutdown_logging()
+    audit_logger = logging.getLogger("xnatio.audit")
+    for handler in {*root_logger.handlers, *audit_logger.handlers}:
+        handler.close()
     root_logger.handlers.clear()
+    audit_logger.handlers.clear()
 
     # Add context filter
     context_filter = ContextFilter()
@@ -394,36 +627,82 @@ def setup_logging(
     console_handler = logging.StreamHandler(sys.stderr)
     console_handler.setLevel(level)
     console_handler.setFormatter(formatter)
-    console_handler.addFilter(context_filter)
-    root_logger.addHandler(console_handler)
+    handlers: List[logging.Handler] = [console_handler]
 
     # File handler (optional)
     if log_file:
-        file_handler = logging.FileHandler(log_file)
+        file_handler = BufferedFileHandler(log_file)
         file_handler.setLevel(level)
         file_handler.setFormatter(formatter)
-        file_handler.addFilter(context_filter)
-        root_logger.addHandler(file_handler)
+        handlers.append(file_handler)
+
+    _start_queue_listener(root_logger, handlers, context_filter, RingBuffer(ring_size))
 
     # Audit logger setup
-    audit_logger = logging.getLogger("xnatio.audit")
     audit_logger.setLevel(logging.INFO)
-    audit_logger.handlers.clear()
 
+    audit_handler: logging.Handler
     if audit_file:
-        audit_handler = logging.FileHandler(audit_file)
+        audit_handler = BufferedFileHandler(audit_file)
         audit_handler.setFormatter(JSONFormatter())
-        audit_handler.addFilter(context_filter)
-        audit_logger.addHandler(audit_handler)
     else:
         # Audit logs go to same output as regular logs
-        audit_logger.addHandler(console_handler)
+        audit_handler = console_handler
+
+    _start_queue_listener(audit_logger, [audit_handler], context_filter, queue.SimpleQueue())
 
     # Prevent propagation to root logger
     root_logger.propagate = False
     audit_logger.propagate = False
 
 
+def _start_queue_listener(
+    logger: logging.Logger,
+    handlers: List[logging.Handler],
+    context_filter: logging.Filter,
+    log_queue: Any,
+) -> None:
+    """Route a logger's records through a queue to a background listener."""
+    queue_handler = _RecordQueueHandler(log_queue)
+    queue_handler.addFilter(context_filter)
+    logger.addHandler(queue_handler)
+
+    listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    _queue_listeners.append((logger, queue_handler, listener))
+
+
+def shutdown_logging() -> None:
+    """Stop the background log listeners and close their handlers.
+
+    Records queued before the call are written out first, followed by a
+    warning if a full ring buffer discarded any. This runs automatically at
+    interpreter exit.
+    """
+    while _queue_listeners:
+        logger, queue_handler, listener = _queue_listeners.pop()
+        logger.removeHandler(queue_handler)
+        listener.stop()
+        dropped = getattr(listener.queue, "dropped", 0)
+        if dropped:
+            record = logger.makeRecord(
+                logger.name,
+                logging.WARNING,
+                __file__,
+                0,
+                "Dropped %d log records because the log buffer was full",
+                (dropped,),
+                None,
+            )
+            if queue_handler.filter(record):
+                listener.handle(record)
+        for handler in listener.handlers:
+            handler.close()
+
+
+atexit.register(shutdown_logging)
+
+
 def get_logger(name: str) -> logging.Logger:
     """Get a logger with the xnatio namespace.
 
@@ -443,6 +722,14 @@ def get_logger(name: str) -> logging.Logger:
 # =============================================================================
 
 
+# Key fragments masked by sanitize_for_log when no sensitive_keys are given
+_DEFAULT_SENSITIVE_RE = re.compile(r"password|token|secret|api_key|credential|auth", re.IGNORECASE)
+_NEVER_MATCH_RE = re.compile(r"(?!)")
+
+# Mask prefix sliced by mask_sensitive instead of building "*" * n per call
+_STARS = "*" * 1024
+
+
 def mask_sensitive(value: str, visible_chars: int = 4) -> str:
     """Mask sensitive values for logging.
 
@@ -453,9 +740,13 @@ def mask_sensitive(value: str, visible_chars: int = 4) -> str:
     Returns:
         Masked string like "****abcd".
     """
-    if not value or len(value) <= visible_chars:
+    if not value:
+        return "****"
+    hidden = len(value) - visible_chars
+    if hidden <= 0:
         return "****"
-    return "*" * (len(value) - visible_chars) + value[-visible_chars:]
+    stars = _STARS[:hidden] if hidden <= len(_STARS) else "*" * hidden
+    return stars + value[hidden:]
 
 
 def sanitize_for_log(
@@ -471,14 +762,27 @@ def sanitize_for_log(
         Copy of dictionary with sensitive values masked.
     """
     if sensitive_keys is None:
-        sensitive_keys = {"password", "token", "secret", "api_key", "credential", "auth"}
+        pattern = _DEFAULT_SENSITIVE_RE
+    else:
+        pattern = _sensitive_key_pattern(frozenset(sensitive_keys))
+    return _sanitize(data, pattern)
+
+
+@lru_cache(maxsize=32)
+def _sensitive_key_pattern(sensitive_keys: frozenset[str]) -> re.Pattern[str]:
+    """Compile a case-insensitive matcher for any of the given key fragments."""
+    if not sensitive_keys:
+        return _NEVER_MATCH_RE
+    return re.compile("|".join(map(re.escape, sorted(sensitive_keys))), re.IGNORECASE)
+
 
+def _sanitize(data: dict[str, Any], pattern: re.Pattern[str]) -> dict[str, Any]:
     result: dict[str, Any] = {}
     for key, value in data.items():
         if isinstance(value, dict):
             # Recurse into nested dicts first
-            result[key] = sanitize_for_log(value, sensitive_keys)
-        elif any(s in key.lower() for s in sensitive_keys):
+            result[key] = _sanitize(value, pattern)
+        elif pattern.search(key):
             # Mask sensitive leaf values
             result[key] = mask_sensitive(str(value)) if value else None
         else:
@@ -1,11 +1,32 @@
+import os
+import shutil
 import tempfile
+import time
 import uuid
 import zipfile
 from pathlib import Path
+from typing import Iterator, Optional
 
 # Archive format constants and utilities
 _ALLOWED_ARCHIVE_EXTS = {".zip", ".tar", ".tgz"}
 
+# Extensions of files that deflate cannot meaningfully shrink
+_PRECOMPRESSED_EXTS = frozenset(
+    {".jpg", ".jpeg", ".j2k", ".jp2", ".png", ".gz", ".tgz", ".zip", ".bz2", ".xz", ".zst"}
+)
+
+# Transfer syntax UIDs (or UID prefixes) with compressed pixel data:
+# JPEG family (1.2.840.10008.1.2.4.*), RLE Lossless and Deflated Explicit VR
+_COMPRESSED_TRANSFER_SYNTAXES = (
+    b"1.2.840.10008.1.2.4.",
+    b"1.2.840.10008.1.2.5",
+    b"1.2.840.10008.1.2.1.99",
+)
+
+# Leading bytes read to sniff the DICOM preamble and file meta header
+_SNIFF_BYTES = 1024
+_COPY_CHUNK_SIZE = 1024 * 1024
+
 
 def is_allowed_archive(path: Path) -> bool:
     """Check if a file path represents a supported archive format."""
@@ -15,17 +36,87 @@ def is_allowed_archive(path: Path) -> bool:
     return path.suffix.lower() in _ALLOWED_ARCHIVE_EXTS
 
 
-def zip_dir_to_temp(dir_path: Path) -> Path:
-    """Create a temporary ZIP from a directory and return its path."""
+def _walk_files(root: str) -> Iterator[str]:
+    """Yield paths of all files under root, using one scandir entry per file.
+
+    Symlinked files are included; symlinked directories are not descended.
+    Paths come in directory order, as they are found.
+    """
+    stack = [root]
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            dirs = []
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    dirs.append(entry.path)
+                elif entry.is_file():
+                    yield entry.path
+        stack.extend(dirs)
+
+
+def _is_precompressed(name: str, head: bytes) -> bool:
+    """Guess from a file's name and first bytes whether deflate would be wasted."""
+    if os.path.splitext(name)[1].lower() in _PRECOMPRESSED_EXTS:
+        return True
+    return head[128:132] == b"DICM" and any(uid in head for uid in _COMPRESSED_TRANSFER_SYNTAXES)
+
+
+def _zip_info(arcname: str, st: os.stat_result) -> zipfile.ZipInfo:
+    """Build the ZipInfo that ZipInfo.from_file would, from an existing stat."""
+    date_time = time.localtime(st.st_mtime)[:6]
+    if date_time[0] < 1980:
+        date_time = (1980, 1, 1, 0, 0, 0)
+    zinfo = zipfile.ZipInfo(arcname.replace(os.sep, "/"), date_time)
+    zinfo.external_attr = (st.st_mode & 0xFFFF) << 16
+    zinfo.file_size = st.st_size
+    return zinfo
+
+
+def _write_zip_entry(
+    zf: zipfile.ZipFile,
+    path: str,
+    arcname: str,
+    compress: bool,
+    st: Optional[os.stat_result] = None,
+) -> None:
+    """Add a file, storing it uncompressed if its payload is already compressed.
+
+    Pass st when the file was already stat'ed to skip another stat call.
+    """
+    zinfo = zipfile.ZipInfo.from_file(path, arcname) if st is None else _zip_info(arcname, st)
+    with open(path, "rb") as src:
+        head = src.read(_SNIFF_BYTES)
+        if not compress or _is_precompressed(arcname, head):
+            zinfo.compress_type = zipfile.ZIP_STORED
+        else:
+            zinfo.compress_type = zipfile.ZIP_DEFLATED
+            # ZipFile.open() takes the level from the ZipInfo, not the archive.
+            zinfo._compresslevel = zf.compresslevel  # type: ignore[attr-defined]
+        with zf.open(zinfo, "w") as dst:
+            dst.write(head)
+            shutil.copyfileobj(src, dst, _COPY_CHUNK_SIZE)
+
+
+def zip_dir_to_temp(dir_path: Path, *, compress: bool = True) -> Path:
+    """Create a temporary ZIP from a directory and return its path.
+
+    Files whose payload is already compressed (DICOM with a JPEG, JPEG 2000,
+    RLE or deflated transfer syntax, or common compressed formats by
+    extension) are stored rather than deflated again. With compress=False
+    every file is stored, for archives that only need to carry the files
+    (e.g. uploads XNAT extracts on arrival).
+    """
     tmp_zip = Path(tempfile.gettempdir()) / f"xnatio_{dir_path.name}_{uuid.uuid4().hex}.zip"
+    root = os.fspath(dir_path)
     with zipfile.ZipFile(
         tmp_zip, mode="w", compression=zipfile.ZIP_DEFLATED, allowZip64=True
     ) as zf:
-        for path in sorted(dir_path.rglob("*")):
-            if not path.is_file():
-                continue
-            rel = path.relative_to(dir_path).as_posix()
-            zf.write(path, arcname=rel)
+        # Entries are written serially: zipfile has no public API for
+        # appending data deflated elsewhere, so sharding across processes
+        # would mean re-implementing its local header/central directory
+        # bookkeeping. Precompressed payloads skip deflate entirely instead.
+        for path in sorted(_walk_files(root)):
+            _write_zip_entry(zf, path, os.path.relpath(path, root).replace(os.sep, "/"), compress)
     return tmp_zip
 
 
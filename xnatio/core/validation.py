@@ -10,6 +10,8 @@ from __future__ import annotations
 
 import os
 import re
+import stat
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional, Union
 from urllib.parse import urlparse
@@ -40,11 +42,43 @@ XNAT_ID_MAX_LENGTH = 64
 AE_TITLE_PATTERN = re.compile(r"^[\x20-\x5B\x5D-\x7E]{1,16}$")
 AE_TITLE_MAX_LENGTH = 16
 
+# Bound fullmatch methods for the per-call hot paths; fullmatch also rejects
+# the trailing newline that an anchored ``match`` lets through ``$``
+_xnat_id_fullmatch = XNAT_ID_PATTERN.fullmatch
+_ae_title_fullmatch = AE_TITLE_PATTERN.fullmatch
+
+# Whole comma-separated ID lists checked in one pass; lists that fail fall
+# back to per-item validation for a precise error message
+_scan_id_list_fullmatch = re.compile(
+    r"[a-zA-Z0-9_-]{1,32}(?:\s*,\s*[a-zA-Z0-9_-]{1,32})*"
+).fullmatch
+_project_id_list_fullmatch = re.compile(
+    rf"[a-zA-Z0-9_-]{{1,{XNAT_ID_MAX_LENGTH}}}(?:\s*,\s*[a-zA-Z0-9_-]{{1,{XNAT_ID_MAX_LENGTH}}})*"
+).fullmatch
+
 # Allowed URL schemes for XNAT server
 ALLOWED_URL_SCHEMES = {"http", "https"}
 
 # Archive extensions
-ALLOWED_ARCHIVE_EXTENSIONS = {".zip", ".tar", ".tar.gz", ".tgz"}
+ALLOWED_ARCHIVE_EXTENSIONS = frozenset({".zip", ".tar", ".tar.gz", ".tgz"})
+_ARCHIVE_EXTENSIONS_MSG = (
+    f"unsupported archive format. Allowed: {', '.join(sorted(ALLOWED_ARCHIVE_EXTENSIONS))}"
+)
+
+# XNAT import overwrite modes
+_OVERWRITE_MODES = frozenset({"none", "append", "delete"})
+_OVERWRITE_MODES_MSG = f"must be one of: {', '.join(sorted(_OVERWRITE_MODES))}"
+
+
+class _SanitizedStr(str):
+    """Identifier that passed :func:`validate_xnat_identifier`.
+
+    It only contains characters matched by ``XNAT_ID_PATTERN``, so it can be
+    written into JSON between quotes without escaping. That holds only while
+    instances come from the validators in this module, so it is not exported.
+    """
+
+    __slots__ = ()
 
 
 # =============================================================================
@@ -173,6 +207,11 @@ def validate_xnat_identifier(
     Raises:
         InvalidIdentifierError: If identifier is invalid.
     """
+    # Already validated (e.g. by a public entry point calling a helper that
+    # validates again); only the length limit can differ between callers
+    if type(value) is _SanitizedStr and len(value) <= max_length:
+        return value
+
     if not isinstance(value, str):
         raise InvalidIdentifierError(identifier_type, str(value), "must be a string")
 
@@ -190,14 +229,15 @@ def validate_xnat_identifier(
             f"exceeds maximum length of {max_length} characters",
         )
 
-    if not XNAT_ID_PATTERN.match(value):
+    # Plain ASCII alphanumerics (most IDs) are accepted without the regex
+    if not (value.isascii() and value.isalnum()) and not _xnat_id_fullmatch(value):
         raise InvalidIdentifierError(
             identifier_type,
             value,
             "must contain only alphanumeric characters, underscores, and hyphens",
         )
 
-    return value
+    return _SanitizedStr(value)
 
 
 def validate_project_id(project: str) -> str:
@@ -288,7 +328,7 @@ def validate_ae_title(ae_title: str, field_name: str = "AE Title") -> str:
             f"exceeds maximum length of {AE_TITLE_MAX_LENGTH} characters",
         )
 
-    if not AE_TITLE_PATTERN.match(ae_title):
+    if not _ae_title_fullmatch(ae_title):
         raise InvalidIdentifierError(
             field_name,
             ae_title,
@@ -333,16 +373,19 @@ def validate_path_exists(
     # Expand user home directory
     path = path.expanduser()
 
-    if not path.exists():
-        raise PathValidationError(str(path), f"{description} does not exist")
+    # One stat() answers existence and type together
+    try:
+        mode = os.stat(path).st_mode
+    except (FileNotFoundError, NotADirectoryError, ValueError):
+        raise PathValidationError(str(path), f"{description} does not exist") from None
 
-    if must_be_file and not path.is_file():
+    if must_be_file and not stat.S_ISREG(mode):
         raise PathValidationError(str(path), f"{description} must be a file")
 
-    if must_be_dir and not path.is_dir():
+    if must_be_dir and not stat.S_ISDIR(mode):
         raise PathValidationError(str(path), f"{description} must be a directory")
 
-    return path.resolve()
+    return Path(os.path.realpath(path))
 
 
 def validate_path_writable(
@@ -367,19 +410,19 @@ def validate_path_writable(
     path = path.expanduser()
     parent = path.parent
 
-    if not parent.exists():
-        raise PathValidationError(
-            str(path),
-            f"parent directory does not exist: {parent}",
-        )
-
+    # Only the failure path needs a second syscall to tell the causes apart
     if not os.access(parent, os.W_OK):
+        if not parent.exists():
+            raise PathValidationError(
+                str(path),
+                f"parent directory does not exist: {parent}",
+            )
         raise PathValidationError(
             str(path),
             f"parent directory is not writable: {parent}",
         )
 
-    return path.resolve()
+    return Path(os.path.realpath(path))
 
 
 def validate_archive_path(path: Union[str, Path]) -> Path:
@@ -403,10 +446,7 @@ def validate_archive_path(path: Union[str, Path]) -> Path:
         suffix = ".tgz"
 
     if suffix not in ALLOWED_ARCHIVE_EXTENSIONS:
-        raise PathValidationError(
-            str(resolved),
-            f"unsupported archive format. Allowed: {', '.join(sorted(ALLOWED_ARCHIVE_EXTENSIONS))}",
-        )
+        raise PathValidationError(str(resolved), _ARCHIVE_EXTENSIONS_MSG)
 
     return resolved
 
@@ -423,13 +463,22 @@ def validate_dicom_directory(path: Union[str, Path]) -> Path:
     Raises:
         PathValidationError: If path is not a valid DICOM directory.
     """
-    resolved = validate_path_exists(path, must_be_dir=True, description="DICOM directory")
+    if isinstance(path, str):
+        path = Path(path)
+    path = path.expanduser()
 
-    # Check if directory is readable
-    if not os.access(resolved, os.R_OK):
-        raise PathValidationError(str(resolved), "directory is not readable")
+    # Opening the directory checks existence, type and readability at once
+    try:
+        with os.scandir(path):
+            pass
+    except (FileNotFoundError, ValueError):
+        raise PathValidationError(str(path), "DICOM directory does not exist") from None
+    except NotADirectoryError:
+        raise PathValidationError(str(path), "DICOM directory must be a directory") from None
+    except PermissionError:
+        raise PathValidationError(str(path), "directory is not readable") from None
 
-    return resolved
+    return Path(os.path.realpath(path))
 
 
 # =============================================================================
@@ -463,14 +512,17 @@ def validate_timeout(
     if value is None:
         return default
 
-    try:
-        timeout = int(value)
-    except (ValueError, TypeError):
-        raise InvalidConfigurationError(
-            field_name,
-            value,
-            "must be a valid integer",
-        )
+    if type(value) is int:
+        timeout = value
+    else:
+        try:
+            timeout = int(value)
+        except (ValueError, TypeError):
+            raise InvalidConfigurationError(
+                field_name,
+                value,
+                "must be a valid integer",
+            )
 
     if timeout < min_value:
         raise InvalidConfigurationError(
@@ -515,14 +567,17 @@ def validate_workers(
     if value is None:
         return default
 
-    try:
-        workers = int(value)
-    except (ValueError, TypeError):
-        raise InvalidConfigurationError(
-            field_name,
-            value,
-            "must be a valid integer",
-        )
+    if type(value) is int:
+        workers = value
+    else:
+        try:
+            workers = int(value)
+        except (ValueError, TypeError):
+            raise InvalidConfigurationError(
+                field_name,
+                value,
+                "must be a valid integer",
+            )
 
     if workers < min_value:
         raise InvalidConfigurationError(
@@ -553,15 +608,10 @@ def validate_overwrite_mode(mode: str) -> str:
     Raises:
         InvalidConfigurationError: If mode is invalid.
     """
-    valid_modes = {"none", "append", "delete"}
     mode = mode.strip().lower()
 
-    if mode not in valid_modes:
-        raise InvalidConfigurationError(
-            "overwrite",
-            mode,
-            f"must be one of: {', '.join(sorted(valid_modes))}",
-        )
+    if mode not in _OVERWRITE_MODES:
+        raise InvalidConfigurationError("overwrite", mode, _OVERWRITE_MODES_MSG)
 
     return mode
 
@@ -593,6 +643,9 @@ def validate_scan_ids_input(scan_input: str) -> Optional[list[str]]:
     if scan_input == "*":
         return None
 
+    if _scan_id_list_fullmatch(scan_input):
+        return [_SanitizedStr(part.strip()) for part in scan_input.split(",")]
+
     scan_ids = []
     for part in scan_input.split(","):
         part = part.strip()
@@ -618,6 +671,10 @@ def validate_project_list(projects_input: str) -> list[str]:
     Raises:
         InvalidIdentifierError: If any project ID is invalid.
     """
+    stripped = projects_input.strip()
+    if _project_id_list_fullmatch(stripped):
+        return [_SanitizedStr(part.strip()) for part in stripped.split(",")]
+
     project_ids = []
     for part in projects_input.split(","):
         part = part.strip()
@@ -631,11 +688,22 @@ def validate_project_list(projects_input: str) -> list[str]:
     return project_ids
 
 
-def validate_regex_pattern(pattern: str, field_name: str = "pattern") -> re.Pattern[str]:
+@lru_cache(maxsize=256)
+def _compile_cached(pattern: str) -> re.Pattern[str]:
+    """Compile a regex, memoized by pattern string."""
+    return re.compile(pattern)
+
+
+def validate_regex_pattern(
+    pattern: Union[str, re.Pattern[str]], field_name: str = "pattern"
+) -> re.Pattern[str]:
     """Validate and compile a regex pattern.
 
+    Compiled patterns are cached, so validating the same pattern again
+    (e.g. once per project) does not recompile it.
+
     Args:
-        pattern: Regex pattern string.
+        pattern: Regex pattern string, or an already compiled pattern.
         field_name: Field name for error messages.
 
     Returns:
@@ -644,11 +712,14 @@ def validate_regex_pattern(pattern: str, field_name: str = "pattern") -> re.Patt
     Raises:
         InvalidConfigurationError: If pattern is invalid.
     """
+    if isinstance(pattern, re.Pattern):
+        return pattern
+
     if not pattern or not isinstance(pattern, str):
         raise InvalidConfigurationError(field_name, pattern, "pattern cannot be empty")
 
     try:
-        return re.compile(pattern)
+        return _compile_cached(pattern)
     except re.error as e:
         raise InvalidConfigurationError(
             field_name,
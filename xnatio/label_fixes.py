@@ -10,16 +10,28 @@ from __future__ import annotations
 
 import json
 import logging
-import re
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from datetime import date, datetime, time
+from functools import lru_cache
+from operator import attrgetter
 from pathlib import Path
-from typing import TYPE_CHECKING, Optional, Sequence
+from typing import TYPE_CHECKING, NamedTuple, Optional, Sequence
+
+from .core import validate_regex_pattern, validate_workers
 
 if TYPE_CHECKING:
     from .xnat_client import XNATClient
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None  # type: ignore[assignment]
+
 log = logging.getLogger(__name__)
 
+# Both accept bytes, so the config file is never decoded in Python
+_json_loads = orjson.loads if orjson is not None else json.loads
+
 # XSI type to modality code mapping
 XSI_MODALITY_MAP = {
     "xnat:mrsessiondata": "MR",
@@ -35,6 +47,10 @@ XSI_MODALITY_MAP = {
     "xnat:eegsessiondata": "EEG",
 }
 
+# Sort-key stand-ins for missing times, sorting them before any real value
+_TIME_MIN = time.min
+_DATETIME_MIN = datetime.min
+
 DATE_FORMATS = ("%Y-%m-%d", "%Y/%m/%d", "%Y%m%d")
 TIME_FORMATS = ("%H:%M:%S", "%H:%M")
 DATETIME_FORMATS = (
@@ -46,6 +62,16 @@ DATETIME_FORMATS = (
 )
 
 
+class _ExpRow(NamedTuple):
+    """Experiment fields needed to assign visit/session order."""
+
+    id: str
+    label: str
+    modality: str
+    order_time: Optional[time]
+    sort_key: tuple[time, datetime, str, str]
+
+
 def load_patterns_config(config_path: Path) -> dict:
     """
     Load patterns configuration from JSON file.
@@ -62,29 +88,40 @@ def load_patterns_config(config_path: Path) -> dict:
         ]
     }
     """
-    with open(config_path) as f:
-        return json.load(f)
+    return _json_loads(Path(config_path).read_bytes())
 
 
 def _parse_datetime(value: str) -> Optional[datetime]:
     """Parse datetime from various formats."""
     if not value:
         return None
+    # XNAT normally returns ISO-8601, which fromisoformat parses in C
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        pass
     for fmt in DATETIME_FORMATS:
         try:
             return datetime.strptime(value, fmt)
         except ValueError:
             continue
-    try:
-        return datetime.fromisoformat(value)
-    except ValueError:
-        return None
+    return None
 
 
 def _parse_date(value: str) -> Optional[date]:
     """Parse date from various formats."""
     if not value:
         return None
+    if len(value) == 10:
+        try:
+            return date.fromisoformat(value)
+        except ValueError:
+            pass
+    elif len(value) == 8 and value.isdigit():
+        try:
+            return date(int(value[:4]), int(value[4:6]), int(value[6:]))
+        except ValueError:
+            return None
     for fmt in DATE_FORMATS:
         try:
             return datetime.strptime(value, fmt).date()
@@ -98,6 +135,11 @@ def _parse_time(value: str) -> Optional[time]:
     """Parse time from various formats."""
     if not value:
         return None
+    if len(value) in (5, 8):
+        try:
+            return time.fromisoformat(value)
+        except ValueError:
+            pass
     for fmt in TIME_FORMATS:
         try:
             return datetime.strptime(value, fmt).time()
@@ -107,10 +149,16 @@ def _parse_time(value: str) -> Optional[time]:
     return dt.time() if dt else None
 
 
+@lru_cache(maxsize=64)
 def _modality_from_xsi(xsi_type: str) -> Optional[str]:
-    """Convert XSI type to modality code."""
-    key = (xsi_type or "").strip().lower()
-    return XSI_MODALITY_MAP.get(key)
+    """Convert XSI type to modality code.
+
+    Cached because a project repeats a handful of xsiType values, including
+    unknown ones that map to None.
+    """
+    if not xsi_type:
+        return None
+    return XSI_MODALITY_MAP.get(xsi_type.strip().lower())
 
 
 def _build_target_label(
@@ -123,6 +171,99 @@ def _build_target_label(
     return f"{subject_label}_{visit_index:02d}_SE{session_index:02d}_{modality}"
 
 
+def _plan_subject(
+    subj_label: str,
+    experiments: list[dict],
+    modalities_set: set[str],
+) -> tuple[list[tuple[str, str, str]], list[tuple[str, str, str]]]:
+    """Compute the experiment renames for one subject.
+
+    Returns (rename_plan, skipped), both lists of (ID, label, target-or-reason).
+    """
+    existing_labels = {e.get("label", "") for e in experiments if e.get("label")}
+    by_date: dict[date, list[_ExpRow]] = {}
+    skipped: list[tuple[str, str, str]] = []
+
+    for exp in experiments:
+        exp_id = exp.get("ID", "")
+        exp_label = exp.get("label", "")
+        modality = _modality_from_xsi(exp.get("xsiType", ""))
+
+        if not modality:
+            skipped.append((exp_id, exp_label, "unknown modality from xsiType"))
+            continue
+
+        if modality not in modalities_set:
+            skipped.append((exp_id, exp_label, f"modality {modality} not in filter"))
+            continue
+
+        session_date = _parse_date(exp.get("date", ""))
+        if not session_date:
+            skipped.append((exp_id, exp_label, "missing session date"))
+            continue
+
+        session_time = _parse_time(exp.get("time", ""))
+        insert_dt = _parse_datetime(exp.get("insert_date", ""))
+        if not insert_dt:
+            insert_date = _parse_date(exp.get("insert_date", ""))
+            insert_time = _parse_time(exp.get("insert_time", ""))
+            if insert_date and insert_time:
+                insert_dt = datetime.combine(insert_date, insert_time)
+
+        order_time = session_time or (insert_dt.time() if insert_dt else None)
+        by_date.setdefault(session_date, []).append(
+            _ExpRow(
+                exp_id,
+                exp_label,
+                modality,
+                order_time,
+                (order_time or _TIME_MIN, insert_dt or _DATETIME_MIN, exp_label, exp_id),
+            )
+        )
+
+    rename_plan: list[tuple[str, str, str]] = []
+    # Target label -> experiment ID planned to take it; "" marks a label
+    # already present on the server, so one lookup covers both conflicts.
+    label_owner: dict[str, str] = dict.fromkeys(existing_labels, "")
+
+    for visit_idx, session_date in enumerate(sorted(by_date.keys()), start=1):
+        group = by_date[session_date]
+
+        # Check if we can determine order for same-day experiments
+        if len(group) > 1 and any(g.order_time is None for g in group):
+            for g in group:
+                skipped.append(
+                    (
+                        g.id,
+                        g.label,
+                        "missing time for same-day experiments; cannot assign SE order",
+                    )
+                )
+            continue
+
+        group_sorted = sorted(group, key=attrgetter("sort_key"))
+
+        for session_idx, g in enumerate(group_sorted, start=1):
+            target = _build_target_label(subj_label, visit_idx, session_idx, g.modality)
+
+            if target == g.label:
+                continue
+
+            owner = label_owner.get(target)
+            if owner == "":
+                skipped.append((g.id, g.label, f"target label exists: {target}"))
+                continue
+
+            if owner and owner != g.id:
+                skipped.append((g.id, g.label, f"target label conflict: {target}"))
+                continue
+
+            label_owner[target] = g.id
+            rename_plan.append((g.id, g.label, target))
+
+    return rename_plan, skipped
+
+
 def apply_subject_patterns(
     client: "XNATClient",
     project: str,
@@ -130,6 +271,7 @@ def apply_subject_patterns(
     *,
     execute: bool = False,
     verbose: bool = False,
+    subjects_data: Optional[list[dict]] = None,
 ) -> dict:
     """
     Apply subject rename patterns to a project.
@@ -146,6 +288,9 @@ def apply_subject_patterns(
         If True, apply changes. If False, dry-run only.
     verbose : bool
         Show skipped subjects in output
+    subjects_data : list[dict] | None
+        Pre-fetched client.list_subjects(project) result, reused until a
+        pattern changes the subject list
 
     Returns
     -------
@@ -153,16 +298,18 @@ def apply_subject_patterns(
         Results with keys: renamed, merged, skipped, errors
     """
     if not patterns:
-        log.info(f"No subject rename patterns for project {project}")
+        log.info("No subject rename patterns for project %s", project)
         return {"renamed": 0, "merged": 0, "skipped": 0, "errors": 0}
 
     dry_run = not execute
     mode = "DRY-RUN" if dry_run else "EXECUTE"
+    # Per-item listings are skipped entirely when INFO is silenced (e.g. cron)
+    info_enabled = log.isEnabledFor(logging.INFO)
 
     log.info("=" * 60)
-    log.info(f"Subject rename: {mode}")
-    log.info(f"Project: {project}")
-    log.info(f"Patterns: {len(patterns)}")
+    log.info("Subject rename: %s", mode)
+    log.info("Project: %s", project)
+    log.info("Patterns: %d", len(patterns))
     log.info("=" * 60)
 
     total_renamed = 0
@@ -181,20 +328,21 @@ def apply_subject_patterns(
             continue
 
         log.info("-" * 60)
-        log.info(f"Pattern: {match}")
-        log.info(f"To:      {to}")
+        log.info("Pattern: %s", match)
+        log.info("To:      %s", to)
         if desc:
-            log.info(f"         ({desc})")
+            log.info("         (%s)", desc)
 
         try:
             result = client.rename_subjects_pattern(
                 project=project,
-                match_pattern=match,
+                match_pattern=validate_regex_pattern(match, "match"),
                 to_template=to,
                 dry_run=dry_run,
+                subjects=subjects_data,
             )
         except Exception as exc:
-            log.error(f"Error processing pattern {match}: {exc}")
+            log.error("Error processing pattern %s: %s", match, exc)
             total_errors += 1
             continue
 
@@ -202,31 +350,38 @@ def apply_subject_patterns(
         merged = result.get("merged", {})
         skipped = result.get("skipped", [])
 
-        if renamed:
-            log.info(f"Renamed ({len(renamed)}):")
+        if info_enabled and renamed:
+            log.info("Renamed (%d):", len(renamed))
             for old, new in renamed.items():
-                log.info(f"  {old} -> {new}")
+                log.info("  %s -> %s", old, new)
 
-        if merged:
-            log.info(f"Merged ({len(merged)}):")
+        if info_enabled and merged:
+            log.info("Merged (%d):", len(merged))
             for old, new in merged.items():
-                log.info(f"  {old} -> {new}")
+                log.info("  %s -> %s", old, new)
 
-        if skipped and verbose:
-            log.info(f"Skipped ({len(skipped)}):")
+        if info_enabled and skipped and verbose:
+            log.info("Skipped (%d):", len(skipped))
             for label, reason in skipped:
-                log.info(f"  {label}: {reason}")
+                log.info("  %s: %s", label, reason)
 
         total_renamed += len(renamed)
         total_merged += len(merged)
         total_skipped += len(skipped)
 
+        if execute and (renamed or merged):
+            # The listing is stale now; later patterns fetch their own
+            subjects_data = None
+
         if not renamed and not merged:
             log.info("No subjects matched this pattern.")
 
     log.info("=" * 60)
     log.info(
-        f"Subject summary: {total_renamed} renamed, {total_merged} merged, {total_skipped} skipped"
+        "Subject summary: %d renamed, %d merged, %d skipped",
+        total_renamed,
+        total_merged,
+        total_skipped,
     )
     if dry_run:
         log.info("This was a DRY-RUN. Use --execute to apply changes.")
@@ -249,6 +404,8 @@ def apply_experiment_label_fixes(
     modalities: Optional[Sequence[str]] = None,
     execute: bool = False,
     verbose: bool = False,
+    max_workers: int = 8,
+    subjects_data: Optional[list[dict]] = None,
 ) -> dict:
     """
     Fix experiment labels to standard convention.
@@ -271,31 +428,41 @@ def apply_experiment_label_fixes(
         If True, apply changes. If False, dry-run only.
     verbose : bool
         Show skipped experiments in output
+    max_workers : int
+        Concurrent experiment renames, and per-subject listings when the
+        project-wide listing is unavailable
+    subjects_data : list[dict] | None
+        Pre-fetched client.list_subjects(project) result; fetched if omitted
 
     Returns
     -------
     dict
         Results with keys: renamed, skipped, failed, skipped_subjects
     """
+    worker_count = validate_workers(max_workers, "max_workers", default=8)
     if modalities is None:
         modalities = ["MR"]
     modalities_set = set(m.upper() for m in modalities)
 
     dry_run = not execute
     mode = "DRY-RUN" if dry_run else "EXECUTE"
+    info_enabled = log.isEnabledFor(logging.INFO)
 
     log.info("=" * 60)
-    log.info(f"Experiment label fixes: {mode}")
-    log.info(f"Project: {project}")
-    log.info(f"Modalities: {', '.join(sorted(modalities_set))}")
+    log.info("Experiment label fixes: %s", mode)
+    log.info("Project: %s", project)
+    log.info("Modalities: %s", ", ".join(sorted(modalities_set)))
     if subjects:
-        log.info(f"Subject filter: {', '.join(subjects)}")
+        log.info("Subject filter: %s", ", ".join(subjects))
     if subject_pattern:
-        log.info(f"Subject pattern: {subject_pattern}")
+        log.info("Subject pattern: %s", subject_pattern)
     log.info("=" * 60)
 
-    subject_re = re.compile(subject_pattern) if subject_pattern else None
-    subjects_data = client.list_subjects(project)
+    subject_re = (
+        validate_regex_pattern(subject_pattern, "subject_pattern") if subject_pattern else None
+    )
+    if subjects_data is None:
+        subjects_data = client.list_subjects(project)
     subject_labels = [s["label"] for s in subjects_data]
 
     if subjects:
@@ -303,144 +470,99 @@ def apply_experiment_label_fixes(
         subject_labels = [s for s in subject_labels if s in wanted]
 
     if subject_re:
-        subject_labels = [s for s in subject_labels if subject_re.search(s)]
+        search = subject_re.search
+        subject_labels = [s for s in subject_labels if search(s)]
+
+    # Only subjects already normalized to the project prefix are processed
+    prefix = f"{project}_"
+    eligible = [s for s in subject_labels if s.startswith(prefix)]
+    skipped_subjects = len(subject_labels) - len(eligible)
+    if skipped_subjects and verbose and info_enabled:
+        for subj_label in subject_labels:
+            if not subj_label.startswith(prefix):
+                log.info("Skipping subject %s: not normalized to project prefix", subj_label)
 
     total_renamed = 0
     total_skipped = 0
-    skipped_subjects = 0
     total_failed = 0
 
-    prefix = f"{project}_"
-
-    for subj_label in subject_labels:
-        # Check subject has project prefix
-        if not subj_label.startswith(prefix):
-            if verbose:
-                log.info(f"Skipping subject {subj_label}: not normalized to project prefix")
-            skipped_subjects += 1
-            continue
-
-        experiments = client.list_subject_experiments_detailed(project, subj_label)
-        if not experiments:
-            continue
-
-        existing_labels = {e.get("label", "") for e in experiments if e.get("label")}
-        by_date: dict[date, list[dict]] = {}
-        skipped: list[tuple[str, str, str]] = []
-
-        for exp in experiments:
-            exp_id = exp.get("ID", "")
-            exp_label = exp.get("label", "")
-            modality = _modality_from_xsi(exp.get("xsiType", ""))
-
-            if not modality:
-                skipped.append((exp_id, exp_label, "unknown modality from xsiType"))
-                continue
-
-            if modality not in modalities_set:
-                skipped.append((exp_id, exp_label, f"modality {modality} not in filter"))
-                continue
-
-            session_date = _parse_date(exp.get("date", ""))
-            if not session_date:
-                skipped.append((exp_id, exp_label, "missing session date"))
-                continue
+    # One project-wide listing instead of one request per subject; fall back
+    # to per-subject listings if the server rejects the bulk query.
+    by_subject: Optional[dict[str, list[dict]]] = None
+    if eligible:
+        try:
+            by_subject = {}
+            for exp in client.list_project_experiments_detailed(project):
+                by_subject.setdefault(exp["subject_label"], []).append(exp)
+        except Exception as exc:
+            log.warning("Project experiment listing failed; listing per subject: %s", exc)
+            by_subject = None
+
+    def _load_and_plan(
+        subj_label: str,
+    ) -> tuple[list[tuple[str, str, str]], list[tuple[str, str, str]]]:
+        if by_subject is not None:
+            experiments = by_subject.get(subj_label, [])
+        else:
+            experiments = client.list_subject_experiments_detailed(project, subj_label)
+        return _plan_subject(subj_label, experiments, modalities_set)
+
+    # Listing and planning are read-only, so the per-subject fallback overlaps
+    # its requests
+    if by_subject is None and len(eligible) > 1:
+        with ThreadPoolExecutor(max_workers=min(worker_count, len(eligible))) as ex:
+            plans = list(ex.map(_load_and_plan, eligible))
+    else:
+        plans = [_load_and_plan(subj_label) for subj_label in eligible]
 
-            session_time = _parse_time(exp.get("time", ""))
-            insert_dt = _parse_datetime(exp.get("insert_date", ""))
-            if not insert_dt:
-                insert_date = _parse_date(exp.get("insert_date", ""))
-                insert_time = _parse_time(exp.get("insert_time", ""))
-                if insert_date and insert_time:
-                    insert_dt = datetime.combine(insert_date, insert_time)
-
-            order_time = session_time or (insert_dt.time() if insert_dt else None)
-            by_date.setdefault(session_date, []).append(
-                {
-                    "ID": exp_id,
-                    "label": exp_label,
-                    "modality": modality,
-                    "order_time": order_time,
-                    "insert_dt": insert_dt,
-                }
-            )
+    rename_pool = ThreadPoolExecutor(max_workers=worker_count) if execute else None
+    # Every subject's renames are queued before any result is awaited, so
+    # the pool stays busy across subjects
+    futures: dict[Future[None], tuple[str, str, str]] = {}
 
-        rename_plan: list[tuple[str, str, str]] = []
-        seen_targets: dict[str, str] = {}
-
-        for visit_idx, session_date in enumerate(sorted(by_date.keys()), start=1):
-            group = by_date[session_date]
-
-            # Check if we can determine order for same-day experiments
-            if len(group) > 1 and any(g["order_time"] is None for g in group):
-                for g in group:
-                    skipped.append(
-                        (
-                            g["ID"],
-                            g["label"],
-                            "missing time for same-day experiments; cannot assign SE order",
-                        )
+    try:
+        for subj_label, (rename_plan, skipped) in zip(eligible, plans):
+            if info_enabled and rename_plan:
+                log.info("Subject: %s", subj_label)
+                log.info("Renames (%d):", len(rename_plan))
+                for exp_id, old_label, new_label in rename_plan:
+                    log.info("  %s %s -> %s", exp_id, old_label, new_label)
+
+            if info_enabled and skipped and verbose:
+                log.info("Skipped (%d):", len(skipped))
+                for exp_id, old_label, reason in skipped:
+                    log.info("  %s %s: %s", exp_id, old_label, reason)
+
+            if rename_pool is not None:
+                # Each rename is an independent PUT; overlap their round-trips
+                for exp_id, old_label, new_label in rename_plan:
+                    future = rename_pool.submit(
+                        client.rename_experiment, project, exp_id, new_label
                     )
-                continue
-
-            group_sorted = sorted(
-                group,
-                key=lambda g: (
-                    g["order_time"] or time.min,
-                    g["insert_dt"] or datetime.min,
-                    g["label"],
-                    g["ID"],
-                ),
-            )
-
-            for session_idx, g in enumerate(group_sorted, start=1):
-                target = _build_target_label(subj_label, visit_idx, session_idx, g["modality"])
-
-                if target == g["label"]:
-                    continue
-
-                if target in existing_labels and target != g["label"]:
-                    skipped.append((g["ID"], g["label"], f"target label exists: {target}"))
-                    continue
-
-                prior = seen_targets.get(target)
-                if prior and prior != g["ID"]:
-                    skipped.append((g["ID"], g["label"], f"target label conflict: {target}"))
-                    continue
-
-                seen_targets[target] = g["ID"]
-                rename_plan.append((g["ID"], g["label"], target))
-
-        if rename_plan:
-            log.info(f"Subject: {subj_label}")
-            log.info(f"Renames ({len(rename_plan)}):")
-            for exp_id, old_label, new_label in rename_plan:
-                log.info(f"  {exp_id} {old_label} -> {new_label}")
-
-        if skipped and verbose:
-            log.info(f"Skipped ({len(skipped)}):")
-            for exp_id, old_label, reason in skipped:
-                log.info(f"  {exp_id} {old_label}: {reason}")
-
-        if execute:
-            for exp_id, old_label, new_label in rename_plan:
-                try:
-                    client.rename_experiment(project, exp_id, new_label)
-                    total_renamed += 1
-                except Exception as exc:
-                    total_failed += 1
-                    log.error(f"Failed to rename {exp_id} ({old_label}) -> {new_label}: {exc}")
-        else:
-            total_renamed += len(rename_plan)
-
-        total_skipped += len(skipped)
+                    futures[future] = (exp_id, old_label, new_label)
+            else:
+                total_renamed += len(rename_plan)
+
+            total_skipped += len(skipped)
+
+        for future in as_completed(futures):
+            exp_id, old_label, new_label = futures[future]
+            try:
+                future.result()
+                total_renamed += 1
+            except Exception as exc:
+                total_failed += 1
+                log.error("Failed to rename %s (%s) -> %s: %s", exp_id, old_label, new_label, exc)
+    finally:
+        if rename_pool is not None:
+            rename_pool.shutdown()
 
     log.info("=" * 60)
-    log.info(f"Experiment summary: {total_renamed} planned/renamed, {total_skipped} skipped")
+    log.info("Experiment summary: %d planned/renamed, %d skipped", total_renamed, total_skipped)
     if skipped_subjects:
-        log.info(f"Skipped subjects (not normalized): {skipped_subjects}")
+        log.info("Skipped subjects (not normalized): %d", skipped_subjects)
     if execute and total_failed:
-        log.error(f"FAILED: {total_failed} renames")
+        log.error("FAILED: %d renames", total_failed)
     if not execute:
         log.info("This was a DRY-RUN. Use --execute to apply changes.")
     log.info("=" * 60)
@@ -463,6 +585,7 @@ def apply_label_fixes(
     modalities: Optional[Sequence[str]] = None,
     execute: bool = False,
     verbose: bool = False,
+    max_workers: int = 8,
 ) -> dict:
     """
     Apply both subject and experiment label fixes from config.
@@ -487,6 +610,8 @@ def apply_label_fixes(
         If True, apply changes. If False, dry-run only.
     verbose : bool
         Show skipped items in output
+    max_workers : int
+        Concurrent requests for the experiment step
 
     Returns
     -------
@@ -506,18 +631,20 @@ def apply_label_fixes(
         log.error("No projects found in config. Provide --project explicitly.")
         return {"subject_results": {}, "experiment_results": {}, "failed": True}
 
-    log.info(f"Processing {len(project_ids)} project(s): {', '.join(project_ids)}")
+    log.info("Processing %d project(s): %s", len(project_ids), ", ".join(project_ids))
 
     overall_failed = False
     subject_results = {}
     experiment_results = {}
 
     for project_id in project_ids:
-        log.info(f"\n{'#' * 60}")
-        log.info(f"# PROJECT: {project_id}")
-        log.info(f"{'#' * 60}\n")
+        log.info("\n%s", "#" * 60)
+        log.info("# PROJECT: %s", project_id)
+        log.info("%s\n", "#" * 60)
 
         # Step 1: Apply subject patterns
+        # One subject listing serves both steps unless renames change it
+        subjects_data = client.list_subjects(project_id)
         project_patterns = [p for p in patterns if p.get("project") == project_id]
         subj_result = apply_subject_patterns(
             client,
@@ -525,6 +652,7 @@ def apply_label_fixes(
             project_patterns,
             execute=execute,
             verbose=verbose,
+            subjects_data=subjects_data,
         )
         subject_results[project_id] = subj_result
 
@@ -542,6 +670,12 @@ def apply_label_fixes(
             modalities=modalities,
             execute=execute,
             verbose=verbose,
+            max_workers=max_workers,
+            subjects_data=(
+                None
+                if execute and (subj_result["renamed"] or subj_result["merged"])
+                else subjects_data
+            ),
         )
         experiment_results[project_id] = exp_result
 
@@ -549,7 +683,7 @@ def apply_label_fixes(
             overall_failed = True
 
     # Final summary
-    log.info(f"\n{'=' * 60}")
+    log.info("\n%s", "=" * 60)
     log.info("FINAL SUMMARY")
     log.info("=" * 60)
 
@@ -557,9 +691,11 @@ def apply_label_fixes(
         subj = subject_results.get(project_id, {})
         exp = experiment_results.get(project_id, {})
         log.info(
-            f"{project_id}: subjects({subj.get('renamed', 0)} renamed, "
-            f"{subj.get('merged', 0)} merged) | "
-            f"experiments({exp.get('renamed', 0)} renamed)"
+            "%s: subjects(%d renamed, %d merged) | experiments(%d renamed)",
+            project_id,
+            subj.get("renamed", 0),
+            subj.get("merged", 0),
+            exp.get("renamed", 0),
         )
 
     if not execute:
@@ -8,10 +8,19 @@ This module handles administrative tasks:
 
 from __future__ import annotations
 
-from concurrent.futures import ThreadPoolExecutor
-from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple, Union
 from urllib.parse import quote
 
+import requests
+
+try:
+    import ijson
+except ImportError:  # pragma: no cover - optional dependency
+    ijson = None  # type: ignore[assignment]
+
 from ..core import (
     # Exceptions
     LogContext,
@@ -22,9 +31,22 @@ from ..core import (
     validate_regex_pattern,
     validate_workers,
 )
-from .base import XNATConnection
+from .base import XNATConnection, decode_json
 from .projects import ProjectService
 
+# Catalog refreshes are server-side work; more concurrent requests than this
+# only queue up inside XNAT
+MAX_REFRESH_WORKERS = 16
+
+# Experiments refreshed per catalog refresh request
+DEFAULT_REFRESH_BATCH_SIZE = 20
+
+# {project} and {N} placeholders in rename_subjects_pattern templates
+_TEMPLATE_FIELD_RE = re.compile(r"\{(project|[1-9]\d*)\}")
+
+# Labels made only of these characters need no percent-encoding
+_SAFE_LABEL_RE = re.compile(r"[A-Za-z0-9_.-]+")
+
 
 class AdminService:
     """Service for XNAT administrative operations.
@@ -35,16 +57,25 @@ class AdminService:
     - Subject renaming (direct, batch, pattern-based with merge)
     """
 
-    def __init__(self, connection: XNATConnection) -> None:
+    def __init__(
+        self, connection: XNATConnection, projects: Optional[ProjectService] = None
+    ) -> None:
         """Initialize admin service.
 
         Args:
             connection: XNAT connection instance.
+            projects: Project service to share, so renames and merges keep
+                its existence cache current; a private one is created when
+                omitted.
         """
         self.conn = connection
         self.log = get_logger(__name__)
         self._audit = get_audit_logger()
-        self._projects = ProjectService(connection)
+        self._projects = projects if projects is not None else ProjectService(connection)
+
+        # project -> (ETag, experiments) from the last catalog refresh listing
+        self._experiments_cache: Dict[str, Tuple[str, List[Tuple[str, str, str]]]] = {}
+        self._experiments_cache_lock = threading.Lock()
 
     # =========================================================================
     # Catalog Management
@@ -59,6 +90,7 @@ class AdminService:
         experiment_ids: Optional[Sequence[str]] = None,
         parallel: bool = False,
         max_workers: int = 4,
+        batch_size: int = DEFAULT_REFRESH_BATCH_SIZE,
     ) -> List[str]:
         """Refresh catalog XMLs for project experiments.
 
@@ -69,37 +101,18 @@ class AdminService:
             experiment_ids: Optional specific experiments to refresh.
             parallel: Refresh in parallel.
             max_workers: Max parallel workers.
+            batch_size: Experiments refreshed per request. Batches the server
+                rejects with 400 are retried one experiment at a time.
 
         Returns:
             List of successfully refreshed experiment IDs.
         """
         project = validate_project_id(project)
         max_workers = validate_workers(max_workers, "max_workers")
+        batch_size = validate_workers(batch_size, "batch_size", default=DEFAULT_REFRESH_BATCH_SIZE)
 
         with LogContext("refresh_catalogs", self.log, project=project):
-            # Get experiments list
-            resp = self.conn.get(
-                f"/data/projects/{project}/experiments",
-                params={"columns": "ID,subject_ID,label", "format": "json"},
-            )
-            resp.raise_for_status()
-
-            payload = resp.json()
-            results = payload.get("ResultSet", {}).get("Result", []) or []
-
-            experiments: List[Tuple[str, str, str]] = []
-            for entry in results:
-                exp_id = str(entry.get("ID") or entry.get("id") or entry.get("label") or "").strip()
-                exp_label = str(entry.get("label") or "").strip()
-                subject_id = str(
-                    entry.get("subject_ID")
-                    or entry.get("subjectid")
-                    or entry.get("subject_label")
-                    or ""
-                ).strip()
-
-                if exp_id and subject_id:
-                    experiments.append((subject_id, exp_id, exp_label))
+            experiments = self._list_catalog_experiments(project)
 
             if not experiments:
                 self.log.info("No experiments found for project %s", project)
@@ -118,29 +131,33 @@ class AdminService:
                 self.log.info("No experiments matched selection for project %s", project)
                 return []
 
-            # Prepare options parameter
-            options_param = None
+            # Query parameters shared by every refresh request; options are
+            # de-duplicated in the order given
+            base_params: Dict[str, Any] = {}
             if options:
-                cleaned = [opt.strip() for opt in options if opt.strip()]
+                cleaned = [opt for opt in map(str.strip, options) if opt]
                 if cleaned:
-                    options_param = ",".join(dict.fromkeys(cleaned))
+                    base_params["options"] = ",".join(dict.fromkeys(cleaned))
 
-            def _refresh_one(exp: Tuple[str, str, str]) -> Optional[str]:
+            def _resource_path(exp: Tuple[str, str, str]) -> str:
                 subject_id, exp_id, _label = exp
-                resource_path = (
-                    f"/archive/projects/{project}/subjects/{subject_id}/experiments/{exp_id}"
-                )
-                params: Dict[str, str] = {"resource": resource_path}
-                if options_param:
-                    params["options"] = options_param
+                return f"/archive/projects/{project}/subjects/{subject_id}/experiments/{exp_id}"
 
-                try:
+            def _post_refresh(resources: List[str]) -> None:
+                params = {**base_params, "resource": resources}
+
+                def _do_refresh() -> requests.Response:
+                    return self.conn.post("/data/services/refresh/catalog", params=params)
 
-                    def _do_refresh() -> None:
-                        r = self.conn.post("/data/services/refresh/catalog", params=params)
-                        r.raise_for_status()
+                # Status checked outside the retry: HTTPError is an OSError
+                # and would otherwise be retried with backoff
+                r = self.conn.retry_on_network_error(_do_refresh, operation="refresh_catalog")
+                r.raise_for_status()
 
-                    self.conn.retry_on_network_error(_do_refresh, operation="refresh_catalog")
+            def _refresh_one(exp: Tuple[str, str, str]) -> Optional[str]:
+                subject_id, exp_id, _label = exp
+                try:
+                    _post_refresh([_resource_path(exp)])
                     self.log.info(
                         "Refreshed catalog for experiment %s (subject %s)", exp_id, subject_id
                     )
@@ -150,19 +167,48 @@ class AdminService:
                     self.log.error("Failed to refresh catalog for %s: %s", exp_id, e)
                     return None
 
+            def _refresh_batch(batch: List[Tuple[str, str, str]]) -> List[str]:
+                if len(batch) == 1:
+                    result = _refresh_one(batch[0])
+                    return [result] if result else []
+                try:
+                    # Repeated resource params refresh several experiments
+                    # in one request
+                    _post_refresh([_resource_path(exp) for exp in batch])
+                except requests.exceptions.HTTPError as e:
+                    if e.response is None or e.response.status_code != 400:
+                        self.log.error("Failed to refresh catalog batch: %s", e)
+                        return []
+                    # Server rejected the batch; refresh one at a time
+                    self.log.debug("Batch catalog refresh rejected, refreshing individually")
+                    return [r for r in map(_refresh_one, batch) if r]
+                except Exception as e:
+                    self.log.error("Failed to refresh catalog batch: %s", e)
+                    return []
+                for subject_id, exp_id, _label in batch:
+                    self.log.info(
+                        "Refreshed catalog for experiment %s (subject %s)", exp_id, subject_id
+                    )
+                return [exp_id for _, exp_id, _ in batch]
+
+            batches = [
+                experiments[i : i + batch_size] for i in range(0, len(experiments), batch_size)
+            ]
             refreshed: List[str] = []
 
-            if parallel and len(experiments) > 1:
-                worker_count = max(1, min(max_workers, len(experiments)))
+            if parallel and len(batches) > 1:
+                worker_count = max(1, min(max_workers, MAX_REFRESH_WORKERS, len(batches)))
+                done: set[str] = set()
                 with ThreadPoolExecutor(max_workers=worker_count) as ex:
-                    for result in ex.map(_refresh_one, experiments):
-                        if result:
-                            refreshed.append(result)
+                    # Drain in completion order so one slow refresh doesn't
+                    # hold back the rest
+                    futures = [ex.submit(_refresh_batch, batch) for batch in batches]
+                    for future in as_completed(futures):
+                        done.update(future.result())
+                refreshed = [exp_id for _, exp_id, _ in experiments if exp_id in done]
             else:
-                for exp in experiments:
-                    result = _refresh_one(exp)
-                    if result:
-                        refreshed.append(result)
+                for batch in batches:
+                    refreshed.extend(_refresh_batch(batch))
 
             self._audit.log_operation(
                 "refresh_catalogs",
@@ -174,6 +220,65 @@ class AdminService:
 
             return refreshed
 
+    def _list_catalog_experiments(self, project: str) -> List[Tuple[str, str, str]]:
+        """List (subject_id, experiment_id, label) for every project experiment.
+
+        The listing is revalidated with If-None-Match against the ETag of
+        the previous call, so a 304 reuses the cached rows instead of
+        downloading and parsing the whole project listing again.
+        """
+        with self._experiments_cache_lock:
+            cached = self._experiments_cache.get(project)
+
+        headers = {"If-None-Match": cached[0]} if cached else None
+        resp = self.conn.get(
+            f"/data/projects/{project}/experiments",
+            params={"columns": "ID,subject_ID,label", "format": "json"},
+            headers=headers,
+            stream=True,
+        )
+        try:
+            if cached and resp.status_code == 304:
+                self.log.debug("Experiment listing for %s not modified; using cache", project)
+                return list(cached[1])
+            resp.raise_for_status()
+
+            results: Iterable[Dict[str, Any]]
+            if ijson is not None:
+                # Parse rows as they arrive instead of materializing the
+                # whole ResultSet document first
+                resp.raw.decode_content = True
+                results = ijson.items(resp.raw, "ResultSet.Result.item")
+            else:
+                payload = decode_json(resp)
+                results = payload.get("ResultSet", {}).get("Result", []) or []
+
+            # ResultSet values are JSON strings and XNAT IDs and labels
+            # can't contain whitespace, so rows are used without coercion
+            experiments: List[Tuple[str, str, str]] = []
+            for entry in results:
+                exp_label = entry.get("label") or ""
+                exp_id = entry.get("ID") or entry.get("id") or exp_label
+                subject_id = (
+                    entry.get("subject_ID")
+                    or entry.get("subjectid")
+                    or entry.get("subject_label")
+                    or ""
+                )
+
+                if exp_id and subject_id:
+                    experiments.append((subject_id, exp_id, exp_label))
+        finally:
+            resp.close()
+
+        etag = resp.headers.get("ETag")
+        with self._experiments_cache_lock:
+            if etag:
+                self._experiments_cache[project] = (etag, experiments)
+            else:
+                self._experiments_cache.pop(project, None)
+        return list(experiments)
+
     # =========================================================================
     # User Management
     # =========================================================================
@@ -250,6 +355,7 @@ class AdminService:
         mapping: Mapping[str, str],
         *,
         dry_run: bool = False,
+        max_workers: int = 8,
     ) -> Dict[str, Any]:
         """Rename subjects using a mapping.
 
@@ -257,16 +363,26 @@ class AdminService:
             project: Project identifier.
             mapping: Dict of old_label -> new_label.
             dry_run: If True, only report what would be renamed.
+            max_workers: Max concurrent rename requests.
 
         Returns:
             Dict with 'renamed' (dict), 'skipped' (list of tuples).
         """
         project = validate_project_id(project)
+        max_workers = validate_workers(max_workers, "max_workers", default=8)
 
         with LogContext("rename_subjects", self.log, project=project, dry_run=dry_run):
             renamed: Dict[str, str] = {}
             skipped: List[Tuple[str, str]] = []
 
+            # One listing answers every exists() check; it is updated as
+            # renames are planned so later entries see earlier ones
+            known: set[str] = set()
+            for subj in self._projects.list_subjects(project):
+                known.add(subj["label"])
+                known.add(subj["ID"])
+
+            planned: List[Tuple[str, str]] = []
             for old_raw, new_raw in mapping.items():
                 old = (old_raw or "").strip()
                 new = (new_raw or "").strip()
@@ -279,77 +395,91 @@ class AdminService:
                     skipped.append((old, "old and new labels match"))
                     continue
 
-                # Check if source exists
-                current = self.conn.interface.select.project(project).subject(old)
-                if not current.exists():
+                if old not in known:
                     skipped.append((old, "subject not found"))
                     continue
 
-                # Check if target already exists
-                target = self.conn.interface.select.project(project).subject(new)
-                if target.exists():
+                if new in known:
                     skipped.append((old, f"target '{new}' already exists"))
                     continue
 
-                if dry_run:
+                known.discard(old)
+                known.add(new)
+                planned.append((old, new))
+
+            if dry_run:
+                for old, new in planned:
                     self.log.info("[DRY-RUN] Would rename %s -> %s", old, new)
                     renamed[old] = new
-                    continue
+                return {"renamed": renamed, "skipped": skipped, "dry_run": dry_run}
 
+            def _rename_one(pair: Tuple[str, str]) -> Optional[str]:
+                old, new = pair
                 try:
-                    resp = self.conn.put(
-                        f"/data/projects/{project}/subjects/{quote(old)}",
-                        params={"label": new},
-                    )
-                    resp.raise_for_status()
-                    renamed[old] = new
-                    self.log.info("Renamed subject %s -> %s", old, new)
-
+                    self._put_subject_label(project, old, new)
+                    return None
                 except Exception as e:
                     self.log.error("Failed to rename %s -> %s: %s", old, new, e)
-                    skipped.append((old, str(e)))
+                    return str(e)
+
+            # A rename whose target is another entry's source must wait for it
+            independent = {old for old, _ in planned}.isdisjoint(new for _, new in planned)
+            for (old, new), error in zip(
+                planned, self._run_renames(planned, _rename_one, max_workers if independent else 1)
+            ):
+                if error is None:
+                    renamed[old] = new
+                else:
+                    skipped.append((old, error))
 
-            if not dry_run:
-                self._audit.log_operation(
-                    "rename_subjects",
-                    project=project,
-                    details={"renamed_count": len(renamed), "skipped_count": len(skipped)},
-                    user=self.conn.username,
-                    success=True,
-                )
+            self._audit.log_operation(
+                "rename_subjects",
+                project=project,
+                details={"renamed_count": len(renamed), "skipped_count": len(skipped)},
+                user=self.conn.username,
+                success=True,
+            )
 
             return {"renamed": renamed, "skipped": skipped, "dry_run": dry_run}
 
     def rename_subjects_pattern(
         self,
         project: str,
-        match_pattern: str,
+        match_pattern: Union[str, re.Pattern[str]],
         to_template: str,
         *,
         dry_run: bool = False,
+        subjects: Optional[List[Dict[str, str]]] = None,
+        max_workers: int = 8,
     ) -> Dict[str, Any]:
         """Rename subjects matching a regex pattern with merge support.
 
         Args:
             project: Project identifier.
-            match_pattern: Regex pattern with capture groups.
+            match_pattern: Regex pattern with capture groups, as a string or
+                an already compiled pattern.
             to_template: Template with {1}, {2}, {project} placeholders.
             dry_run: If True, only report what would happen.
+            subjects: Current list_subjects() result for the project, if the
+                caller already has it; fetched when omitted.
+            max_workers: Max concurrent simple-rename requests.
 
         Returns:
             Dict with 'renamed', 'merged', 'skipped' keys.
         """
         project = validate_project_id(project)
         pattern = validate_regex_pattern(match_pattern, "match_pattern")
+        max_workers = validate_workers(max_workers, "max_workers", default=8)
 
         with LogContext(
             "rename_subjects_pattern",
             self.log,
             project=project,
-            pattern=match_pattern,
+            pattern=pattern.pattern,
             dry_run=dry_run,
         ):
-            subjects = self._projects.list_subjects(project)
+            if subjects is None:
+                subjects = self._projects.list_subjects(project)
             self.log.info("Found %d subjects in project %s", len(subjects), project)
 
             current_labels = {s["label"] for s in subjects}
@@ -358,17 +488,26 @@ class AdminService:
             merged: Dict[str, str] = {}
             skipped: List[Tuple[str, str]] = []
 
+            # (is_merge, label, target) in subject order; current_labels is
+            # updated as each action is planned so later decisions see it
+            actions: List[Tuple[bool, str, str]] = []
+
+            # One project-wide experiment listing serves every merge
+            exps_by_subject: Optional[Dict[str, List[Dict[str, str]]]] = None
+
+            # Translate the template once so each match only needs expand()
+            template = _compile_template(to_template, project, pattern.groups)
+            fullmatch = pattern.fullmatch
+            discard = current_labels.discard
+            add = current_labels.add
+
             for subj in subjects:
                 label = subj["label"]
-                match = pattern.fullmatch(label)
+                match = fullmatch(label)
                 if not match:
                     continue
 
-                # Build target name
-                groups = match.groups()
-                target = to_template.replace("{project}", project)
-                for i, g in enumerate(groups, start=1):
-                    target = target.replace(f"{{{i}}}", g or "")
+                target = match.expand(template)
 
                 if target == label:
                     skipped.append((label, "already matches target format"))
@@ -378,7 +517,9 @@ class AdminService:
 
                 if dry_run:
                     if target_exists:
-                        exps = self._projects.list_subject_experiments(project, label)
+                        if exps_by_subject is None:
+                            exps_by_subject = self._experiments_by_subject(project)
+                        exps = exps_by_subject.get(label, [])
                         self.log.info(
                             "[DRY-RUN] Would MERGE %s -> %s (%d experiments)",
                             label,
@@ -391,74 +532,84 @@ class AdminService:
                         renamed[label] = target
                     continue
 
-                # Actual execution
-                if target_exists:
-                    # Merge: move experiments, then delete source
-                    exps = self._projects.list_subject_experiments(project, label)
-
-                    if not exps:
-                        try:
-                            self._projects.delete_subject(project, label)
-                            merged[label] = target
-                            current_labels.discard(label)
-                        except Exception as e:
-                            skipped.append((label, f"failed to delete empty subject: {e}"))
-                        continue
-
-                    self.log.info(
-                        "Merging %s -> %s: moving %d experiments", label, target, len(exps)
-                    )
-                    move_failed = False
-
-                    for exp in exps:
-                        try:
-                            self._projects.move_experiment_to_subject(project, exp["ID"], target)
-                        except Exception as e:
-                            self.log.error("Failed to move experiment %s: %s", exp["ID"], e)
-                            move_failed = True
-                            break
-
-                    if move_failed:
-                        skipped.append((label, "failed to move some experiments"))
-                        continue
-
-                    try:
-                        self._projects.delete_subject(project, label)
+                actions.append((target_exists, label, target))
+                discard(label)
+                if not target_exists:
+                    add(target)
+
+            if dry_run:
+                return {
+                    "renamed": renamed,
+                    "merged": merged,
+                    "skipped": skipped,
+                    "dry_run": dry_run,
+                }
+
+            renames = [(label, target) for is_merge, label, target in actions if not is_merge]
+            merges = [(label, target) for is_merge, label, target in actions if is_merge]
+
+            # A merge source that another action targets gains experiments
+            # mid-run, so only untargeted sources can use the snapshot
+            targets = {target for _, _, target in actions}
+            if merges:
+                exps_by_subject = self._experiments_by_subject(project)
+
+            def _merge_one(label: str, target: str) -> Optional[str]:
+                exps = None
+                if exps_by_subject is not None and label not in targets:
+                    exps = exps_by_subject.get(label, [])
+                return self._merge_subject(project, label, target, exps, max_workers)
+
+            def _rename_one(pair: Tuple[str, str]) -> Optional[str]:
+                label, target = pair
+                try:
+                    self._put_subject_label(project, label, target)
+                    return None
+                except Exception as e:
+                    return f"rename failed: {e}"
+
+            # Renames run together ahead of the merges, which is only safe
+            # when no action's subject, renamed or merged away, is another
+            # action's target; otherwise keep the planned order
+            sources = {label for _, label, _ in actions}
+            if sources.isdisjoint(targets):
+                for (label, target), error in zip(
+                    renames, self._run_renames(renames, _rename_one, max_workers)
+                ):
+                    if error is None:
+                        renamed[label] = target
+                    else:
+                        skipped.append((label, error))
+                for label, target in merges:
+                    error = _merge_one(label, target)
+                    if error is None:
                         merged[label] = target
-                        current_labels.discard(label)
-                    except Exception as e:
-                        self.log.warning(
-                            "Experiments moved but failed to delete source %s: %s", label, e
-                        )
+                    else:
+                        skipped.append((label, error))
+            else:
+                for is_merge, label, target in actions:
+                    if is_merge:
+                        error = _merge_one(label, target)
+                    else:
+                        error = _rename_one((label, target))
+                    if error is not None:
+                        skipped.append((label, error))
+                    elif is_merge:
                         merged[label] = target
-
-                else:
-                    # Simple rename
-                    try:
-                        resp = self.conn.put(
-                            f"/data/projects/{project}/subjects/{quote(label)}",
-                            params={"label": target},
-                        )
-                        resp.raise_for_status()
+                    else:
                         renamed[label] = target
-                        current_labels.discard(label)
-                        current_labels.add(target)
-                        self.log.info("Renamed subject %s -> %s", label, target)
-                    except Exception as e:
-                        skipped.append((label, f"rename failed: {e}"))
 
-            if not dry_run:
-                self._audit.log_operation(
-                    "rename_subjects_pattern",
-                    project=project,
-                    details={
-                        "renamed_count": len(renamed),
-                        "merged_count": len(merged),
-                        "skipped_count": len(skipped),
-                    },
-                    user=self.conn.username,
-                    success=True,
-                )
+            self._audit.log_operation(
+                "rename_subjects_pattern",
+                project=project,
+                details={
+                    "renamed_count": len(renamed),
+                    "merged_count": len(merged),
+                    "skipped_count": len(skipped),
+                },
+                user=self.conn.username,
+                success=True,
+            )
 
             return {
                 "renamed": renamed,
@@ -466,3 +617,132 @@ class AdminService:
                 "skipped": skipped,
                 "dry_run": dry_run,
             }
+
+    def _put_subject_label(self, project: str, label: str, target: str) -> None:
+        """Relabel one subject via the REST API."""
+        encoded = label if _SAFE_LABEL_RE.fullmatch(label) else quote(label)
+        attempts = 0
+
+        def _do_put() -> requests.Response:
+            nonlocal attempts
+            attempts += 1
+            return self.conn.put(
+                f"/data/projects/{project}/subjects/{encoded}",
+                params={"label": target},
+            )
+
+        resp = self.conn.retry_on_network_error(_do_put, operation="rename_subject")
+        # The PUT moves the label, so a retry after a lost response finds no
+        # subject under the old one; the rename went through if target exists
+        if resp.status_code == 404 and attempts > 1 and self._subject_label_exists(project, target):
+            self.log.info("Rename %s -> %s was applied before the retry", label, target)
+        else:
+            resp.raise_for_status()
+        self._projects.record_subject_rename(project, label, target)
+        self.log.info("Renamed subject %s -> %s", label, target)
+
+    def _subject_label_exists(self, project: str, label: str) -> bool:
+        """Ask the server, bypassing the existence cache, whether a subject label exists."""
+        encoded = label if _SAFE_LABEL_RE.fullmatch(label) else quote(label)
+        return self.conn.head(f"/data/projects/{project}/subjects/{encoded}").status_code == 200
+
+    def _experiments_by_subject(self, project: str) -> Dict[str, List[Dict[str, str]]]:
+        """Group a single project-wide experiment listing by subject label."""
+        grouped: Dict[str, List[Dict[str, str]]] = {}
+        for exp in self._projects.list_project_experiments_detailed(project):
+            grouped.setdefault(exp["subject_label"], []).append(exp)
+        return grouped
+
+    def _merge_subject(
+        self,
+        project: str,
+        label: str,
+        target: str,
+        exps: Optional[List[Dict[str, str]]] = None,
+        max_workers: int = 1,
+    ) -> Optional[str]:
+        """Move a subject's experiments to target and delete it.
+
+        Args:
+            project: Project identifier.
+            label: Source subject label.
+            target: Existing subject label to merge into.
+            exps: The source subject's experiments, if already listed;
+                fetched when omitted.
+            max_workers: Max concurrent experiment moves.
+
+        Returns:
+            None on success, otherwise the reason the merge was skipped.
+        """
+        if exps is None:
+            exps = self._projects.list_subject_experiments(project, label)
+
+        if not exps:
+            try:
+                self._projects.delete_subject(project, label)
+            except Exception as e:
+                return f"failed to delete empty subject: {e}"
+            return None
+
+        self.log.info("Merging %s -> %s: moving %d experiments", label, target, len(exps))
+
+        def _move_one(pair: Tuple[str, str]) -> Optional[str]:
+            exp_id, new_subject = pair
+            try:
+                self._projects.move_experiment_to_subject(project, exp_id, new_subject)
+                return None
+            except Exception as e:
+                self.log.error("Failed to move experiment %s: %s", exp_id, e)
+                return str(e)
+
+        # Each move is an independent PUT, so they overlap; the source is
+        # only deleted once every experiment has moved
+        moves = [(exp["ID"], target) for exp in exps]
+        errors = self._run_renames(moves, _move_one, max_workers)
+        # Moved sessions now live under target, whether or not all moves worked
+        self._projects.clear_exists_cache()
+        if any(error is not None for error in errors):
+            return "failed to move some experiments"
+
+        try:
+            self._projects.delete_subject(project, label)
+        except Exception as e:
+            self.log.warning("Experiments moved but failed to delete source %s: %s", label, e)
+        return None
+
+    @staticmethod
+    def _run_renames(
+        renames: List[Tuple[str, str]],
+        rename_one: Callable[[Tuple[str, str]], Optional[str]],
+        max_workers: int,
+    ) -> List[Optional[str]]:
+        """Apply (source, target) updates on up to max_workers threads.
+
+        Errors return in input order.
+        """
+        if len(renames) <= 1:
+            return [rename_one(pair) for pair in renames]
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(renames))) as ex:
+            return list(ex.map(rename_one, renames))
+
+
+def _compile_template(to_template: str, project: str, group_count: int) -> str:
+    """Translate a rename template into a Match.expand() template.
+
+    {project} becomes the project ID and {N} a backreference to group N;
+    placeholders for groups the pattern doesn't have stay literal.
+    """
+    parts: List[str] = []
+    pos = 0
+    for field in _TEMPLATE_FIELD_RE.finditer(to_template):
+        parts.append(to_template[pos : field.start()].replace("\\", "\\\\"))
+        name = field.group(1)
+        if name == "project":
+            parts.append(project.replace("\\", "\\\\"))
+        elif int(name) <= group_count:
+            parts.append(f"\\g<{name}>")
+        else:
+            parts.append(field.group(0))
+        pos = field.end()
+    parts.append(to_template[pos:].replace("\\", "\\\\"))
+    return "".join(parts)
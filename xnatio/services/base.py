@@ -9,12 +9,24 @@ This module provides the foundational XNATConnection class that handles:
 
 from __future__ import annotations
 
+import json
 import logging
+import random
+import threading
 import time
-from typing import Any, Callable, Optional, Tuple, TypeVar
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from itertools import islice
+from typing import Any, Callable, Dict, Generator, Iterable, List, Optional, Tuple, TypeVar
 
 import requests
 from pyxnat import Interface
+from requests.adapters import HTTPAdapter
+from requests.auth import AuthBase, HTTPBasicAuth
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None  # type: ignore[assignment]
 
 from ..config import XNATConfig
 from ..core import (
@@ -31,18 +43,73 @@ from ..core import (
 )
 
 T = TypeVar("T")
+R = TypeVar("R")
 
 # Default timeout values
 DEFAULT_CONNECT_TIMEOUT = 120  # 2 minutes
 DEFAULT_READ_TIMEOUT = 604800  # 7 days for large uploads
 
+# Keep-alive connections kept per host; sized above the largest worker pools
+DEFAULT_POOL_MAXSIZE = 32
+
+# Threads in the executor shared by leaf operations (deletes, file uploads)
+SHARED_EXECUTOR_WORKERS = 16
+
+
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+
+def decode_json(resp: requests.Response) -> Any:
+    """Parse a JSON response body, with orjson when it is installed.
+
+    The body bytes are handed to the parser directly, skipping requests'
+    text decoding; XNAT serves JSON as UTF-8.
+    """
+    return _json_loads(resp.content)
+
+
+class _XNATSessionAuth(AuthBase):
+    """HTTP Basic until XNAT issues a JSESSIONID cookie, then cookie-only.
+
+    Requests carrying the session cookie skip the Authorization header, so
+    the server resolves them from its session store instead of
+    re-authenticating the credentials each time. A 401 on such a request
+    means the session expired; it is resent once with Basic credentials and
+    the fresh cookie from that response replaces the old one.
+    """
+
+    def __init__(self, username: str, password: str) -> None:
+        self._basic = HTTPBasicAuth(username, password)
+
+    def __call__(self, r: requests.PreparedRequest) -> requests.PreparedRequest:
+        # Streamed bodies can't be resent after a 401, so they keep Basic
+        has_session = "JSESSIONID=" in r.headers.get("Cookie", "")
+        if not has_session or not isinstance(r.body, (bytes, str, type(None))):
+            return self._basic(r)
+        r.register_hook("response", self._handle_401)
+        return r
+
+    def _handle_401(self, r: requests.Response, **kwargs: Any) -> requests.Response:
+        if r.status_code != 401:
+            return r
+
+        _ = r.content  # drain so the connection can be reused
+        r.close()
+        prep = r.request.copy()
+        prep.headers.pop("Cookie", None)
+        self._basic(prep)
+        retry = r.connection.send(prep, **kwargs)
+        retry.history.append(r)
+        retry.request = prep
+        return retry
+
 
 class XNATConnection:
     """Core XNAT connection and HTTP management.
 
     This class wraps pyxnat.Interface and provides:
     - Connection lifecycle management
-    - Authenticated HTTP requests with proper error handling
+    - Authenticated HTTP requests over a pooled keep-alive session
     - Retry logic for transient network failures
     - Connection health checks
 
@@ -66,6 +133,7 @@ class XNATConnection:
         verify_tls: bool = True,
         connect_timeout: int = DEFAULT_CONNECT_TIMEOUT,
         read_timeout: int = DEFAULT_READ_TIMEOUT,
+        pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
         logger: Optional[logging.Logger] = None,
     ) -> None:
         """Initialize XNAT connection.
@@ -77,6 +145,7 @@ class XNATConnection:
             verify_tls: Whether to verify TLS certificates.
             connect_timeout: HTTP connection timeout in seconds.
             read_timeout: HTTP read timeout in seconds.
+            pool_maxsize: Keep-alive connections kept open to the server.
             logger: Optional logger instance.
 
         Raises:
@@ -97,6 +166,14 @@ class XNATConnection:
         # pyxnat Interface for object API
         self._interface: Optional[Interface] = None
 
+        # Pooled session for the raw HTTP methods below
+        self.pool_maxsize = pool_maxsize
+        self._session: Optional[requests.Session] = None
+        self._session_lock = threading.Lock()
+
+        # Worker threads shared across calls, created on first use
+        self._executor: Optional[ThreadPoolExecutor] = None
+
     @property
     def interface(self) -> Interface:
         """Get or create the pyxnat Interface.
@@ -112,6 +189,104 @@ class XNATConnection:
             )
         return self._interface
 
+    @property
+    def session(self) -> requests.Session:
+        """Get or create the pooled HTTP session used by get/post/put/delete.
+
+        Requests reuse keep-alive connections without constructing the
+        pyxnat Interface (which probes the server on creation). Credentials
+        are sent until XNAT sets a JSESSIONID cookie; later requests
+        authenticate with the cookie alone.
+        """
+        if self._session is None:
+            with self._session_lock:
+                if self._session is None:
+                    session = requests.Session()
+                    session.auth = _XNATSessionAuth(self.username, self._password)
+                    session.verify = self.verify_tls
+                    adapter = HTTPAdapter(
+                        pool_connections=4,
+                        pool_maxsize=self.pool_maxsize,
+                    )
+                    session.mount("https://", adapter)
+                    session.mount("http://", adapter)
+                    self._session = session
+        return self._session
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        """Get or create the thread pool shared by parallel leaf operations.
+
+        Threads stay alive between calls and keep using the pooled session's
+        keep-alive connections. Tasks run here must not submit further work
+        to this executor and wait on it.
+        """
+        if self._executor is None:
+            with self._session_lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=SHARED_EXECUTOR_WORKERS, thread_name_prefix="xnatio"
+                    )
+        return self._executor
+
+    def iter_concurrent(
+        self, fn: Callable[[T], R], items: Iterable[T], max_workers: int
+    ) -> Generator[Tuple[T, R], None, None]:
+        """Apply fn to items on the shared executor, yielding as calls finish.
+
+        At most max_workers calls are in flight at once. Closing the iterator
+        early stops further submissions and cancels calls not yet started.
+
+        Args:
+            fn: Function to call for each item.
+            items: Items to process.
+            max_workers: Most calls in flight at once for this map.
+
+        Yields:
+            (item, result) pairs in completion order.
+        """
+        remaining = iter(items)
+        futures: Dict[Future[R], T] = {}
+        executor = self.executor
+
+        try:
+            for item in islice(remaining, max_workers):
+                futures[executor.submit(fn, item)] = item
+            while futures:
+                done, _ = wait(futures, return_when=FIRST_COMPLETED)
+                for future in done:
+                    item = futures.pop(future)
+                    for next_item in islice(remaining, 1):
+                        futures[executor.submit(fn, next_item)] = next_item
+                    yield item, future.result()
+        finally:
+            for future in futures:
+                future.cancel()
+
+    def map_concurrent(self, fn: Callable[[T], R], items: Iterable[T], max_workers: int) -> List[R]:
+        """Apply fn to items on the shared executor, max_workers at a time.
+
+        Args:
+            fn: Function to call for each item.
+            items: Items to process.
+            max_workers: Most calls in flight at once for this map.
+
+        Returns:
+            Results in the same order as items.
+        """
+        results: Dict[int, R] = {}
+        for (index, _), result in self.iter_concurrent(
+            lambda pair: fn(pair[1]), enumerate(items), max_workers
+        ):
+            results[index] = result
+        return [results[index] for index in range(len(results))]
+
+    def _url(self, path: str) -> str:
+        """Join an API path onto the server URL."""
+        if path.startswith("/"):
+            return self.server + path
+        return f"{self.server}/{path}"
+
     @classmethod
     def from_config(cls, cfg: XNATConfig) -> "XNATConnection":
         """Create connection from configuration dictionary.
@@ -187,14 +362,40 @@ class XNATConnection:
         Raises:
             Various HTTP and network errors.
         """
-        return self.interface.get(
-            path,
+        return self.session.get(
+            self._url(path),
             params=params,
             timeout=timeout or self.http_timeouts,
             stream=stream,
             **kwargs,
         )
 
+    def head(
+        self,
+        path: str,
+        *,
+        params: Optional[dict[str, Any]] = None,
+        timeout: Optional[Tuple[int, int]] = None,
+        **kwargs: Any,
+    ) -> requests.Response:
+        """Perform authenticated HEAD request.
+
+        Args:
+            path: API path.
+            params: Query parameters.
+            timeout: Optional timeout override.
+            **kwargs: Additional arguments for requests.
+
+        Returns:
+            Response object.
+        """
+        return self.session.head(
+            self._url(path),
+            params=params,
+            timeout=timeout or self.http_timeouts,
+            **kwargs,
+        )
+
     def post(
         self,
         path: str,
@@ -222,8 +423,8 @@ class XNATConnection:
         Returns:
             Response object.
         """
-        return self.interface.post(
-            path,
+        return self.session.post(
+            self._url(path),
             params=params,
             data=data,
             json=json,
@@ -258,8 +459,8 @@ class XNATConnection:
         Returns:
             Response object.
         """
-        return self.interface.put(
-            path,
+        return self.session.put(
+            self._url(path),
             params=params,
             data=data,
             json=json,
@@ -287,8 +488,8 @@ class XNATConnection:
         Returns:
             Response object.
         """
-        return self.interface.delete(
-            path,
+        return self.session.delete(
+            self._url(path),
             params=params,
             timeout=timeout or self.http_timeouts,
             **kwargs,
@@ -304,17 +505,21 @@ class XNATConnection:
         *,
         max_retries: int = 4,
         backoff_base: float = 2.0,
+        max_backoff: float = 30.0,
         operation: str = "operation",
     ) -> T:
         """Execute function with retry logic for transient network failures.
 
-        Retries with exponential backoff (2s, 4s, 8s, 16s by default) when
-        network-related exceptions occur.
+        Retries with exponential backoff when network-related exceptions
+        occur. Each wait is drawn uniformly from zero up to the backoff step
+        (2s, 4s, 8s, 16s by default, capped at max_backoff) so parallel
+        workers that fail together don't retry in lockstep.
 
         Args:
             fn: Function to execute.
             max_retries: Maximum retry attempts.
             backoff_base: Base for exponential backoff in seconds.
+            max_backoff: Upper bound on any single wait in seconds.
             operation: Operation name for logging.
 
         Returns:
@@ -338,7 +543,7 @@ class XNATConnection:
             ) as e:
                 last_exc = e
                 if attempt < max_retries:
-                    wait_time = backoff_base ** (attempt + 1)
+                    wait_time = random.uniform(0, min(max_backoff, backoff_base ** (attempt + 1)))
                     self.log.warning(
                         "Network error during %s (attempt %d/%d): %s. Retrying in %.1fs",
                         operation,
@@ -370,6 +575,12 @@ class XNATConnection:
             except Exception:
                 pass  # Best effort cleanup
             self._interface = None
+        if self._session is not None:
+            self._session.close()
+            self._session = None
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
 
     def __enter__(self) -> "XNATConnection":
         return self
@@ -380,4 +591,4 @@ class XNATConnection:
     @property
     def is_connected(self) -> bool:
         """Check if connection is established."""
-        return self._interface is not None
+        return self._interface is not None or self._session is not None
@@ -9,12 +9,19 @@ This module handles file downloads:
 
 from __future__ import annotations
 
+import logging
+import os
+import shutil
+import time
 import zipfile
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import List, Optional
+from typing import Callable, List, Mapping, Optional, Union
 from urllib.parse import quote
 
+import requests
+import urllib3
+
 from ..core import (
     LogContext,
     # Exceptions
@@ -28,7 +35,30 @@ from ..core import (
     validate_subject_id,
     validate_workers,
 )
-from .base import XNATConnection
+from .base import XNATConnection, decode_json
+
+# Bytes read per iteration when streaming a download to disk
+DOWNLOAD_CHUNK_SIZE = 4 * 1024 * 1024
+
+# Times a broken download stream is resumed with a Range request, and the
+# cap in seconds on the wait between attempts
+DOWNLOAD_RETRIES = 5
+DOWNLOAD_MAX_BACKOFF = 30.0
+
+# Errors that break a response body mid-stream; raw reads raise urllib3's
+# exceptions directly rather than requests' wrappers
+_STREAM_ERRORS = (
+    requests.exceptions.ConnectionError,
+    requests.exceptions.ChunkedEncodingError,
+    requests.exceptions.Timeout,
+    urllib3.exceptions.HTTPError,
+)
+
+# Bytes copied per read when extracting a ZIP member
+EXTRACT_COPY_SIZE = 1024 * 1024
+
+# Resource label characters replaced in local ZIP filenames
+_FILENAME_UNSAFE = str.maketrans("/ ", "__")
 
 
 class DownloadService:
@@ -58,7 +88,11 @@ class DownloadService:
     def _download_stream(self, url: str, out_path: Path) -> None:
         """Stream a URL to a local file.
 
-        Logs progress at 5MB intervals.
+        Logs progress at 5MB intervals. If the stream breaks mid-body, the
+        request is reissued, up to DOWNLOAD_RETRIES times. The file is
+        continued from the last byte written only when the server confirms,
+        via If-Range and Content-Range, that it is sending the rest of the
+        same body; otherwise the download starts over.
 
         Args:
             url: XNAT API URL to download.
@@ -66,25 +100,92 @@ class DownloadService:
         """
         out_path.parent.mkdir(parents=True, exist_ok=True)
 
-        with self.conn.get(url, stream=True) as resp:
-            resp.raise_for_status()
+        first = self.conn.get(url, stream=True)
+        resp: Optional[requests.Response] = first
+        try:
+            first.raise_for_status()
 
             with open(out_path, "wb") as f:
+                _preallocate(f.fileno(), _body_size(first.headers))
+                validator = _resume_validator(first.headers)
                 total = 0
                 report_threshold = 5 * 1024 * 1024  # 5 MB
-                next_report = report_threshold
-
-                for chunk in resp.iter_content(chunk_size=1024 * 1024):
-                    if not chunk:
-                        continue
-                    f.write(chunk)
-                    total += len(chunk)
-
-                    if total >= next_report:
-                        self.log.info("%s: downloaded %s bytes", out_path.name, f"{total:,}")
-                        next_report += report_threshold
+                # Progress is skipped entirely when INFO is filtered out
+                next_report = (
+                    report_threshold if self.log.isEnabledFor(logging.INFO) else float("inf")
+                )
+                log_info = self.log.info
+                write = f.write
+
+                def _copy_body(body: requests.Response) -> None:
+                    nonlocal total, next_report
+                    # Read urllib3's response directly rather than through
+                    # iter_content's generator; decoding keeps gzip transfers
+                    # byte-identical to what iter_content produced
+                    read = body.raw.read
+                    while True:
+                        chunk = read(DOWNLOAD_CHUNK_SIZE, decode_content=True)
+                        if not chunk:
+                            return
+                        write(chunk)
+                        total += len(chunk)
+
+                        if total >= next_report:
+                            log_info("%s: downloaded %s bytes", out_path.name, f"{total:,}")
+                            next_report += report_threshold
+
+                try:
+                    attempt = 0
+                    while True:
+                        try:
+                            if resp is None:
+                                headers = None
+                                if validator and total:
+                                    headers = {"Range": f"bytes={total}-", "If-Range": validator}
+                                resp = self.conn.get(url, stream=True, headers=headers)
+                                resp.raise_for_status()
+                                if headers is None or not _resumes_at(resp, total):
+                                    if resp.status_code == 206:
+                                        # A range of some other offset or body
+                                        resp.close()
+                                        resp = None
+                                        resp = self.conn.get(url, stream=True)
+                                        resp.raise_for_status()
+                                    # The whole body is being sent again
+                                    validator = _resume_validator(resp.headers)
+                                    f.seek(0)
+                                    total = 0
+                                    next_report = min(next_report, report_threshold)
+                            _copy_body(resp)
+                            break
+                        except _STREAM_ERRORS as e:
+                            if resp is not None:
+                                resp.close()
+                                resp = None
+                            if attempt >= DOWNLOAD_RETRIES:
+                                raise
+                            attempt += 1
+                            wait_time = min(DOWNLOAD_MAX_BACKOFF, 2.0**attempt)
+                            self.log.warning(
+                                "%s: stream interrupted at %s bytes (attempt %d/%d): %s. "
+                                "Resuming in %.1fs",
+                                out_path.name,
+                                f"{total:,}",
+                                attempt,
+                                DOWNLOAD_RETRIES,
+                                e,
+                                wait_time,
+                            )
+                            time.sleep(wait_time)
+                finally:
+                    # Drop any preallocated tail the body didn't fill; on failure
+                    # this leaves only the bytes actually received
+                    f.truncate(total)
 
                 self.log.info("%s: download complete (%s bytes)", out_path.name, f"{total:,}")
+        finally:
+            if resp is not None:
+                resp.close()
 
     # =========================================================================
     # Scan Downloads
@@ -128,6 +229,9 @@ class DownloadService:
         subject: str,
         session: str,
         out_dir: Path,
+        *,
+        parallel: bool = True,
+        max_workers: int = 4,
     ) -> List[Path]:
         """Download all session-level resources as separate ZIPs.
 
@@ -136,34 +240,39 @@ class DownloadService:
             subject: Subject identifier.
             session: Session identifier.
             out_dir: Output directory.
+            parallel: Download resources in parallel.
+            max_workers: Max parallel workers.
 
         Returns:
-            List of downloaded resource ZIP paths.
+            List of downloaded resource ZIP paths, in resource order.
         """
         project = validate_project_id(project)
         subject = validate_subject_id(subject)
         session = validate_session_id(session)
-
-        # List resources using object API
-        sess = self.conn.interface.select.project(project).subject(subject).experiment(session)
-
-        try:
-            labels = sess.resources().get("label")
-        except Exception as e:
-            self.log.debug("Could not get resource labels, falling back: %s", e)
-            labels = [r for r in (sess.resources().get() or [])]
+        max_workers = validate_workers(max_workers, "max_workers")
 
         base = f"/data/projects/{project}/subjects/{subject}/experiments/{session}"
-        downloaded: List[Path] = []
 
-        for label in labels:
-            label_q = quote(label)
-            filename_safe = label.replace("/", "_").replace(" ", "_")
+        # One listing request, trimmed to the label column, returns every
+        # resource label; sessions without resources stop here
+        resp = self.conn.get(f"{base}/resources", params={"format": "json", "columns": "label"})
+        resp.raise_for_status()
+        results = decode_json(resp).get("ResultSet", {}).get("Result", []) or []
+        labels: List[str] = [entry["label"] for entry in results if entry.get("label")]
+        if not labels:
+            return []
+
+        def _download_label(label: str) -> Path:
+            filename_safe = label.translate(_FILENAME_UNSAFE)
             out = out_dir / f"resources_{filename_safe}.zip"
-            self._download_stream(f"{base}/resources/{label_q}/files?format=zip", out)
-            downloaded.append(out)
+            self._download_stream(f"{base}/resources/{quote(label)}/files?format=zip", out)
+            return out
 
-        return downloaded
+        # Each resource is an independent ZIP stream
+        if parallel and len(labels) > 1:
+            with ThreadPoolExecutor(max_workers=min(max_workers, len(labels))) as ex:
+                return list(ex.map(_download_label, labels))
+        return [_download_label(label) for label in labels]
 
     def download_assessor_or_recon_resources_zip(
         self,
@@ -219,6 +328,7 @@ class DownloadService:
         include_recons: bool = False,
         parallel: bool = True,
         max_workers: int = 4,
+        extract: bool = False,
     ) -> Path:
         """Download all data for a session.
 
@@ -234,6 +344,9 @@ class DownloadService:
             include_recons: Include reconstruction resources.
             parallel: Download in parallel.
             max_workers: Max parallel workers.
+            extract: Extract each ZIP as soon as it finishes downloading,
+                using the layout of extract_session_downloads(). The ZIPs
+                are left in place.
 
         Returns:
             Path to session directory containing downloads.
@@ -256,9 +369,16 @@ class DownloadService:
             session_dir.mkdir(parents=True, exist_ok=True)
 
             # Build task list
-            tasks = [
+            tasks: List[Callable[[], Union[Path, List[Path], None]]] = [
                 lambda: self.download_scans_zip(project, subject, session, session_dir),
-                lambda: self.download_session_resources_zip(project, subject, session, session_dir),
+                lambda: self.download_session_resources_zip(
+                    project,
+                    subject,
+                    session,
+                    session_dir,
+                    parallel=parallel,
+                    max_workers=max_workers,
+                ),
             ]
 
             if include_assessors:
@@ -275,13 +395,38 @@ class DownloadService:
                     )
                 )
 
-            # Execute downloads
+            # Execute downloads; with extract, each finished ZIP is handed to
+            # an extraction pool so unpacking overlaps the remaining downloads
             if parallel and len(tasks) > 1:
-                with ThreadPoolExecutor(max_workers=min(max_workers, len(tasks))) as ex:
-                    list(ex.map(lambda fn: fn(), tasks))
+                workers = min(max_workers, len(tasks))
+                with ThreadPoolExecutor(max_workers=workers) as ex:
+                    futures = [ex.submit(fn) for fn in tasks]
+                    try:
+                        # Completion order, so a failed download raises
+                        # without waiting on slower ones ahead of it
+                        if extract:
+                            with ThreadPoolExecutor(max_workers=workers) as extractor:
+                                extractions = [
+                                    extractor.submit(self._extract_zip, zip_path, session_dir)
+                                    for future in as_completed(futures)
+                                    for zip_path in _zip_paths(future.result())
+                                ]
+                                for extraction in extractions:
+                                    extraction.result()
+                        else:
+                            for future in as_completed(futures):
+                                future.result()
+                    except BaseException:
+                        # Don't start downloads that are still queued
+                        for future in futures:
+                            future.cancel()
+                        raise
             else:
                 for fn in tasks:
-                    fn()
+                    result = fn()
+                    if extract:
+                        for zip_path in _zip_paths(result):
+                            self._extract_zip(zip_path, session_dir)
 
             self.log.info("Session download complete: %s", session_dir)
 
@@ -300,7 +445,13 @@ class DownloadService:
     # ZIP Extraction
     # =========================================================================
 
-    def extract_session_downloads(self, session_dir: Path) -> None:
+    def extract_session_downloads(
+        self,
+        session_dir: Path,
+        *,
+        parallel: bool = True,
+        max_workers: int = 4,
+    ) -> None:
         """Extract all downloaded ZIPs into organized folders.
 
         Layout after extraction:
@@ -311,30 +462,154 @@ class DownloadService:
 
         Args:
             session_dir: Session directory containing ZIP files.
+            parallel: Extract ZIPs in parallel.
+            max_workers: Max parallel workers.
         """
         session_dir = validate_path_exists(session_dir, must_be_dir=True)
+        max_workers = validate_workers(max_workers, "max_workers")
 
         with LogContext("extract_session", self.log, session_dir=str(session_dir)):
-            for zip_path in sorted(session_dir.glob("*.zip")):
-                name = zip_path.name
-
-                # Determine target directory based on filename
-                if name == "scans.zip":
-                    target_dir = session_dir / "scans"
-                elif name.startswith("resources_") and name.endswith(".zip"):
-                    label = name[len("resources_") : -len(".zip")]
-                    target_dir = session_dir / "resources" / label
-                elif name == "assessor_resources.zip":
-                    target_dir = session_dir / "assessors"
-                elif name == "recon_resources.zip":
-                    target_dir = session_dir / "reconstructions"
-                else:
-                    target_dir = session_dir / zip_path.stem
-
-                target_dir.mkdir(parents=True, exist_ok=True)
-                self.log.info("Extracting %s -> %s", name, target_dir)
-
-                with zipfile.ZipFile(zip_path) as zf:
-                    zf.extractall(target_dir)
-
-                self.log.info("Extracted %s", name)
+            zip_paths = sorted(session_dir.glob("*.zip"))
+
+            # Each ZIP unpacks into its own folder; zlib drops the GIL while
+            # inflating, so threads overlap the decompression
+            if parallel and len(zip_paths) > 1:
+                with ThreadPoolExecutor(max_workers=min(max_workers, len(zip_paths))) as ex:
+                    futures = [
+                        ex.submit(self._extract_zip, zip_path, session_dir)
+                        for zip_path in zip_paths
+                    ]
+                    for future in futures:
+                        future.result()
+            else:
+                for zip_path in zip_paths:
+                    self._extract_zip(zip_path, session_dir)
+
+    def _extract_zip(self, zip_path: Path, session_dir: Path) -> None:
+        """Extract one downloaded ZIP into its folder under session_dir."""
+        name = zip_path.name
+
+        # Determine target directory based on filename
+        if name == "scans.zip":
+            target_dir = session_dir / "scans"
+        elif name.startswith("resources_") and name.endswith(".zip"):
+            label = name[len("resources_") : -len(".zip")]
+            target_dir = session_dir / "resources" / label
+        elif name == "assessor_resources.zip":
+            target_dir = session_dir / "assessors"
+        elif name == "recon_resources.zip":
+            target_dir = session_dir / "reconstructions"
+        else:
+            target_dir = session_dir / zip_path.stem
+
+        target_dir.mkdir(parents=True, exist_ok=True)
+        self.log.info("Extracting %s -> %s", name, target_dir)
+
+        # The central directory is read once, through a 1 MiB buffered
+        # reader, and the open archive is handed to the member copy
+        with open(zip_path, "rb", buffering=EXTRACT_COPY_SIZE) as fh, zipfile.ZipFile(
+            fh, "r", allowZip64=True
+        ) as zf:
+            _extract_members(zf, target_dir)
+
+        self.log.info("Extracted %s", name)
+
+
+def _extract_members(zf: zipfile.ZipFile, target_dir: Path) -> None:
+    """Copy every member of an open ZIP under target_dir.
+
+    Members are copied with large reads straight into preallocated files;
+    extractall copies through 64 KiB reads. They are read in archive order
+    so the source is scanned front to back, and every directory is created
+    before any data is written.
+    """
+    files = []
+    dirs = set()
+    for info in sorted(zf.infolist(), key=lambda i: (i.header_offset, i.filename)):
+        dest = _member_path(target_dir, info.filename)
+        if info.is_dir():
+            dirs.add(dest)
+        else:
+            dirs.add(dest.parent)
+            files.append((info, dest))
+    for directory in sorted(dirs):
+        directory.mkdir(parents=True, exist_ok=True)
+
+    for info, dest in files:
+        with zf.open(info) as src, open(dest, "wb") as dst:
+            _preallocate(dst.fileno(), info.file_size)
+            shutil.copyfileobj(src, dst, EXTRACT_COPY_SIZE)
+
+
+def _zip_paths(result: Union[Path, List[Path], None]) -> List[Path]:
+    """Normalize a download task's return value to a list of ZIP paths."""
+    if result is None:
+        return []
+    if isinstance(result, Path):
+        return [result]
+    return result
+
+
+def _preallocate(fd: int, size: int) -> None:
+    """Reserve size bytes for a file about to be written sequentially.
+
+    Allocating the whole file once lets the filesystem lay it out in few
+    extents instead of growing it chunk by chunk. Best effort: a no-op
+    where posix_fallocate is unavailable or refused.
+    """
+    fallocate = getattr(os, "posix_fallocate", None)
+    if fallocate is None or size <= 0:
+        return
+    try:
+        fallocate(fd, 0, size)
+    except OSError:
+        pass
+
+
+def _resume_validator(headers: Mapping[str, str]) -> Optional[str]:
+    """Return the If-Range validator for a response, or None if it can't resume.
+
+    Weak ETags aren't allowed in If-Range. Content-encoded bodies are written
+    decoded, so offsets into the file don't match the server's byte ranges.
+    """
+    if headers.get("Content-Encoding"):
+        return None
+    etag = headers.get("ETag")
+    if etag and not etag.startswith("W/"):
+        return etag
+    return headers.get("Last-Modified") or None
+
+
+def _resumes_at(resp: requests.Response, offset: int) -> bool:
+    """Whether resp is the unencoded rest of the body, starting at offset."""
+    if resp.status_code != 206 or resp.headers.get("Content-Encoding"):
+        return False
+    return str(resp.headers.get("Content-Range", "")).startswith(f"bytes {offset}-")
+
+
+def _body_size(headers: Mapping[str, str]) -> int:
+    """Return the decoded body size from Content-Length, or 0 if unknown.
+
+    Content-encoded bodies report the encoded size, so they count as unknown.
+    """
+    length = headers.get("Content-Length")
+    if not length or headers.get("Content-Encoding"):
+        return 0
+    try:
+        return int(length)
+    except ValueError:
+        return 0
+
+
+def _member_path(target_dir: Path, filename: str) -> Path:
+    """Map a ZIP member name under target_dir the way ZipFile.extract does.
+
+    Drive letters, empty, '.' and '..' components are dropped so members
+    can't escape target_dir.
+    """
+    arcname = filename.replace("/", os.path.sep)
+    if os.path.altsep:
+        arcname = arcname.replace(os.path.altsep, os.path.sep)
+    arcname = os.path.splitdrive(arcname)[1]
+    parts = [p for p in arcname.split(os.path.sep) if p not in ("", os.path.curdir, os.path.pardir)]
+    return target_dir.joinpath(*parts)
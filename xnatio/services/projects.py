@@ -8,7 +8,9 @@ This module handles CRUD operations for XNAT container hierarchy:
 
 from __future__ import annotations
 
-from typing import Dict, List, Optional
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from urllib.parse import quote
 
 from ..core import (
@@ -23,7 +25,10 @@ from ..core import (
     validate_session_id,
     validate_subject_id,
 )
-from .base import XNATConnection
+from .base import XNATConnection, decode_json
+
+# Seconds an existence check result is reused before asking the server again
+EXISTS_CACHE_TTL = 30.0
 
 
 class ProjectService:
@@ -46,6 +51,50 @@ class ProjectService:
         self.log = get_logger(__name__)
         self._audit = get_audit_logger()
 
+        # (kind, *ids) -> (checked_at, exists); kept current by our own
+        # inserts and deletes, and expired after EXISTS_CACHE_TTL
+        self._exists_cache: Dict[Tuple[str, ...], Tuple[float, bool]] = {}
+        self._exists_lock = threading.Lock()
+
+    def _cached_exists(self, key: Tuple[str, ...], check: Callable[[], bool]) -> bool:
+        """Return a recent existence result for key, or run check and record it."""
+        with self._exists_lock:
+            hit = self._exists_cache.get(key)
+        if hit is not None and time.monotonic() - hit[0] < EXISTS_CACHE_TTL:
+            return hit[1]
+        exists = check()
+        self._remember_exists(key, exists)
+        return exists
+
+    def clear_exists_cache(self) -> None:
+        """Forget all cached existence results.
+
+        Call this after projects, subjects or sessions are created, renamed
+        or deleted outside this service.
+        """
+        with self._exists_lock:
+            self._exists_cache.clear()
+
+    def record_subject_rename(self, project: str, label: str, target: str) -> None:
+        """Update cached existence results after a subject is relabelled.
+
+        Cached session checks are keyed by the old label, so they are all
+        dropped along with the subject's old name.
+
+        Args:
+            project: Project identifier.
+            label: The subject's old label.
+            target: The subject's new label.
+        """
+        self.clear_exists_cache()
+        self._remember_exists(("subject", project, label), False)
+        self._remember_exists(("subject", project, target), True)
+
+    def _remember_exists(self, key: Tuple[str, ...], exists: bool) -> None:
+        """Record a known existence state, e.g. after an insert or delete."""
+        with self._exists_lock:
+            self._exists_cache[key] = (time.monotonic(), exists)
+
     # =========================================================================
     # Project Operations
     # =========================================================================
@@ -79,6 +128,7 @@ class ProjectService:
 
             try:
                 project.insert()
+                self._remember_exists(("project", project_id), True)
                 self.log.info("Created project: %s", project_id)
 
                 if description:
@@ -121,7 +171,10 @@ class ProjectService:
             True if project exists.
         """
         project_id = validate_project_id(project_id)
-        return self.conn.interface.select.project(project_id).exists()
+        return self._cached_exists(
+            ("project", project_id),
+            lambda: self.conn.interface.select.project(project_id).exists(),
+        )
 
     # =========================================================================
     # Subject Operations
@@ -150,16 +203,15 @@ class ProjectService:
         project = validate_project_id(project)
         subject = validate_subject_id(subject)
 
-        subj = self.conn.interface.select.project(project).subject(subject)
-
         try:
-            if subj.exists():
+            if self.subject_exists(project, subject):
                 return True
 
             if not auto_create:
                 raise ResourceNotFoundError("subject", subject, project)
 
-            subj.insert()
+            self.conn.interface.select.project(project).subject(subject).insert()
+            self._remember_exists(("subject", project, subject), True)
             self.log.debug("Created subject %s in project %s", subject, project)
             return True
 
@@ -181,7 +233,18 @@ class ProjectService:
         """
         project = validate_project_id(project)
         subject = validate_subject_id(subject)
-        return self.conn.interface.select.project(project).subject(subject).exists()
+
+        def _check() -> bool:
+            # A HEAD answers with the status alone, without building pyxnat
+            # objects or transferring the subject document
+            resp = self.conn.head(f"/data/projects/{project}/subjects/{subject}")
+            if resp.status_code == 200:
+                return True
+            if resp.status_code == 404:
+                return False
+            return bool(self.conn.interface.select.project(project).subject(subject).exists())
+
+        return self._cached_exists(("subject", project, subject), _check)
 
     def list_subjects(self, project: str) -> List[Dict[str, str]]:
         """List all subjects in a project.
@@ -194,22 +257,25 @@ class ProjectService:
         """
         project = validate_project_id(project)
 
-        with LogContext("list_subjects", self.log, project=project, log_entry_exit=False):
+        with LogContext("list_subjects", self.log, project=project, log_completion=False):
             resp = self.conn.get(
                 f"/data/projects/{project}/subjects",
                 params={"columns": "ID,label", "format": "json"},
             )
             resp.raise_for_status()
 
-            payload = resp.json()
+            payload = decode_json(resp)
             results = payload.get("ResultSet", {}).get("Result", []) or []
 
+            # ResultSet values are JSON strings and XNAT IDs and labels
+            # can't contain whitespace, so rows are used without coercion
             subjects: List[Dict[str, str]] = []
+            append = subjects.append
             for entry in results:
-                subj_id = str(entry.get("ID") or "").strip()
-                label = str(entry.get("label") or "").strip()
+                subj_id = entry.get("ID")
+                label = entry.get("label")
                 if subj_id and label:
-                    subjects.append({"ID": subj_id, "label": label})
+                    append({"ID": subj_id, "label": label})
 
             return subjects
 
@@ -236,6 +302,7 @@ class ProjectService:
                 raise ResourceNotFoundError("subject", subject, project)
 
             subj.delete()
+            self._remember_exists(("subject", project, subject), False)
             self.log.info("Deleted subject %s from project %s", subject, project)
 
             self._audit.log_operation(
@@ -276,16 +343,16 @@ class ProjectService:
         subject = validate_subject_id(subject)
         session = validate_session_id(session)
 
-        sess = self.conn.interface.select.project(project).subject(subject).experiment(session)
-
         try:
-            if sess.exists():
+            if self.session_exists(project, subject, session):
                 return True
 
             if not auto_create:
                 raise ResourceNotFoundError("session", session, project)
 
+            sess = self.conn.interface.select.project(project).subject(subject).experiment(session)
             sess.insert(experiments=session_type)
+            self._remember_exists(("session", project, subject, session), True)
             self.log.debug(
                 "Created session %s for subject %s in project %s",
                 session,
@@ -314,11 +381,14 @@ class ProjectService:
         project = validate_project_id(project)
         subject = validate_subject_id(subject)
         session = validate_session_id(session)
-        return (
-            self.conn.interface.select.project(project)
-            .subject(subject)
-            .experiment(session)
-            .exists()
+        return self._cached_exists(
+            ("session", project, subject, session),
+            lambda: (
+                self.conn.interface.select.project(project)
+                .subject(subject)
+                .experiment(session)
+                .exists()
+            ),
         )
 
     def list_subject_experiments(self, project: str, subject: str) -> List[Dict[str, str]]:
@@ -335,21 +405,22 @@ class ProjectService:
         subject = validate_subject_id(subject)
 
         resp = self.conn.get(
-            f"/data/projects/{project}/subjects/{quote(subject)}/experiments",
+            f"/data/projects/{project}/subjects/{subject}/experiments",
             params={"format": "json"},
         )
         resp.raise_for_status()
 
-        payload = resp.json()
+        payload = decode_json(resp)
         results = payload.get("ResultSet", {}).get("Result", []) or []
 
         experiments: List[Dict[str, str]] = []
         for entry in results:
-            exp_id = str(entry.get("ID") or entry.get("id") or "").strip()
-            label = str(entry.get("label") or "").strip()
-            xsi_type = str(entry.get("xsiType") or "").strip()
+            get = entry.get
+            exp_id = get("ID") or get("id")
             if exp_id:
-                experiments.append({"ID": exp_id, "label": label, "xsiType": xsi_type})
+                experiments.append(
+                    {"ID": exp_id, "label": get("label") or "", "xsiType": get("xsiType") or ""}
+                )
 
         return experiments
 
@@ -371,7 +442,7 @@ class ProjectService:
         project = validate_project_id(project)
         subject = validate_subject_id(subject)
 
-        url = f"/data/projects/{project}/subjects/{quote(subject)}/experiments"
+        url = f"/data/projects/{project}/subjects/{subject}/experiments"
         params = {
             "format": "json",
             "columns": "ID,label,xsiType,date,time,start_time,insert_date,insert_time",
@@ -385,25 +456,46 @@ class ProjectService:
             resp = self.conn.get(url, params={"format": "json"})
             resp.raise_for_status()
 
-        payload = resp.json()
+        payload = decode_json(resp)
+        results = payload.get("ResultSet", {}).get("Result", []) or []
+
+        return [row for row in map(_detailed_experiment_row, results) if row["ID"]]
+
+    def list_project_experiments_detailed(self, project: str) -> List[Dict[str, str]]:
+        """List all experiments in a project with timing metadata.
+
+        One request replaces a list_subject_experiments_detailed() call per
+        subject when the whole project is being processed.
+
+        Args:
+            project: Project identifier.
+
+        Returns:
+            List of dicts with the same keys as list_subject_experiments_detailed(),
+            plus 'subject_label'.
+        """
+        project = validate_project_id(project)
+
+        resp = self.conn.get(
+            f"/data/projects/{project}/experiments",
+            params={
+                "format": "json",
+                "columns": (
+                    "ID,label,subject_label,xsiType,date,time,start_time,insert_date,insert_time"
+                ),
+            },
+        )
+        resp.raise_for_status()
+
+        payload = decode_json(resp)
         results = payload.get("ResultSet", {}).get("Result", []) or []
 
         experiments: List[Dict[str, str]] = []
         for entry in results:
-            exp_id = str(entry.get("ID") or entry.get("id") or "").strip()
-            if not exp_id:
-                continue
-            experiments.append(
-                {
-                    "ID": exp_id,
-                    "label": str(entry.get("label") or "").strip(),
-                    "xsiType": str(entry.get("xsiType") or "").strip(),
-                    "date": str(entry.get("date") or entry.get("session_date") or "").strip(),
-                    "time": str(entry.get("time") or entry.get("start_time") or "").strip(),
-                    "insert_date": str(entry.get("insert_date") or "").strip(),
-                    "insert_time": str(entry.get("insert_time") or "").strip(),
-                }
-            )
+            row = _detailed_experiment_row(entry)
+            if row["ID"]:
+                row["subject_label"] = entry.get("subject_label") or ""
+                experiments.append(row)
 
         return experiments
 
@@ -483,3 +575,21 @@ class ProjectService:
                 user=self.conn.username,
                 success=True,
             )
+
+
+def _detailed_experiment_row(entry: Dict[str, Any]) -> Dict[str, str]:
+    """Normalize one experiment listing entry to the detailed-listing keys.
+
+    Identifier columns are used as returned; only the free-form date and
+    time columns are stripped.
+    """
+    get = entry.get
+    return {
+        "ID": get("ID") or get("id") or "",
+        "label": get("label") or "",
+        "xsiType": get("xsiType") or "",
+        "date": (get("date") or get("session_date") or "").strip(),
+        "time": (get("time") or get("start_time") or "").strip(),
+        "insert_date": (get("insert_date") or "").strip(),
+        "insert_time": (get("insert_time") or "").strip(),
+    }
@@ -9,8 +9,10 @@ This module handles scan-level operations:
 from __future__ import annotations
 
 import re
-from concurrent.futures import ThreadPoolExecutor
-from typing import Any, Dict, List, Optional
+import threading
+from typing import Any, Dict, Generator, List, Optional, Tuple
+
+import requests
 
 from ..core import (
     # Exceptions
@@ -24,9 +26,15 @@ from ..core import (
     validate_subject_id,
     validate_workers,
 )
-from .base import XNATConnection
+from .base import XNATConnection, decode_json
 from .projects import ProjectService
 
+# Scan ID inside a scan URI such as /data/experiments/E1/scans/3
+_SCAN_URI_RE = re.compile(r"/scans/(\d+)")
+
+# Reported for scans skipped once a deletion run has failed too often
+_NOT_ATTEMPTED = "not attempted: too many failed deletions"
+
 
 class ScanService:
     """Service for scan operations.
@@ -38,16 +46,38 @@ class ScanService:
     - Scan attribute management
     """
 
-    def __init__(self, connection: XNATConnection) -> None:
+    def __init__(
+        self, connection: XNATConnection, projects: Optional[ProjectService] = None
+    ) -> None:
         """Initialize scan service.
 
         Args:
             connection: XNAT connection instance.
+            projects: Project service to share, so subjects and sessions
+                already ensured by other services aren't checked again.
         """
         self.conn = connection
         self.log = get_logger(__name__)
         self._audit = get_audit_logger()
-        self._projects = ProjectService(connection)
+        self._projects = projects or ProjectService(connection)
+
+        # (project, subject, session) -> highest scan ID known to exist, so
+        # consecutive add_scan calls don't relist the session each time
+        self._scan_id_cache: Dict[Tuple[str, str, str], int] = {}
+        self._scan_id_lock = threading.Lock()
+
+    def invalidate_scan_cache(self, project: str, subject: str, session: str) -> None:
+        """Forget the cached highest scan ID for a session.
+
+        Call this after scans are created or deleted outside this service.
+
+        Args:
+            project: Project identifier.
+            subject: Subject identifier.
+            session: Session identifier.
+        """
+        with self._scan_id_lock:
+            self._scan_id_cache.pop((project, subject, session), None)
 
     # =========================================================================
     # Scan Listing
@@ -72,44 +102,50 @@ class ScanService:
         project = validate_project_id(project)
         subject = validate_subject_id(subject)
         session = validate_session_id(session)
+        return self._list_scans(project, subject, session)
 
+    def _list_scans(self, project: str, subject: str, session: str) -> List[str]:
+        """List scan IDs for identifiers the caller has already validated."""
+        # One JSON listing trimmed to the ID column answers most sessions
+        # without building pyxnat objects or parsing scan URIs
+        try:
+            resp = self.conn.get(
+                f"/data/projects/{project}/subjects/{subject}/experiments/{session}/scans",
+                params={"format": "json", "columns": "ID"},
+            )
+            if resp.status_code == 200:
+                rows = decode_json(resp).get("ResultSet", {}).get("Result", []) or []
+                listed = [str(row.get("ID", "")) for row in rows]
+                if all(s.isdigit() for s in listed):
+                    return listed
+        except (requests.RequestException, ValueError) as e:
+            self.log.debug("Could not list scans as JSON: %s", e)
+
+        # Fallback: parse IDs from pyxnat's generic listing. Its ID-column
+        # query is the same request as above, so it isn't tried again.
         sess = self.conn.interface.select.project(project).subject(subject).experiment(session)
-        scans_coll = sess.scans()
-
-        ids: List[str] = []
-
-        # Try to get IDs directly
         try:
-            raw_ids = scans_coll.get("ID")
-            if raw_ids:
-                candidate = [str(i) for i in raw_ids]
-                if all(s.isdigit() for s in candidate):
-                    ids = candidate
+            raw_list = sess.scans().get() or []
         except Exception as e:
-            self.log.debug("Could not get scan IDs by 'ID' column: %s", e)
-
-        # Fallback: parse from generic listing
-        if not ids:
-            try:
-                raw_list = scans_coll.get() or []
-            except Exception as e:
-                self.log.debug("Could not get scans list: %s", e)
-                raw_list = []
-
-            extracted: List[str] = []
-            for entry in raw_list:
-                s = str(entry)
-                m = re.search(r"/scans/(\d+)", s)
+            self.log.debug("Could not get scans list: %s", e)
+            raw_list = []
+
+        extracted: List[str] = []
+        append = extracted.append
+        search = _SCAN_URI_RE.search
+        for entry in raw_list:
+            s = str(entry)
+            # The substring test skips the regex for bare IDs
+            if "/scans/" in s:
+                m = search(s)
                 if m:
-                    extracted.append(m.group(1))
+                    append(m.group(1))
                     continue
-                if s.isdigit():
-                    extracted.append(s)
-
-            # Deduplicate while preserving order
-            ids = list(dict.fromkeys(extracted))
+            if s.isdigit():
+                append(s)
 
-        return ids
+        # Deduplicate while preserving order
+        return list(dict.fromkeys(extracted))
 
     # =========================================================================
     # Scan Creation
@@ -153,24 +189,22 @@ class ScanService:
             self._projects.ensure_subject(project, subject)
             self._projects.ensure_session(project, subject, session)
 
-            # Get existing scans to determine next ID
-            existing_ids = self.list_scans(project, subject, session)
-            numeric_ids = []
-            for sid in existing_ids:
-                try:
-                    numeric_ids.append(int(sid))
-                except ValueError:
-                    continue
-
-            next_id = (max(numeric_ids) + 1) if numeric_ids else 1
-            scan_id = str(next_id)
-
-            # Create the scan
             sess = self.conn.interface.select.project(project).subject(subject).experiment(session)
+            scan_id = self._reserve_scan_id(project, subject, session)
             scan_obj = sess.scan(scan_id)
 
-            if not scan_obj.exists():
+            try:
+                # Another client may have added scans since the session was
+                # listed; relist rather than reuse an existing scan
+                while scan_obj.exists():
+                    self.log.debug("Scan %s already exists, relisting %s", scan_id, session)
+                    scan_id = self._reserve_scan_id(project, subject, session, relist=True)
+                    scan_obj = sess.scan(scan_id)
                 scan_obj.insert(scans=xsi_type)
+            except Exception:
+                # The reserved ID wasn't created; relist on the next call
+                self.invalidate_scan_cache(project, subject, session)
+                raise
 
             # Set attributes
             try:
@@ -195,6 +229,31 @@ class ScanService:
 
             return scan_id
 
+    def _reserve_scan_id(
+        self, project: str, subject: str, session: str, *, relist: bool = False
+    ) -> str:
+        """Return the next unused scan ID for a session and record it as taken.
+
+        Existing scans are listed once per session, outside the lock so other
+        sessions aren't held up; later calls continue from the cached highest
+        ID unless relist is set.
+        """
+        key = (project, subject, session)
+        if not relist:
+            with self._scan_id_lock:
+                last_id = self._scan_id_cache.get(key)
+                if last_id is not None:
+                    self._scan_id_cache[key] = last_id + 1
+                    return str(last_id + 1)
+
+        existing_ids = self._list_scans(project, subject, session)
+        listed = max((int(sid) for sid in existing_ids if sid.isdecimal()), default=0)
+        with self._scan_id_lock:
+            # IDs reserved by concurrent calls while listing are kept
+            next_id = max(listed, self._scan_id_cache.get(key, 0)) + 1
+            self._scan_id_cache[key] = next_id
+        return str(next_id)
+
     # =========================================================================
     # Scan Deletion
     # =========================================================================
@@ -209,6 +268,8 @@ class ScanService:
         dry_run: bool = False,
         parallel: bool = False,
         max_workers: int = 2,
+        fail_fast_threshold: Optional[float] = None,
+        available_scans: Optional[List[str]] = None,
     ) -> Dict[str, Any]:
         """Delete scans from a session.
 
@@ -220,6 +281,11 @@ class ScanService:
             dry_run: If True, only report what would be deleted.
             parallel: If True, delete in parallel.
             max_workers: Max parallel workers.
+            fail_fast_threshold: Stop once more than this fraction of the
+                selected scans has failed; the rest are reported as failed
+                without being attempted. None attempts every scan.
+            available_scans: Scan IDs already listed for this session (e.g.
+                from list_scans while planning); skips listing them again.
 
         Returns:
             Dict with keys:
@@ -241,8 +307,9 @@ class ScanService:
             session=session,
             dry_run=dry_run,
         ):
-            # Get available scans
-            available_scans = self.list_scans(project, subject, session)
+            # Get available scans unless the caller already has them
+            if available_scans is None:
+                available_scans = self._list_scans(project, subject, session)
 
             if not available_scans:
                 self.log.info("No scans found for %s/%s/%s", project, subject, session)
@@ -290,32 +357,55 @@ class ScanService:
             deleted: List[str] = []
             failed: Dict[str, str] = {}
 
+            # XNAT deletes one scan per request; each DELETE goes straight
+            # through the pooled session so parallel deletes share
+            # keep-alive connections
+            scans_url = f"/data/projects/{project}/subjects/{subject}/experiments/{session}/scans"
+
+            # Set once too many deletions have failed: deletes already running
+            # finish and are counted, the rest are reported without a request
+            stop = threading.Event()
+
             def _delete_one(sid: str) -> tuple[str, Optional[str]]:
+                if stop.is_set():
+                    return (sid, _NOT_ATTEMPTED)
                 try:
-                    self.conn.interface.select.project(project).subject(subject).experiment(
-                        session
-                    ).scan(sid).delete(delete_files=True)
+                    resp = self.conn.delete(f"{scans_url}/{sid}", params={"removeFiles": "true"})
+                    resp.raise_for_status()
                     self.log.info("Deleted scan %s", sid)
                     return (sid, None)
                 except Exception as e:
                     self.log.error("Failed to delete scan %s: %s", sid, e)
                     return (sid, str(e))
 
-            if parallel and len(scans_to_delete) > 1:
-                worker_count = min(max_workers, len(scans_to_delete))
-                with ThreadPoolExecutor(max_workers=worker_count) as ex:
-                    for sid, error in ex.map(_delete_one, scans_to_delete):
-                        if error:
-                            failed[sid] = error
-                        else:
-                            deleted.append(sid)
+            max_failures = (
+                len(scans_to_delete)
+                if fail_fast_threshold is None
+                else int(fail_fast_threshold * len(scans_to_delete))
+            )
+
+            # Results are taken as each delete finishes, so one slow scan
+            # doesn't hold back the rest
+            results: Generator[Tuple[str, Tuple[str, Optional[str]]], None, None]
+            if parallel:
+                results = self.conn.iter_concurrent(_delete_one, scans_to_delete, max_workers)
             else:
-                for sid in scans_to_delete:
-                    sid, error = _delete_one(sid)
-                    if error:
-                        failed[sid] = error
-                    else:
-                        deleted.append(sid)
+                results = ((sid, _delete_one(sid)) for sid in scans_to_delete)
+            for _, (sid, error) in results:
+                if error is None:
+                    deleted.append(sid)
+                    continue
+                failed[sid] = error
+                if error is not _NOT_ATTEMPTED and not stop.is_set() and len(failed) > max_failures:
+                    self.log.error(
+                        "Stopping after %d of %d scan deletions failed",
+                        len(failed),
+                        len(scans_to_delete),
+                    )
+                    stop.set()
+
+            if deleted:
+                self.invalidate_scan_cache(project, subject, session)
 
             self.log.info(
                 "Deleted %d/%d scans (%d failed)",
@@ -8,10 +8,13 @@ This module handles file uploads:
 
 from __future__ import annotations
 
+import os
 from pathlib import Path
-from typing import Optional, Sequence
+from typing import Any, Dict, Optional, Sequence, Union
 from urllib.parse import quote
 
+import requests
+
 from ..core import (
     # Exceptions
     ArchiveUploadError,
@@ -28,12 +31,20 @@ from ..core import (
     validate_scan_id,
     validate_session_id,
     validate_subject_id,
+    validate_workers,
     # Utils
     zip_dir_to_temp,
 )
+from ..core.utils import _walk_files
 from .base import XNATConnection
 from .projects import ProjectService
 
+# Headers for raw file bodies PUT into a resource
+_OCTET_STREAM_HEADERS = {"Content-Type": "application/octet-stream"}
+
+# Files up to this size are sent from memory in one write
+SMALL_FILE_BYTES = 1024 * 1024
+
 
 class UploadService:
     """Service for uploading files to XNAT.
@@ -44,16 +55,20 @@ class UploadService:
     - DICOM archive uploads via import service
     """
 
-    def __init__(self, connection: XNATConnection) -> None:
+    def __init__(
+        self, connection: XNATConnection, projects: Optional[ProjectService] = None
+    ) -> None:
         """Initialize upload service.
 
         Args:
             connection: XNAT connection instance.
+            projects: Project service to share, so subjects and sessions
+                already ensured by other services aren't checked again.
         """
         self.conn = connection
         self.log = get_logger(__name__)
         self._audit = get_audit_logger()
-        self._projects = ProjectService(connection)
+        self._projects = projects if projects is not None else ProjectService(connection)
 
     # =========================================================================
     # Session Resource Uploads
@@ -113,12 +128,7 @@ class UploadService:
             )
 
             try:
-                with open(file_path, "rb") as f:
-                    resp = self.conn.put(
-                        url,
-                        data=f,
-                        headers={"Content-Type": "application/octet-stream"},
-                    )
+                resp = self._put_file(url, file_path, _OCTET_STREAM_HEADERS)
                 resp.raise_for_status()
                 self.log.info("Upload complete (%d)", resp.status_code)
 
@@ -146,6 +156,8 @@ class UploadService:
         session: str,
         resource_label: str,
         local_dir: Path,
+        parallel: bool = False,
+        max_workers: int = 8,
     ) -> dict[str, int]:
         """Upload all files from a directory to a session resource.
 
@@ -157,6 +169,9 @@ class UploadService:
             session: Session identifier.
             resource_label: Resource label.
             local_dir: Local directory path.
+            parallel: Upload files in parallel; off by default since the
+                files all land in one resource catalog.
+            max_workers: Max parallel workers.
 
         Returns:
             Dict with 'uploaded' and 'failed' counts.
@@ -166,6 +181,7 @@ class UploadService:
         session = validate_session_id(session)
         resource_label = validate_resource_label(resource_label)
         local_dir = validate_path_exists(local_dir, must_be_dir=True)
+        max_workers = validate_workers(max_workers, "max_workers", max_value=16)
 
         with LogContext(
             "upload_resource_dir",
@@ -177,40 +193,67 @@ class UploadService:
             self._projects.ensure_subject(project, subject)
             self._projects.ensure_session(project, subject, session)
 
-            base = f"/data/projects/{project}/subjects/{subject}/experiments/{session}"
-            uploaded = 0
-            failed = 0
-
-            for path in sorted(local_dir.rglob("*")):
-                if not path.is_file():
-                    continue
+            # Every PUT goes through the connection's pooled session, so
+            # all files share the same keep-alive connections
+            files_url = (
+                f"/data/projects/{project}/subjects/{subject}/experiments/{session}"
+                f"/resources/{quote(resource_label)}/files/"
+            )
+            root = os.fspath(local_dir)
+            # Files are uploaded as the scandir walk finds them, so the first
+            # PUTs start before a large tree has been fully listed
+            paths = _walk_files(root)
 
-                rel_path = path.relative_to(local_dir).as_posix()
-                res_path = f"resources/{quote(resource_label)}/files/{quote(rel_path)}"
-                url = f"{base}/{res_path}?inbody=true"
+            def _upload(path: str) -> bool:
+                return self._upload_one_file(files_url, path, root)
 
-                try:
-                    with open(path, "rb") as f:
-                        resp = self.conn.put(
-                            url,
-                            data=f,
-                            headers={"Content-Type": "application/octet-stream"},
-                        )
-
-                    if resp.status_code in (200, 201):
-                        uploaded += 1
-                        self.log.debug("OK %s", rel_path)
-                    else:
-                        failed += 1
-                        self.log.warning("%s -> %d", rel_path, resp.status_code)
+            # Each file is an independent PUT
+            if parallel:
+                results = self.conn.map_concurrent(_upload, paths, max_workers)
+            else:
+                results = [_upload(path) for path in paths]
 
-                except Exception as e:
-                    failed += 1
-                    self.log.warning("%s -> error: %s", rel_path, e)
+            uploaded = sum(results)
+            failed = len(results) - uploaded
 
             self.log.info("Upload complete: %d ok, %d failed", uploaded, failed)
             return {"uploaded": uploaded, "failed": failed}
 
+    def _put_file(
+        self, url: str, path: Union[str, Path], headers: Dict[str, str]
+    ) -> requests.Response:
+        """PUT a file's contents to url.
+
+        Small files are read into memory and sent in one write; larger files
+        are streamed from disk. requests sizes both bodies up front, so
+        neither is sent with chunked transfer encoding.
+        """
+        with open(path, "rb") as f:
+            if os.fstat(f.fileno()).st_size <= SMALL_FILE_BYTES:
+                return self.conn.put(url, data=f.read(), headers=headers)
+            return self.conn.put(url, data=f, headers=headers)
+
+    def _upload_one_file(self, files_url: str, path: str, root: str) -> bool:
+        """PUT one file under files_url at its path relative to root.
+
+        Returns:
+            True if the server accepted the file.
+        """
+        rel_path = os.path.relpath(path, root).replace(os.sep, "/")
+        url = f"{files_url}{quote(rel_path)}?inbody=true"
+
+        try:
+            resp = self._put_file(url, path, _OCTET_STREAM_HEADERS)
+        except Exception as e:
+            self.log.warning("%s -> error: %s", rel_path, e)
+            return False
+
+        if resp.status_code in (200, 201):
+            self.log.debug("OK %s", rel_path)
+            return True
+        self.log.warning("%s -> %d", rel_path, resp.status_code)
+        return False
+
     def upload_session_resource_zip_dir(
         self,
         *,
@@ -220,10 +263,14 @@ class UploadService:
         resource_label: str,
         local_dir: Path,
         zip_name: Optional[str] = None,
+        compress: bool = False,
     ) -> None:
         """Zip a directory and upload with server-side extraction.
 
         More efficient than upload_session_resource_dir for many files.
+        The server unpacks the archive on arrival, so by default files are
+        stored rather than deflated and the upload isn't held up by
+        single-threaded compression.
 
         Args:
             project: Project identifier.
@@ -232,6 +279,8 @@ class UploadService:
             resource_label: Resource label.
             local_dir: Local directory to zip.
             zip_name: Optional name for the zip file.
+            compress: Deflate files in the ZIP, trading CPU time for a
+                smaller transfer on slow links.
         """
         project = validate_project_id(project)
         subject = validate_subject_id(subject)
@@ -257,19 +306,14 @@ class UploadService:
             )
 
             self.log.info("Creating ZIP from %s", local_dir)
-            tmp_zip = zip_dir_to_temp(local_dir)
+            tmp_zip = zip_dir_to_temp(local_dir, compress=compress)
             size_mb = tmp_zip.stat().st_size / (1024 * 1024)
             self.log.info("ZIP ready (%.1f MB). Uploading with extract=true...", size_mb)
 
             try:
 
                 def _do_upload() -> None:
-                    with open(tmp_zip, "rb") as f:
-                        resp = self.conn.put(
-                            url,
-                            data=f,
-                            headers={"Content-Type": "application/zip"},
-                        )
+                    resp = self._put_file(url, tmp_zip, {"Content-Type": "application/zip"})
                     resp.raise_for_status()
                     self.log.info("Extract upload complete (%d)", resp.status_code)
 
@@ -351,12 +395,7 @@ class UploadService:
                 remote,
             )
 
-            with open(file_path, "rb") as f:
-                resp = self.conn.put(
-                    url,
-                    data=f,
-                    headers={"Content-Type": "application/octet-stream"},
-                )
+            resp = self._put_file(url, file_path, _OCTET_STREAM_HEADERS)
             resp.raise_for_status()
             self.log.info("Scan resource upload complete (%d)", resp.status_code)
 
@@ -402,6 +441,81 @@ class UploadService:
             http_session_listener: Web uploader tracking ID.
             direct_archive: Use direct-to-archive mode.
         """
+        self._import_dicom_archive(
+            archive,
+            project=project,
+            subject=subject,
+            session=session,
+            ensure_subject=True,
+            import_handler=import_handler,
+            ignore_unparsable=ignore_unparsable,
+            dest=dest,
+            overwrite=overwrite,
+            overwrite_files=overwrite_files,
+            quarantine=quarantine,
+            trigger_pipelines=trigger_pipelines,
+            rename=rename,
+            srcs=srcs,
+            http_session_listener=http_session_listener,
+            direct_archive=direct_archive,
+        )
+
+    def upload_dicom_zip_oneshot(
+        self,
+        archive: Path,
+        *,
+        project: str,
+        subject: str,
+        session: str,
+        import_handler: str = "DICOM-zip",
+        ignore_unparsable: bool = True,
+        overwrite: str = "delete",
+        direct_archive: bool = False,
+    ) -> None:
+        """Upload a DICOM archive with a single import request.
+
+        Unlike :meth:`upload_dicom_zip`, the subject is not checked
+        beforehand; the archive is POSTed once and the import service
+        creates the subject and session as needed.
+
+        Args:
+            archive: Path to ZIP/TAR archive.
+            project: Project identifier.
+            subject: Subject identifier.
+            session: Session identifier.
+            import_handler: XNAT import handler (default: DICOM-zip).
+            ignore_unparsable: Ignore non-DICOM files.
+            overwrite: Overwrite mode ('none', 'append', 'delete').
+            direct_archive: Use direct-to-archive mode.
+
+        Raises:
+            ArchiveUploadError: If the upload fails.
+        """
+        self._import_dicom_archive(
+            archive,
+            project=project,
+            subject=subject,
+            session=session,
+            ensure_subject=False,
+            import_handler=import_handler,
+            ignore_unparsable=ignore_unparsable,
+            overwrite=overwrite,
+            direct_archive=direct_archive,
+        )
+
+    def _import_dicom_archive(
+        self,
+        archive: Path,
+        *,
+        project: str,
+        subject: str,
+        session: str,
+        ensure_subject: bool,
+        overwrite: str,
+        direct_archive: bool,
+        **import_options: Any,
+    ) -> None:
+        """POST an archive to the import service, ensuring the subject first if asked."""
         project = validate_project_id(project)
         subject = validate_subject_id(subject)
         session = validate_session_id(session)
@@ -416,7 +530,8 @@ class UploadService:
             session=session,
             archive=archive.name,
         ):
-            self._projects.ensure_subject(project, subject)
+            if ensure_subject:
+                self._projects.ensure_subject(project, subject)
 
             size_gb = archive.stat().st_size / (1024 * 1024 * 1024)
             self.log.info(
@@ -426,34 +541,24 @@ class UploadService:
                 direct_archive,
             )
 
-            params = {
-                "import-handler": import_handler,
-                "Ignore-Unparsable": "true" if ignore_unparsable else "false",
-                "project": project,
-                "subject": subject,
-                "session": session,
-                "overwrite": overwrite,
-                "overwrite_files": "true" if overwrite_files else "false",
-                "quarantine": "true" if quarantine else "false",
-                "triggerPipelines": "true" if trigger_pipelines else "false",
-                "rename": "true" if rename else "false",
-                "Direct-Archive": "true" if direct_archive else "false",
-            }
-
-            if dest:
-                params["dest"] = dest
-            if http_session_listener:
-                params["http-session-listener"] = http_session_listener
-            if srcs:
-                params["src"] = ",".join(srcs)
+            params = _dicom_import_params(
+                project,
+                subject,
+                session,
+                overwrite=overwrite,
+                direct_archive=direct_archive,
+                **import_options,
+            )
 
             try:
+                # The archive is the raw request body (inbody=true), streamed
+                # from disk; a multipart form would be built in memory first
                 with open(archive, "rb") as f:
-                    files = {"file": (archive.name, f)}
                     resp = self.conn.post(
                         "/data/services/import",
                         params=params,
-                        files=files,
+                        data=f,
+                        headers={"Content-Type": _archive_content_type(archive)},
                     )
                     resp.raise_for_status()
 
@@ -481,3 +586,55 @@ class UploadService:
                     error=str(e),
                 )
                 raise ArchiveUploadError(str(archive), str(e)) from e
+
+
+def _dicom_import_params(
+    project: str,
+    subject: str,
+    session: str,
+    *,
+    import_handler: str,
+    ignore_unparsable: bool,
+    overwrite: str,
+    direct_archive: bool,
+    dest: Optional[str] = None,
+    overwrite_files: bool = True,
+    quarantine: bool = False,
+    trigger_pipelines: bool = True,
+    rename: bool = False,
+    srcs: Optional[Sequence[str]] = None,
+    http_session_listener: Optional[str] = None,
+) -> Dict[str, str]:
+    """Build query parameters for the /data/services/import endpoint.
+
+    The archive is sent as the request body, so inbody is always set.
+    """
+    params = {
+        "inbody": "true",
+        "import-handler": import_handler,
+        "Ignore-Unparsable": "true" if ignore_unparsable else "false",
+        "project": project,
+        "subject": subject,
+        "session": session,
+        "overwrite": overwrite,
+        "overwrite_files": "true" if overwrite_files else "false",
+        "quarantine": "true" if quarantine else "false",
+        "triggerPipelines": "true" if trigger_pipelines else "false",
+        "rename": "true" if rename else "false",
+        "Direct-Archive": "true" if direct_archive else "false",
+    }
+
+    if dest:
+        params["dest"] = dest
+    if http_session_listener:
+        params["http-session-listener"] = http_session_listener
+    if srcs:
+        params["src"] = ",".join(srcs)
+    return params
+
+
+def _archive_content_type(archive: Path) -> str:
+    """Content type telling the import service how to unpack an inbody archive."""
+    if archive.name.lower().endswith((".tar", ".tar.gz", ".tgz")):
+        return "application/x-tar"
+    return "application/zip"
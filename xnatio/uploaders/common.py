@@ -1,31 +1,104 @@
 from __future__ import annotations
 
+import heapq
+import os
 from pathlib import Path
-from typing import List, Sequence
+from typing import Iterator, List, NamedTuple, Optional, Sequence, TypeVar
 
 DICOM_EXTENSIONS = {".dcm", ".ima", ".img", ".dicom"}
 
+T = TypeVar("T")
 
-def collect_dicom_files(root: Path, *, include_extensionless: bool = True) -> List[Path]:
-    """Recursively collect DICOM-like files under a root directory."""
+
+def _scandir_recursive(path: str) -> Iterator[os.DirEntry[str]]:
+    """Yield file entries under path, using the type cached in each entry.
+
+    Symlinked files are included; symlinked directories are not descended.
+    Unreadable directories are skipped, as rglob does.
+    """
+    try:
+        with os.scandir(path) as entries:
+            subdirs = []
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    subdirs.append(entry.path)
+                elif entry.is_file():
+                    yield entry
+    except PermissionError:
+        return
+    for subdir in subdirs:
+        yield from _scandir_recursive(subdir)
+
+
+def _suffix(name: str) -> str:
+    """Lowercased extension of a file name, following Path.suffix rules."""
+    i = name.rfind(".")
+    if 0 < i < len(name) - 1:
+        return name[i:].lower()
+    return ""
+
+
+def _dicom_entries(root: Path, include_extensionless: bool) -> List[os.DirEntry[str]]:
+    """Scan root for DICOM-like files and return their entries sorted by path."""
     if not root.exists() or not root.is_dir():
         raise ValueError(f"Not a directory: {root}")
 
-    files: List[Path] = []
-    for path in root.rglob("*"):
-        if not path.is_file():
-            continue
-        suffix = path.suffix.lower()
+    entries: List[os.DirEntry[str]] = []
+    for entry in _scandir_recursive(os.fspath(root)):
+        name = entry.name
+        suffix = _suffix(name)
         if suffix in DICOM_EXTENSIONS:
-            files.append(path)
-        elif include_extensionless and suffix == "" and not path.name.startswith("."):
-            files.append(path)
+            entries.append(entry)
+        elif include_extensionless and suffix == "" and not name.startswith("."):
+            entries.append(entry)
+
+    entries.sort(key=lambda e: e.path)
+    return entries
+
+
+def collect_dicom_files(root: Path, *, include_extensionless: bool = True) -> List[Path]:
+    """Recursively collect DICOM-like files under a root directory."""
+    return [Path(e.path) for e in _dicom_entries(root, include_extensionless)]
+
+
+class FileRecord(NamedTuple):
+    """A scanned file with its archive member name and stat result."""
+
+    path: Path
+    arcname: str
+    st: os.stat_result
+
+    @property
+    def size(self) -> int:
+        return self.st.st_size
 
-    return sorted(files)
 
+def collect_dicom_records(root: Path, *, include_extensionless: bool = True) -> List[FileRecord]:
+    """Like collect_dicom_files, also recording each file's name and stat.
 
-def split_into_batches(files: Sequence[Path], num_batches: int) -> List[List[Path]]:
-    """Split files into roughly even batches using round-robin assignment."""
+    ``arcname`` is the path relative to root, sliced from the scanned path.
+    The stat is taken once here and reused for batch balancing and archive
+    member headers.
+    """
+    prefix_len = len(os.path.join(os.fspath(root), ""))
+    return [
+        FileRecord(Path(e.path), e.path[prefix_len:], e.stat())
+        for e in _dicom_entries(root, include_extensionless)
+    ]
+
+
+def split_into_batches(
+    files: Sequence[T],
+    num_batches: int,
+    sizes: Optional[Sequence[int]] = None,
+) -> List[List[T]]:
+    """Split files into roughly even batches.
+
+    Without sizes, files are assigned round-robin. With sizes, the largest
+    files are placed first, each into the batch with the fewest bytes so
+    far, so batches carry similar amounts of data. Files keep their input
+    order within each batch.
+    """
     if not files:
         return []
 
@@ -33,9 +106,21 @@ def split_into_batches(files: Sequence[Path], num_batches: int) -> List[List[Pat
         return [list(files)]
 
     actual_batches = min(num_batches, len(files))
-    batches: List[List[Path]] = [[] for _ in range(actual_batches)]
 
-    for idx, file_path in enumerate(files):
-        batches[idx % actual_batches].append(file_path)
+    if sizes is None:
+        batches: List[List[T]] = [[] for _ in range(actual_batches)]
+        for idx, file_path in enumerate(files):
+            batches[idx % actual_batches].append(file_path)
+        return batches
+
+    if len(sizes) != len(files):
+        raise ValueError("sizes must have one entry per file")
+
+    loads = [(0, batch_idx) for batch_idx in range(actual_batches)]
+    assigned: List[List[int]] = [[] for _ in range(actual_batches)]
+    for idx in sorted(range(len(files)), key=lambda i: sizes[i], reverse=True):
+        load, batch_idx = loads[0]
+        assigned[batch_idx].append(idx)
+        heapq.heapreplace(loads, (load + sizes[idx], batch_idx))
 
-    return batches
+    return [[files[i] for i in sorted(indices)] for indices in assigned]
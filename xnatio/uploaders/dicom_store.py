@@ -1,18 +1,23 @@
 from __future__ import annotations
 
 import logging
+import multiprocessing
+import os
 import shutil
 import tempfile
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import Dict, List, Optional, Set, Tuple, Union
 
 import pydicom
+from pydicom.dataset import Dataset
 from pydicom.errors import InvalidDicomError
 from pynetdicom import AE
+from pynetdicom import _config as netdicom_config
+from pynetdicom.presentation import PresentationContext, build_context
 
-from .common import collect_dicom_files, split_into_batches
+from .common import collect_dicom_records, split_into_batches
 from .constants import DEFAULT_DICOM_CALLING_AET, DEFAULT_DICOM_STORE_BATCHES
 
 VERIFICATION_UID = "1.2.840.10008.1.1"
@@ -25,11 +30,23 @@ try:
     from pynetdicom import StoragePresentationContexts  # 2.x/3.0.x
 except ImportError:
     from pynetdicom import sop_class as _sc
-    from pynetdicom.presentation import build_context
 
     _uids = [getattr(_sc, name) for name in dir(_sc) if name.endswith("Storage")]
     StoragePresentationContexts = [build_context(uid) for uid in _uids]  # type: ignore
 
+# Element values larger than this are left on disk when a file is parsed.
+DEFER_SIZE = "512 KB"
+# pynetdicom refuses to request more presentation contexts than this.
+MAX_REQUESTED_CONTEXTS = 128
+# Siemens CSA Non-Image Storage, absent from pynetdicom's storage list.
+CSA_NON_IMAGE_STORAGE = "1.3.12.2.1107.5.9.1"
+# Used when a batch's SOP classes can't be determined up front.
+_ALL_STORAGE_CONTEXTS = tuple(
+    [*StoragePresentationContexts, build_context(CSA_NON_IMAGE_STORAGE)][:MAX_REQUESTED_CONTEXTS]
+)
+
+_FILE_META_UIDS = ("MediaStorageSOPClassUID", "MediaStorageSOPInstanceUID", "TransferSyntaxUID")
+
 
 @dataclass
 class DICOMStoreSummary:
@@ -53,6 +70,44 @@ def ensure_sop_uids(ds) -> None:
             ds.SOPInstanceUID = uid
 
 
+def _batch_contexts(found: Dict[str, Set[str]]) -> List[PresentationContext]:
+    """Presentation contexts for a batch's SOP classes.
+
+    Each SOP class in found gets a context offering the default transfer
+    syntaxes, plus one context per transfer syntax its files are actually
+    encoded in so that those files can be sent without conversion.
+    """
+    if not found:
+        return list(_ALL_STORAGE_CONTEXTS)
+
+    contexts = []
+    for uid in sorted(found):
+        contexts.append(build_context(uid))
+        contexts.extend(build_context(uid, ts) for ts in sorted(found[uid]))
+    if len(contexts) > MAX_REQUESTED_CONTEXTS:
+        contexts = [build_context(uid) for uid in sorted(found)]
+    if len(contexts) > MAX_REQUESTED_CONTEXTS:
+        return list(_ALL_STORAGE_CONTEXTS)
+    return contexts
+
+
+def _file_context(ds) -> Optional[Tuple[str, str]]:
+    """The (SOP class, transfer syntax) a file can be sent by path under.
+
+    Sending by path streams the file byte for byte, so it needs complete
+    file meta matching the dataset's SOP UIDs. None means the dataset has to
+    be fixed up and re-encoded instead.
+    """
+    meta = getattr(ds, "file_meta", None)
+    if not meta or any(kw not in meta for kw in _FILE_META_UIDS):
+        return None
+    if ds.get("SOPClassUID") != meta.MediaStorageSOPClassUID:
+        return None
+    if ds.get("SOPInstanceUID") != meta.MediaStorageSOPInstanceUID:
+        return None
+    return str(meta.MediaStorageSOPClassUID), str(meta.TransferSyntaxUID)
+
+
 def c_echo(host: str, port: int, calling: str, called: str) -> bool:
     """Send a C-ECHO to verify connectivity and AETs."""
     ae = AE(ae_title=calling)
@@ -78,44 +133,99 @@ def send_batch(
     sent = failed = 0
     log_path = logdir / f"{batch_id}.log"
 
-    with log_path.open("w") as log:
-        ae = AE(ae_title=calling)
-        ae.requested_contexts = list(StoragePresentationContexts)  # type: ignore
-        ae.add_requested_context("1.3.12.2.1107.5.9.1")
-
-        assoc = ae.associate(host, port, ae_title=called)
-        if not assoc.is_established:
-            log.write("Association rejected/aborted\n")
-            return sent, len(files)
-
-        for fp in files:
-            try:
-                ds = pydicom.dcmread(fp, force=True)
-            except InvalidDicomError:
-                failed += 1
-                log.write(f"Skip non-DICOM {fp}\n")
-                continue
-
-            ensure_sop_uids(ds)
-
-            try:
-                status = assoc.send_c_store(ds)
-            except (AttributeError, ValueError) as exc:
-                failed += 1
-                log.write(f"Store error {fp}: {exc}\n")
-                continue
-
-            if status and status.Status == 0x0000:
-                sent += 1
-            else:
-                failed += 1
-                log.write(f"Failed {fp} status {hex(status.Status if status else 0)}\n")
-
-        assoc.release()
+    # Each file is parsed before the association for the SOP classes and
+    # transfer syntaxes to negotiate, and whether it can be streamed as-is.
+    # Only that decision is kept, so memory doesn't grow with the batch;
+    # files that must be re-encoded are read again when they are sent.
+    found: Dict[str, Set[str]] = {}
+    parsed: List[Tuple[Path, bool, Optional[Tuple[str, str]]]] = []
+    for fp in files:
+        try:
+            ds = pydicom.dcmread(fp, force=True, defer_size=DEFER_SIZE)
+        except InvalidDicomError:
+            parsed.append((fp, False, None))
+            continue
+        key = _file_context(ds)
+        if key is not None:
+            found.setdefault(key[0], set()).add(key[1])
+        else:
+            meta = getattr(ds, "file_meta", None) or Dataset()
+            sop_class = ds.get("SOPClassUID") or meta.get("MediaStorageSOPClassUID")
+            if sop_class:
+                syntaxes = found.setdefault(str(sop_class), set())
+                if meta.get("TransferSyntaxUID"):
+                    syntaxes.add(str(meta.TransferSyntaxUID))
+        parsed.append((fp, True, key))
+
+    # Datasets passed to send_c_store as a path are streamed from the file as
+    # encoded, instead of being decoded by dcmread and re-encoded. The option
+    # is a pynetdicom global, so it is only set while this batch is sent.
+    chunked = netdicom_config.STORE_SEND_CHUNKED_DATASET
+    netdicom_config.STORE_SEND_CHUNKED_DATASET = True
+    try:
+        with log_path.open("w") as log:
+            ae = AE(ae_title=calling)
+            ae.requested_contexts = _batch_contexts(found)
+
+            assoc = ae.associate(host, port, ae_title=called)
+            if not assoc.is_established:
+                log.write("Association rejected/aborted\n")
+                return sent, len(files)
+
+            accepted: Set[Tuple[Optional[str], str]] = {
+                (cx.abstract_syntax, cx.transfer_syntax[0]) for cx in assoc.accepted_contexts
+            }
+
+            for fp, is_dicom, key in parsed:
+                dataset: Union[Path, Dataset]
+                if key is not None and key in accepted:
+                    dataset = fp
+                elif is_dicom:
+                    # Needs fixing up, or the SCP declined the file's own
+                    # transfer syntax, so it is decoded and re-encoded
+                    ds = pydicom.dcmread(fp, force=True, defer_size=DEFER_SIZE)
+                    ensure_sop_uids(ds)
+                    dataset = ds
+                else:
+                    failed += 1
+                    log.write(f"Skip non-DICOM {fp}\n")
+                    continue
+
+                try:
+                    status = assoc.send_c_store(dataset)
+                except (AttributeError, ValueError) as exc:
+                    failed += 1
+                    log.write(f"Store error {fp}: {exc}\n")
+                    continue
+
+                if status and status.Status == 0x0000:
+                    sent += 1
+                else:
+                    failed += 1
+                    log.write(f"Failed {fp} status {hex(status.Status if status else 0)}\n")
+
+            assoc.release()
+    finally:
+        netdicom_config.STORE_SEND_CHUNKED_DATASET = chunked
 
     return sent, failed
 
 
+def _store_executor(max_workers: int) -> Executor:
+    """Return the executor that runs one association per batch.
+
+    pydicom parsing and pynetdicom's DIMSE encoding are pure Python and hold
+    the GIL, so batches run in separate processes. forkserver is used where
+    available because pynetdicom associations leave threads behind.
+    """
+    if max_workers <= 1:
+        return ThreadPoolExecutor(max_workers=1)
+    method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+    return ProcessPoolExecutor(
+        max_workers=max_workers, mp_context=multiprocessing.get_context(method)
+    )
+
+
 def send_dicom_store(
     *,
     dicom_root: Path,
@@ -124,10 +234,19 @@ def send_dicom_store(
     called_aet: str,
     calling_aet: str = DEFAULT_DICOM_CALLING_AET,
     batches: int = DEFAULT_DICOM_STORE_BATCHES,
+    max_associations: Optional[int] = None,
     cleanup: bool = False,
     logger: Optional[logging.Logger] = None,
 ) -> DICOMStoreSummary:
-    """Send a directory of DICOM files to an SCP using C-STORE."""
+    """Send a directory of DICOM files to an SCP using C-STORE.
+
+    Each batch is sent over its own association from a worker process. By
+    default one process is started per CPU, so at most os.cpu_count()
+    batches are open at once and the rest queue behind them;
+    max_associations sets the number of processes (and open associations)
+    instead, for SCPs with their own association limit. Larger batches start
+    first so that small ones fill in at the end.
+    """
     log = logger or logging.getLogger(__name__)
 
     if not dicom_root.exists() or not dicom_root.is_dir():
@@ -145,26 +264,38 @@ def send_dicom_store(
             host,
             port,
         )
-        if not c_echo(host, port, calling_aet, called_aet):
-            raise RuntimeError("C-ECHO failed - check host/port/AET settings")
-
-        files = collect_dicom_files(dicom_root)
-        if not files:
+        # The echo round trip overlaps the directory scan.
+        with ThreadPoolExecutor(max_workers=1) as echo_pool:
+            echo = echo_pool.submit(c_echo, host, port, calling_aet, called_aet)
+            records = collect_dicom_records(dicom_root)
+            if not echo.result():
+                raise RuntimeError("C-ECHO failed - check host/port/AET settings")
+
+        if not records:
             raise RuntimeError("No DICOM files found")
 
-        chunks = split_into_batches(files, batches)
-        log.info("Discovered %s files under %s", len(files), dicom_root)
+        chunks = split_into_batches(records, batches, [rec.size for rec in records])
+        chunks.sort(key=lambda chunk: sum(rec.size for rec in chunk), reverse=True)
+        log.info("Discovered %s files under %s", len(records), dicom_root)
         log.info("Using %s batches (requested: %s)", len(chunks), batches)
 
         sent_total = failed_total = 0
-        max_workers = max(1, len(chunks))
+        # Each worker is a separate interpreter, so the pool is sized to the
+        # CPUs rather than to the batch count unless the caller says otherwise
+        limit = max_associations if max_associations is not None else os.cpu_count() or 1
+        max_workers = max(1, min(limit, len(chunks)))
+        log.info(
+            "Sending over at most %s concurrent associations "
+            "(keep within the SCP's association limit)",
+            max_workers,
+        )
 
-        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        with _store_executor(max_workers) as pool:
             futures = {
                 pool.submit(
                     send_batch,
                     f"{i:03d}",
-                    chunk,
+                    [rec.path for rec in chunk],
                     host,
                     port,
                     calling_aet,
@@ -178,14 +309,14 @@ def send_dicom_store(
                 sent_total += sent
                 failed_total += failed
                 log.info(
-                    "Batch %s complete: %s sent, %s failed",
-                    f"{futures[future]:03d}",
+                    "Batch %03d complete: %s sent, %s failed",
+                    futures[future],
                     sent,
                     failed,
                 )
 
         return DICOMStoreSummary(
-            total_files=len(files),
+            total_files=len(records),
             sent=sent_total,
             failed=failed_total,
             log_dir=logs,
@@ -1,20 +1,35 @@
 from __future__ import annotations
 
 import logging
+import multiprocessing
 import os
 import shutil
+import stat
+import subprocess
 import tarfile
 import tempfile
+import threading
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
+from contextlib import ExitStack
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Callable, List, Optional, Tuple
+from typing import IO, Any, Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple, Union
 from zipfile import ZIP_DEFLATED, ZipFile
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.poolmanager import PoolKey
 
-from .common import collect_dicom_files, split_into_batches
+from ..core.utils import _write_zip_entry
+from .common import FileRecord, collect_dicom_records, split_into_batches
 from .constants import (
     DEFAULT_ARCHIVE_FORMAT,
     DEFAULT_ARCHIVE_WORKERS,
@@ -25,6 +40,14 @@ from .constants import (
     DEFAULT_UPLOAD_WORKERS,
 )
 
+STREAM_CHUNK_SIZE = 1024 * 1024
+# Batch archives are only a transport format, so deflate trades ratio for
+# speed: level 1 is several times faster than zlib's default of 6.
+ZIP_COMPRESSLEVEL = 1
+
+# urllib3 2.x lets the pool pass a send block size through to its connections.
+_POOL_BLOCKSIZE = "key_blocksize" in PoolKey._fields
+
 
 @dataclass
 class UploadProgress:
@@ -64,6 +87,19 @@ class UploadSummary:
     errors: List[str] = field(default_factory=list)
 
 
+class _UploadAdapter(HTTPAdapter):
+    """HTTP adapter that sends file request bodies in large blocks.
+
+    http.client and urllib3 read file bodies in 8-16 KiB pieces by default,
+    which means tens of thousands of read/send calls per GB uploaded.
+    """
+
+    def init_poolmanager(self, *args: Any, **pool_kwargs: Any) -> None:
+        if _POOL_BLOCKSIZE:
+            pool_kwargs.setdefault("blocksize", STREAM_CHUNK_SIZE)
+        super().init_poolmanager(*args, **pool_kwargs)
+
+
 class XNATSession:
     """XNAT session using session-based authentication."""
 
@@ -94,6 +130,9 @@ class XNATSession:
         url = f"{self.server}/data/JSESSION"
         self.session = requests.Session()
         self.session.verify = self.verify_tls
+        adapter = _UploadAdapter()
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
 
         response = self.session.post(
             url,
@@ -104,7 +143,7 @@ class XNATSession:
         if response.status_code != 200:
             raise ConnectionError(f"Failed to connect to XNAT: {response.status_code}")
 
-        if "<html" in response.text.lower():
+        if b"<html" in response.content.lower():
             raise ConnectionError("Authentication failed - password may have expired")
 
     def close_session(self) -> None:
@@ -115,6 +154,8 @@ class XNATSession:
             self.session.delete(url, timeout=self.timeout)
         except Exception:
             pass
+        finally:
+            self.session.close()
 
     def upload_archive(
         self,
@@ -141,62 +182,200 @@ class XNATSession:
         else:
             content_type = "application/zip"
 
+        params = _import_params(
+            project,
+            subject,
+            session_label,
+            import_handler=import_handler,
+            ignore_unparsable=ignore_unparsable,
+            overwrite=overwrite,
+            direct_archive=direct_archive,
+            overwrite_files=overwrite_files,
+            quarantine=quarantine,
+            trigger_pipelines=trigger_pipelines,
+            rename=rename,
+        )
+
+        try:
+            with archive_path.open("rb") as data:
+                return self._send_import(params, content_type, data)
+        except OSError as exc:
+            return False, str(exc)
+
+    def upload_stream(
+        self,
+        project: str,
+        subject: str,
+        session_label: str,
+        chunks: Iterable[bytes],
+        *,
+        archive_format: str = DEFAULT_ARCHIVE_FORMAT,
+        import_handler: str = DEFAULT_IMPORT_HANDLER,
+        ignore_unparsable: bool = True,
+        overwrite: str = DEFAULT_OVERWRITE,
+        direct_archive: bool = True,
+        overwrite_files: bool = True,
+        quarantine: bool = False,
+        trigger_pipelines: bool = True,
+        rename: bool = False,
+    ) -> Tuple[bool, str]:
+        """Upload an archive produced on the fly using chunked transfer encoding."""
+        if not self.session:
+            raise RuntimeError("XNAT session is not open")
+
+        content_type = "application/x-tar" if archive_format == "tar" else "application/zip"
+        params = _import_params(
+            project,
+            subject,
+            session_label,
+            import_handler=import_handler,
+            ignore_unparsable=ignore_unparsable,
+            overwrite=overwrite,
+            direct_archive=direct_archive,
+            overwrite_files=overwrite_files,
+            quarantine=quarantine,
+            trigger_pipelines=trigger_pipelines,
+            rename=rename,
+        )
+        return self._send_import(params, content_type, chunks)
+
+    def _send_import(
+        self,
+        params: Dict[str, str],
+        content_type: str,
+        data: Union[IO[bytes], Iterable[bytes]],
+    ) -> Tuple[bool, str]:
+        assert self.session is not None
         headers = {"Content-Type": content_type}
         upload_url = f"{self.server}/data/services/import"
-        params = {
-            "import-handler": import_handler,
-            "Ignore-Unparsable": "true" if ignore_unparsable else "false",
-            "project": project,
-            "subject": subject,
-            "session": session_label,
-            "overwrite": overwrite,
-            "overwrite_files": "true" if overwrite_files else "false",
-            "quarantine": "true" if quarantine else "false",
-            "triggerPipelines": "true" if trigger_pipelines else "false",
-            "rename": "true" if rename else "false",
-            "Direct-Archive": "true" if direct_archive else "false",
-            "inbody": "true",
-        }
 
         try:
-            with archive_path.open("rb") as data:
-                response = self.session.post(
-                    upload_url,
-                    params=params,
-                    headers=headers,
-                    data=data,
-                    timeout=self.timeout,
-                )
+            response = self.session.post(
+                upload_url,
+                params=params,
+                headers=headers,
+                data=data,
+                timeout=self.timeout,
+            )
 
             if response.status_code == 200:
                 return True, ""
-            return False, f"Status {response.status_code}: {response.text[:200]}"
+            # Decode only the excerpt; response.text would run charset
+            # detection over the whole error page when no charset is sent.
+            excerpt = response.content[:200].decode("utf-8", "replace")
+            return False, f"Status {response.status_code}: {excerpt}"
         except requests.exceptions.Timeout:
             return False, "Upload timed out"
         except Exception as exc:
             return False, str(exc)
 
 
-def create_tar_archive(files: List[Path], output_path: Path, base_dir: Path) -> int:
-    """Create a TAR archive from files and return its size in bytes."""
-    with tarfile.open(output_path, "w") as tf:
-        for file_path in files:
-            arcname = os.path.relpath(file_path, base_dir)
-            tf.add(file_path, arcname=arcname)
+def _import_params(
+    project: str,
+    subject: str,
+    session_label: str,
+    *,
+    import_handler: str,
+    ignore_unparsable: bool,
+    overwrite: str,
+    direct_archive: bool,
+    overwrite_files: bool,
+    quarantine: bool,
+    trigger_pipelines: bool,
+    rename: bool,
+) -> Dict[str, str]:
+    """Build query parameters for the XNAT import service."""
+    return {
+        "import-handler": import_handler,
+        "Ignore-Unparsable": "true" if ignore_unparsable else "false",
+        "project": project,
+        "subject": subject,
+        "session": session_label,
+        "overwrite": overwrite,
+        "overwrite_files": "true" if overwrite_files else "false",
+        "quarantine": "true" if quarantine else "false",
+        "triggerPipelines": "true" if trigger_pipelines else "false",
+        "rename": "true" if rename else "false",
+        "Direct-Archive": "true" if direct_archive else "false",
+        "inbody": "true",
+    }
+
+
+def create_tar_archive(files: List[FileRecord], output_path: Path, base_dir: Path) -> int:
+    """Create a TAR archive from files and return its size in bytes.
+
+    The system tar is used when available, so headers and file copies are
+    handled in native code; tarfile is the fallback, copying file data in
+    1 MiB reads rather than its 16 KiB default.
+    """
+    tar = shutil.which("tar")
+    if tar is not None:
+        names = b"\0".join(os.fsencode(rec.arcname) for rec in files)
+        try:
+            subprocess.run(
+                [
+                    tar,
+                    "-C",
+                    os.fspath(base_dir),
+                    "--null",
+                    "--no-recursion",
+                    "-T",
+                    "-",
+                    "-cf",
+                    os.fspath(output_path),
+                ],
+                input=names,
+                check=True,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
+            )
+            return output_path.stat().st_size
+        except (OSError, subprocess.CalledProcessError) as exc:
+            logging.getLogger(__name__).debug("System tar failed, using tarfile: %s", exc)
+
+    with tarfile.TarFile(output_path, "w", copybufsize=STREAM_CHUNK_SIZE) as tf:
+        for rec in files:
+            _add_tar_member(tf, rec)
     return output_path.stat().st_size
 
 
-def create_zip_archive(files: List[Path], output_path: Path, base_dir: Path) -> int:
-    """Create a ZIP archive from files and return its size in bytes."""
-    with ZipFile(output_path, "w", compression=ZIP_DEFLATED, allowZip64=True) as zf:
-        for file_path in files:
-            arcname = os.path.relpath(file_path, base_dir)
-            zf.write(file_path, arcname)
+def _add_tar_member(tf: tarfile.TarFile, rec: FileRecord) -> None:
+    """Add a regular file using the scan's stat for its header.
+
+    Unlike TarFile.add this makes no further stat call and no user/group
+    name lookups per file.
+    """
+    info = tarfile.TarInfo(rec.arcname.replace(os.sep, "/"))
+    info.mode = stat.S_IMODE(rec.st.st_mode)
+    info.uid = rec.st.st_uid
+    info.gid = rec.st.st_gid
+    info.size = rec.st.st_size
+    info.mtime = int(rec.st.st_mtime)
+    with open(rec.path, "rb") as src:
+        tf.addfile(info, src)
+
+
+def create_zip_archive(files: List[FileRecord], output_path: Path) -> int:
+    """Create a ZIP archive from files and return its size in bytes.
+
+    DICOM with compressed pixel data (JPEG family, RLE) is stored rather
+    than deflated again.
+    """
+    with ZipFile(
+        output_path, "w", compression=ZIP_DEFLATED, compresslevel=ZIP_COMPRESSLEVEL, allowZip64=True
+    ) as zf:
+        _write_zip_entries(zf, files)
     return output_path.stat().st_size
 
 
+def _write_zip_entries(zf: ZipFile, files: List[FileRecord]) -> None:
+    """Add files to zf, deflating only payloads that aren't already compressed."""
+    for rec in files:
+        _write_zip_entry(zf, os.fspath(rec.path), rec.arcname, True, rec.st)
+
+
 def create_archive(
-    files: List[Path],
+    files: List[FileRecord],
     output_path: Path,
     base_dir: Path,
     archive_format: str,
@@ -205,10 +384,137 @@ def create_archive(
     if archive_format == "tar":
         return create_tar_archive(files, output_path, base_dir)
     if archive_format == "zip":
-        return create_zip_archive(files, output_path, base_dir)
+        return create_zip_archive(files, output_path)
     raise ValueError(f"Unsupported archive format: {archive_format}")
 
 
+def write_archive_stream(
+    files: List[FileRecord],
+    fileobj: IO[bytes],
+    archive_format: str,
+) -> None:
+    """Write an archive of files to a non-seekable binary stream."""
+    if archive_format == "tar":
+        with tarfile.open(  # type: ignore[call-overload]
+            fileobj=fileobj,
+            mode="w|",
+            bufsize=STREAM_CHUNK_SIZE,
+            copybufsize=STREAM_CHUNK_SIZE,
+        ) as tf:
+            for rec in files:
+                _add_tar_member(tf, rec)
+    elif archive_format == "zip":
+        with ZipFile(
+            fileobj, "w", compression=ZIP_DEFLATED, compresslevel=ZIP_COMPRESSLEVEL, allowZip64=True
+        ) as zf:
+            _write_zip_entries(zf, files)
+    else:
+        raise ValueError(f"Unsupported archive format: {archive_format}")
+
+
+class ArchiveStream:
+    """Archive built on a background thread and read back in chunks.
+
+    The writer thread streams the archive into one end of an ``os.pipe()``
+    while iteration reads from the other, so the archive never touches disk.
+    Iterating yields ``bytes`` chunks suitable for a chunked HTTP request body.
+    """
+
+    def __init__(
+        self,
+        files: List[FileRecord],
+        archive_format: str,
+        *,
+        chunk_size: int = STREAM_CHUNK_SIZE,
+    ) -> None:
+        if archive_format not in ("tar", "zip"):
+            raise ValueError(f"Unsupported archive format: {archive_format}")
+        self.files = files
+        self.archive_format = archive_format
+        self.chunk_size = chunk_size
+        self.bytes_sent = 0
+        self._error: Optional[BaseException] = None
+
+    def _write(self, fd: int) -> None:
+        try:
+            with os.fdopen(fd, "wb") as out:
+                write_archive_stream(self.files, out, self.archive_format)
+        except BaseException as exc:  # re-raised on the reading side
+            self._error = exc
+
+    def __iter__(self) -> Iterator[bytes]:
+        read_fd, write_fd = os.pipe()
+        writer = threading.Thread(target=self._write, args=(write_fd,), daemon=True)
+        writer.start()
+        try:
+            with os.fdopen(read_fd, "rb") as src:
+                while True:
+                    chunk = src.read(self.chunk_size)
+                    if not chunk:
+                        break
+                    self.bytes_sent += len(chunk)
+                    yield chunk
+        finally:
+            # Closing the read end unblocks a writer abandoned mid-archive.
+            writer.join()
+        if self._error is not None:
+            raise self._error
+
+
+class _WorkerSessions:
+    """One authenticated XNATSession per upload thread, reused across batches.
+
+    Sessions are opened on a thread's first upload and all closed together
+    by ``close()``.
+    """
+
+    def __init__(
+        self,
+        server: str,
+        username: str,
+        password: str,
+        *,
+        verify_tls: bool,
+        timeout: int,
+    ) -> None:
+        self.server = server
+        self.username = username
+        self.password = password
+        self.verify_tls = verify_tls
+        self.timeout = timeout
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._sessions: List[XNATSession] = []
+
+    def get(self) -> XNATSession:
+        conn: Optional[XNATSession] = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = XNATSession(
+                self.server,
+                self.username,
+                self.password,
+                verify_tls=self.verify_tls,
+                timeout=self.timeout,
+            )
+            try:
+                conn.open_session()
+            except Exception:
+                # A failed login must not leave the new session's pool open
+                if conn.session is not None:
+                    conn.session.close()
+                raise
+            with self._lock:
+                self._sessions.append(conn)
+            self._local.conn = conn
+        return conn
+
+    def close(self) -> None:
+        with self._lock:
+            sessions, self._sessions = self._sessions, []
+        for conn in sessions:
+            conn.close_session()
+
+
 def upload_batch(
     *,
     server: str,
@@ -217,7 +523,7 @@ def upload_batch(
     verify_tls: bool,
     timeout: int,
     batch_id: int,
-    archive_path: Path,
+    archive: Union[Path, ArchiveStream],
     file_count: int,
     project: str,
     subject: str,
@@ -226,28 +532,54 @@ def upload_batch(
     ignore_unparsable: bool,
     overwrite: str,
     direct_archive: bool,
+    sessions: Optional[_WorkerSessions] = None,
 ) -> UploadResult:
-    archive_size = archive_path.stat().st_size
+    archive_size = 0 if isinstance(archive, ArchiveStream) else archive.stat().st_size
     start_time = time.time()
 
-    try:
-        with XNATSession(
-            server,
-            username,
-            password,
-            verify_tls=verify_tls,
-            timeout=timeout,
-        ) as conn:
-            success, error = conn.upload_archive(
+    def send(conn: XNATSession) -> Tuple[bool, str]:
+        if isinstance(archive, ArchiveStream):
+            return conn.upload_stream(
                 project,
                 subject,
                 session,
-                archive_path,
+                archive,
+                archive_format=archive.archive_format,
                 import_handler=import_handler,
                 ignore_unparsable=ignore_unparsable,
                 overwrite=overwrite,
                 direct_archive=direct_archive,
             )
+        return conn.upload_archive(
+            project,
+            subject,
+            session,
+            archive,
+            import_handler=import_handler,
+            ignore_unparsable=ignore_unparsable,
+            overwrite=overwrite,
+            direct_archive=direct_archive,
+        )
+
+    try:
+        if sessions is not None:
+            success, error = send(sessions.get())
+        else:
+            with XNATSession(
+                server,
+                username,
+                password,
+                verify_tls=verify_tls,
+                timeout=timeout,
+            ) as conn:
+                success, error = send(conn)
+
+        if isinstance(archive, ArchiveStream):
+            archive_size = archive.bytes_sent
+        elif success:
+            # Free staging space now; failed archives stay until the
+            # caller removes its temporary directory.
+            archive.unlink(missing_ok=True)
 
         duration = time.time() - start_time
         return UploadResult(
@@ -270,6 +602,26 @@ def upload_batch(
         )
 
 
+def _archive_executor(archive_format: str, max_workers: int) -> Executor:
+    """Return the executor used to build batch archives.
+
+    Tar archives are normally written by the system ``tar`` and zip archives
+    spend most of their time in ``zlib``; both run outside the GIL, so threads
+    suffice. Processes are only used for the pure-Python ``tarfile`` fallback
+    when no ``tar`` binary is installed. Like the C-STORE workers, they are
+    started with forkserver where available rather than forked from a
+    process already running logging and executor threads.
+    """
+    if archive_format == "tar" and max_workers > 1 and shutil.which("tar") is None:
+        method = (
+            "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+        )
+        return ProcessPoolExecutor(
+            max_workers=max_workers, mp_context=multiprocessing.get_context(method)
+        )
+    return ThreadPoolExecutor(max_workers=max_workers)
+
+
 def upload_dicom_parallel_rest(
     *,
     server: str,
@@ -289,10 +641,16 @@ def upload_dicom_parallel_rest(
     overwrite: str = DEFAULT_OVERWRITE,
     direct_archive: bool = True,
     timeout: int = DEFAULT_TIMEOUT,
+    stream_archives: bool = False,
     progress_callback: Optional[Callable[[UploadProgress], None]] = None,
     logger: Optional[logging.Logger] = None,
 ) -> UploadSummary:
-    """Upload a DICOM session using parallel archives via the REST import service."""
+    """Upload a DICOM session using parallel archives via the REST import service.
+
+    With ``stream_archives=True`` each batch archive is written into a pipe
+    and uploaded as it is produced instead of being staged in a temporary
+    directory first.
+    """
     log = logger or logging.getLogger(__name__)
     total_start = time.time()
     errors: List[str] = []
@@ -302,7 +660,7 @@ def upload_dicom_parallel_rest(
             progress_callback(progress)
 
     try:
-        files = collect_dicom_files(source_dir)
+        records = collect_dicom_records(source_dir)
     except Exception as exc:
         return UploadSummary(
             success=False,
@@ -314,7 +672,7 @@ def upload_dicom_parallel_rest(
             errors=[f"Failed to scan directory: {exc}"],
         )
 
-    if not files:
+    if not records:
         return UploadSummary(
             success=False,
             total_files=0,
@@ -325,86 +683,44 @@ def upload_dicom_parallel_rest(
             errors=["No DICOM files found"],
         )
 
-    batches = split_into_batches(files, num_batches)
+    batches = split_into_batches(records, num_batches, [rec.size for rec in records])
     report(
         UploadProgress(
             phase="archiving",
-            message=f"Split {len(files)} files into {len(batches)} batches",
+            message=f"Split {len(records)} files into {len(batches)} batches",
         )
     )
 
     ext = ".tar" if archive_format == "tar" else ".zip"
     temp_dir = Path(tempfile.mkdtemp(prefix="xnatio_parallel_"))
-    archive_paths: List[Path] = []
     total_archive_size = 0
+    source_path = Path(os.path.realpath(source_dir.expanduser()))
+    results: List[UploadResult] = []
+    upload_workers = max(1, upload_workers)
+    worker_count = min(upload_workers, len(batches))
+    # Each upload thread authenticates once and reuses its session and
+    # keep-alive connection for every batch it sends.
+    sessions = _WorkerSessions(server, username, password, verify_tls=verify_tls, timeout=timeout)
 
     try:
-        for i in range(len(batches)):
-            archive_paths.append(temp_dir / f"batch_{i + 1}{ext}")
-
-        report(
-            UploadProgress(
-                phase="archiving",
-                total=len(batches),
-                message="Creating archives...",
-            )
-        )
-
-        archive_workers = max(1, archive_workers)
-        create_workers = min(archive_workers, len(batches))
-        source_path = source_dir.expanduser().resolve()
-
-        with ThreadPoolExecutor(max_workers=create_workers) as executor:
-            archive_futures = {}
-            for i, batch in enumerate(batches):
-                future = executor.submit(
-                    create_archive,
-                    batch,
-                    archive_paths[i],
-                    source_path,
-                    archive_format,
-                )
-                archive_futures[future] = i
-
-            completed = 0
-            for future in as_completed(archive_futures):
-                completed += 1
-                size = future.result()
-                total_archive_size += size
-                report(
-                    UploadProgress(
-                        phase="archiving",
-                        current=completed,
-                        total=len(batches),
-                        message=f"Created archive {completed}/{len(batches)}",
-                    )
-                )
-
-        report(
-            UploadProgress(
-                phase="uploading",
-                total=len(batches),
-                message="Starting upload...",
-            )
-        )
-
-        results: List[UploadResult] = []
-        upload_workers = max(1, upload_workers)
-        worker_count = min(upload_workers, len(batches))
-
-        with ThreadPoolExecutor(max_workers=worker_count) as executor:
-            futures = {}
-            for i, (batch, archive_path) in enumerate(zip(batches, archive_paths)):
-                future = executor.submit(
+        # Archives are handed to the upload pool as soon as each one is
+        # written, so archiving and uploading overlap instead of running as
+        # two separate phases.
+        with ExitStack() as stack:
+            stack.callback(sessions.close)
+            upload_pool = stack.enter_context(ThreadPoolExecutor(max_workers=worker_count))
+
+            def submit_upload(index: int, archive: Union[Path, ArchiveStream]) -> Future:
+                return upload_pool.submit(
                     upload_batch,  # type: ignore[arg-type]
                     server=server,
                     username=username,
                     password=password,
                     verify_tls=verify_tls,
                     timeout=timeout,
-                    batch_id=i + 1,
-                    archive_path=archive_path,
-                    file_count=len(batch),
+                    batch_id=index + 1,
+                    archive=archive,
+                    file_count=len(batches[index]),
                     project=project,
                     subject=subject,
                     session=session,
@@ -412,28 +728,89 @@ def upload_dicom_parallel_rest(
                     ignore_unparsable=ignore_unparsable,
                     overwrite=overwrite,
                     direct_archive=direct_archive,
+                    sessions=sessions,
                 )
-                futures[future] = i + 1
-
-            for future in as_completed(futures):
-                result: UploadResult = future.result()  # type: ignore[assignment]
-                results.append(result)
 
-                if not result.success:
-                    errors.append(f"Batch {result.batch_id}: {result.error}")
+            pending: Set[Future] = set()
+            archive_futures: Dict[Future, int] = {}
 
-                succeeded = sum(1 for r in results if r.success)
+            if stream_archives:
+                for i, batch in enumerate(batches):
+                    pending.add(submit_upload(i, ArchiveStream(batch, archive_format)))
+            else:
                 report(
                     UploadProgress(
-                        phase="uploading",
-                        current=len(results),
+                        phase="archiving",
                         total=len(batches),
-                        batch_id=result.batch_id,
-                        success=result.success,
-                        message=(f"Uploaded {len(results)}/{len(batches)} ({succeeded} succeeded)"),
+                        message="Creating archives...",
                     )
                 )
 
+                archive_workers = max(1, archive_workers)
+                create_workers = min(archive_workers, len(batches))
+                archive_pool = stack.enter_context(
+                    _archive_executor(archive_format, create_workers)
+                )
+                for i, batch in enumerate(batches):
+                    future = archive_pool.submit(
+                        create_archive,
+                        batch,
+                        temp_dir / f"batch_{i + 1}{ext}",
+                        source_path,
+                        archive_format,
+                    )
+                    archive_futures[future] = i
+                pending.update(archive_futures)
+
+            report(
+                UploadProgress(
+                    phase="uploading",
+                    total=len(batches),
+                    message="Starting upload...",
+                )
+            )
+
+            archived = 0
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    index = archive_futures.pop(future, None)
+                    if index is not None:
+                        archived += 1
+                        total_archive_size += future.result()
+                        report(
+                            UploadProgress(
+                                phase="archiving",
+                                current=archived,
+                                total=len(batches),
+                                message=f"Created archive {archived}/{len(batches)}",
+                            )
+                        )
+                        pending.add(submit_upload(index, temp_dir / f"batch_{index + 1}{ext}"))
+                        continue
+
+                    result: UploadResult = future.result()  # type: ignore[assignment]
+                    results.append(result)
+                    if stream_archives:
+                        total_archive_size += result.archive_size
+
+                    if not result.success:
+                        errors.append(f"Batch {result.batch_id}: {result.error}")
+
+                    succeeded = sum(1 for r in results if r.success)
+                    report(
+                        UploadProgress(
+                            phase="uploading",
+                            current=len(results),
+                            total=len(batches),
+                            batch_id=result.batch_id,
+                            success=result.success,
+                            message=(
+                                f"Uploaded {len(results)}/{len(batches)} ({succeeded} succeeded)"
+                            ),
+                        )
+                    )
+
         total_duration = time.time() - total_start
         batches_succeeded = sum(1 for r in results if r.success)
         batches_failed = len(results) - batches_succeeded
@@ -459,7 +836,7 @@ def upload_dicom_parallel_rest(
 
         return UploadSummary(
             success=success,
-            total_files=len(files),
+            total_files=len(records),
             total_size_mb=total_archive_size / 1024 / 1024,
             duration=total_duration,
             batches_succeeded=batches_succeeded,
@@ -467,4 +844,5 @@ def upload_dicom_parallel_rest(
             errors=errors,
         )
     finally:
+        # Uploaded archives are already gone; this removes failed ones.
         shutil.rmtree(temp_dir, ignore_errors=True)